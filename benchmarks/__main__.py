@@ -0,0 +1,43 @@
+import argparse
+import json
+import platform
+import sys
+
+from .cases import register_all
+from .runner import BENCHMARKS, compare, run
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Offline espn_api benchmarks over recorded hockey fixtures and synthetic leagues')
+    parser.add_argument('-k', '--filter', default='', help='only run benchmarks whose name contains this')
+    parser.add_argument('-r', '--repeat', type=int, default=5)
+    parser.add_argument('-o', '--output', help='write results as json to this file')
+    parser.add_argument('-c', '--compare', help='baseline results json, exits 1 on regressions')
+    parser.add_argument('-t', '--threshold', type=float, default=1.5, help='allowed slowdown over the baseline')
+    parser.add_argument('--report-only', action='store_true', help='print regressions without failing')
+    args = parser.parse_args(argv)
+
+    register_all()
+    benchmarks = [benchmark for benchmark in BENCHMARKS if args.filter in benchmark.name]
+    results = run(benchmarks, repeat=args.repeat, log=print)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'python': platform.python_version(), 'results': results}, f, indent=2)
+
+    if args.compare:
+        try:
+            with open(args.compare) as f:
+                baseline = json.load(f)['results']
+        except FileNotFoundError:
+            print(f'No baseline at {args.compare}, skipping comparison')
+            return 0
+        regressions = compare(results, baseline, threshold=args.threshold)
+        for regression in regressions:
+            print(f'REGRESSION {regression}')
+        return 1 if regressions and not args.report_only else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
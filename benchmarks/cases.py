@@ -0,0 +1,44 @@
+import functools
+import importlib
+
+from espn_api.hockey import League as HockeyLeague
+
+from .fixtures import HOCKEY_FIXTURES, FixtureReplay, load_fixtures, scale_league
+from .runner import register
+from .synthetic import PayloadGenerator, SPORT_PROFILES
+
+LEAGUE_ID = 1
+YEAR = 2020
+# League methods measured for every sport that has them
+LEAGUE_METHODS = {
+    'box_scores': lambda league: league.box_scores(),
+    'free_agents': lambda league: league.free_agents(),
+    'recent_activity': lambda league: league.recent_activity(),
+    'scoreboard': lambda league: league.scoreboard(),
+    'standings_weekly': lambda league: league.standings_weekly(league.current_week),
+    'power_rankings': lambda league: league.power_rankings(),
+}
+
+
+def register_league(sport: str, League, payloads: dict, label: str, year: int = YEAR) -> None:
+    '''Registers League construction and every League method benchmark for one set of payloads'''
+    replay = functools.partial(FixtureReplay, payloads)
+    build = functools.partial(League, LEAGUE_ID, year)
+    register(f'{sport}.league[{label}]', lambda state: build(), replay=replay)
+    for (method, fn) in LEAGUE_METHODS.items():
+        if hasattr(League, method):
+            register(f'{sport}.{method}[{label}]', fn, setup=build, replay=replay)
+
+
+def register_all() -> None:
+    hockey = load_fixtures(HOCKEY_FIXTURES)
+    register_league('hockey', HockeyLeague, hockey, 'fixtures')
+    register_league('hockey', HockeyLeague, scale_league(hockey, teams=20, roster_size=30), '20x30')
+
+    # sports without recorded fixtures run against generated leagues, this includes football
+    # since the league_2018_data.json its unit tests load isn't in the tree
+    for (sport, profile) in SPORT_PROFILES.items():
+        League = importlib.import_module(f"espn_api.{profile['package']}").League
+        register_league(profile['package'], League, PayloadGenerator(sport, league_id=LEAGUE_ID).payloads(), 'synthetic', year=2024)
+        register_league(profile['package'], League, PayloadGenerator(sport, league_id=LEAGUE_ID, teams=20, roster_size=30).payloads(),
+                        'synthetic-20x30', year=2024)
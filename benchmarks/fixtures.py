@@ -0,0 +1,119 @@
+import copy
+import json
+import os
+from urllib.parse import urlparse, parse_qs
+
+import requests_mock
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tests')
+
+# recorded payloads by the ESPN view that returns them
+HOCKEY_FIXTURES = {
+    'mTeam': 'hockey/unit/data/league_data.json',
+    'players_wl': 'hockey/unit/data/player_data.json',
+    'proTeamSchedules_wl': 'hockey/unit/data/pro_schedule.json',
+    'kona_player_info': 'hockey/unit/data/free_agent_data.json',
+    'kona_league_communication': 'hockey/unit/data/recent_activity_data.json',
+    'mMatchupScore': 'hockey/unit/data/box_score_data.json',
+    'mMatchup': 'hockey/unit/data/matchup_data.json',
+}
+
+
+def load_fixtures(fixtures: dict) -> dict:
+    payloads = {}
+    for (view, path) in fixtures.items():
+        with open(os.path.join(DATA_DIR, path)) as f:
+            payloads[view] = json.loads(f.read())
+    # the draft is part of the league payload
+    payloads.setdefault('mDraftDetail', {'draftDetail': payloads['mTeam'].get('draftDetail', {})})
+    return payloads
+
+
+def _scale_entries(entries: list, size: int) -> list:
+    '''Repeats roster entries with new player ids until there are size of them'''
+    scaled = list(entries[:size])
+    for i in range(len(scaled), size):
+        entry = copy.deepcopy(entries[i % len(entries)])
+        player_id = entry.get('playerId', 0) + 10000000 * (i // len(entries))
+        entry['playerId'] = player_id
+        if 'playerPoolEntry' in entry:
+            entry['playerPoolEntry']['id'] = player_id
+            entry['playerPoolEntry']['player']['id'] = player_id
+        scaled.append(entry)
+    return scaled
+
+
+def _scale_schedule(schedule: list, teams: int, roster_size: int = None) -> list:
+    '''Round robin schedule for teams, each matchup copied from a matchup of the same period'''
+    periods = {}
+    for matchup in schedule:
+        if 'away' in matchup:
+            periods.setdefault(matchup['matchupPeriodId'], []).append(matchup)
+
+    scaled = []
+    team_ids = list(range(1, teams + 1))
+    for (index, period) in enumerate(sorted(periods)):
+        # circle method, the first team stays put and the rest rotate each period
+        rotation = index % (teams - 1)
+        rotated = [team_ids[0]] + team_ids[1:][rotation:] + team_ids[1:][:rotation]
+        for i in range(teams // 2):
+            matchup = copy.deepcopy(periods[period][i % len(periods[period])])
+            matchup['id'] = len(scaled) + 1
+            matchup['home']['teamId'] = rotated[i]
+            matchup['away']['teamId'] = rotated[teams - 1 - i]
+            for side in ('home', 'away'):
+                roster = matchup[side].get('rosterForCurrentScoringPeriod')
+                if roster_size and roster:
+                    roster['entries'] = _scale_entries(roster['entries'], roster_size)
+            scaled.append(matchup)
+    return scaled
+
+
+def scale_league(payloads: dict, teams: int = 20, roster_size: int = 30) -> dict:
+    '''Copies recorded payloads up to a league of teams teams with roster_size players each'''
+    payloads = copy.deepcopy(payloads)
+    league = payloads['mTeam']
+    base_teams = league['teams']
+    league['teams'] = []
+    for i in range(teams):
+        team = copy.deepcopy(base_teams[i % len(base_teams)])
+        team['id'] = i + 1
+        if i >= len(base_teams):
+            owner = '{BENCHMARK-OWNER-%d}' % (i + 1)
+            (team['owners'], team['primaryOwner']) = ([owner], owner)
+            league['members'].append({'id': owner, 'displayName': f'owner{i + 1}', 'firstName': 'Bench', 'lastName': f'Owner{i + 1}'})
+        team['roster']['entries'] = _scale_entries(team['roster']['entries'], roster_size)
+        league['teams'].append(team)
+    league['settings']['size'] = teams
+    league['schedule'] = _scale_schedule(league['schedule'], teams)
+
+    for view in ('mMatchupScore', 'mMatchup'):
+        if view in payloads:
+            payloads[view]['schedule'] = _scale_schedule(payloads[view]['schedule'], teams, roster_size)
+            payloads[view]['teams'] = copy.deepcopy(league['teams'])
+    return payloads
+
+
+class FixtureReplay(object):
+    '''Answers every ESPN request with the payload recorded for its view.
+    Payloads are encoded once up front so only decoding and model building are measured'''
+    def __init__(self, payloads: dict):
+        self.content = {view: json.dumps(payload).encode() for (view, payload) in payloads.items()}
+        self.mocker = requests_mock.Mocker()
+        self.mocker.get(requests_mock.ANY, content=self._respond)
+
+    def _respond(self, request, context) -> bytes:
+        views = parse_qs(urlparse(request.url).query).get('view', [])
+        for view in views:
+            if view in self.content:
+                return self.content[view]
+        context.status_code = 404
+        return b'{}'
+
+    def __enter__(self):
+        self.mocker.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.mocker.stop()
+        return False
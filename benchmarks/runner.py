@@ -0,0 +1,78 @@
+import gc
+import statistics
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+BENCHMARKS = []
+
+
+class Benchmark(object):
+    '''setup returns the state passed to fn, only fn is measured'''
+    def __init__(self, name: str, fn: Callable, setup: Callable = None, replay: Callable = None):
+        self.name = name
+        self.fn = fn
+        self.setup = setup or (lambda: None)
+        # context manager serving the ESPN responses used by setup and fn
+        self.replay = replay
+
+    def __repr__(self):
+        return f'Benchmark({self.name})'
+
+
+def register(name: str, fn: Callable, setup: Callable = None, replay: Callable = None) -> Benchmark:
+    benchmark = Benchmark(name, fn, setup=setup, replay=replay)
+    BENCHMARKS.append(benchmark)
+    return benchmark
+
+
+def measure(benchmark: Benchmark, repeat: int = 5) -> Dict:
+    '''Returns min, median and mean seconds over repeat runs and the peak memory of one traced run in KiB'''
+    with benchmark.replay():
+        state = benchmark.setup()
+        # warm up imports and caches before timing
+        benchmark.fn(state)
+        times = []
+        for _ in range(repeat):
+            gc.collect()
+            start = time.perf_counter()
+            benchmark.fn(state)
+            times.append(time.perf_counter() - start)
+
+        # traced separately since tracemalloc slows every allocation down
+        gc.collect()
+        tracemalloc.start()
+        try:
+            benchmark.fn(state)
+            (_, peak) = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return {
+        'min': min(times),
+        'median': statistics.median(times),
+        'mean': statistics.mean(times),
+        'peak_kib': peak / 1024,
+        'repeat': repeat,
+    }
+
+
+def run(benchmarks: List[Benchmark], repeat: int = 5, log: Callable[[str], None] = None) -> Dict[str, Dict]:
+    results = {}
+    for benchmark in benchmarks:
+        results[benchmark.name] = measure(benchmark, repeat=repeat)
+        if log:
+            result = results[benchmark.name]
+            log(f"{benchmark.name:<45} median {result['median'] * 1000:9.2f} ms  peak {result['peak_kib']:10.1f} KiB")
+    return results
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float = 1.5) -> List[str]:
+    '''Benchmarks whose median time or peak memory grew by more than threshold times the baseline'''
+    regressions = []
+    for (name, result) in results.items():
+        if name not in baseline:
+            continue
+        for key in ('median', 'peak_kib'):
+            if baseline[name][key] and result[key] > baseline[name][key] * threshold:
+                regressions.append(f'{name} {key}: {baseline[name][key]:.4f} -> {result[key]:.4f}')
+    return regressions
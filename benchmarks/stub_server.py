@@ -0,0 +1,204 @@
+import argparse
+import json
+import os
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+from unittest import mock
+from urllib.parse import urlparse, parse_qs
+
+from espn_api.requests.constant import FANTASY_BASE_ENDPOINT_ENV, NEWS_BASE_ENDPOINT_ENV
+
+from .synthetic import PayloadGenerator, SPORT_BY_GAME
+
+LEAGUE_PATH = re.compile(r'^/apis/v3/games/(?P<game>\w+)/seasons/(?P<year>\d+)/segments/0/leagues/(?P<league_id>\d+)(?P<extend>/.*)?$')
+HISTORY_PATH = re.compile(r'^/apis/v3/games/(?P<game>\w+)/leagueHistory/(?P<league_id>\d+)(?P<extend>/.*)?$')
+SEASON_PATH = re.compile(r'^/apis/v3/games/(?P<game>\w+)/seasons/(?P<year>\d+)(?P<extend>/.*)?$')
+NEWS_PATH = re.compile(r'^/apis/fantasy/v3/games/(?P<game>\w+)/news/players$')
+
+
+class StubServer(object):
+    '''Local HTTP server answering the lm-api-reads URL scheme with synthetic payloads.
+    Every league id and year is a league built by factory(sport, league_id, year), which may return None for a 404.
+    Rendered responses are cached so the server stays cheap under load, latency adds a fixed delay per request'''
+    def __init__(self, factory: Callable[[str, int, int], PayloadGenerator] = None, host: str = '127.0.0.1', port: int = 0, latency: float = 0):
+        self.factory = factory or (lambda sport, league_id, year: PayloadGenerator(sport, league_id=league_id, year=year))
+        self.latency = latency
+        self.generators = {}
+        self.responses = {}
+        self.requests = 0
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self._handler())
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    def __repr__(self):
+        return f'StubServer({self.base_endpoint})'
+
+    @property
+    def url(self) -> str:
+        (host, port) = self.httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    @property
+    def base_endpoint(self) -> str:
+        '''Stand in for FANTASY_BASE_ENDPOINT'''
+        return self.url + '/apis/v3/games/'
+
+    @property
+    def news_endpoint(self) -> str:
+        '''Stand in for NEWS_BASE_ENDPOINT'''
+        return self.url + '/apis/fantasy/v3/games/'
+
+    def start(self) -> 'StubServer':
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+    def patch(self):
+        '''Points every EspnFantasyRequests created inside the context at this server'''
+        return mock.patch.dict(os.environ, {FANTASY_BASE_ENDPOINT_ENV: self.base_endpoint, NEWS_BASE_ENDPOINT_ENV: self.news_endpoint})
+
+    def generator(self, sport: str, league_id: int, year: int) -> PayloadGenerator:
+        key = (sport, league_id, year)
+        with self._lock:
+            if key not in self.generators:
+                self.generators[key] = self.factory(sport, league_id, year)
+            return self.generators[key]
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                (status, body) = server.respond(self.path, self.headers.get('x-fantasy-filter'))
+                if server.latency:
+                    time.sleep(server.latency)
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def respond(self, path: str, fantasy_filter: str = None):
+        '''Returns the status code and encoded body for a request path and x-fantasy-filter header'''
+        with self._lock:
+            self.requests += 1
+            cached = self.responses.get((path, fantasy_filter))
+        if cached:
+            return cached
+        try:
+            payload = self._route(path, json.loads(fantasy_filter) if fantasy_filter else {})
+        except (KeyError, ValueError) as e:
+            return (400, json.dumps({'messages': [str(e)]}).encode())
+        response = (404, b'{}') if payload is None else (200, json.dumps(payload).encode())
+        with self._lock:
+            self.responses[(path, fantasy_filter)] = response
+        return response
+
+    def _route(self, path: str, filters: dict):
+        url = urlparse(path)
+        query = parse_qs(url.query)
+        views = query.get('view', [])
+
+        match = NEWS_PATH.match(url.path)
+        if match:
+            return {'feed': []}
+
+        match = LEAGUE_PATH.match(url.path) or HISTORY_PATH.match(url.path)
+        if match:
+            sport = SPORT_BY_GAME.get(match['game'])
+            year = int(match.groupdict().get('year') or query.get('seasonId', [0])[0])
+            generator = self.generator(sport, int(match['league_id']), year) if sport else None
+            if generator is None:
+                return None
+            payload = self._league_view(generator, views, query, filters)
+            # the league history endpoint wraps the league in a list
+            return [payload] if match.re is HISTORY_PATH else payload
+
+        match = SEASON_PATH.match(url.path)
+        if match:
+            sport = SPORT_BY_GAME.get(match['game'])
+            if sport is None:
+                return None
+            # season wide views are the same for every league
+            generator = self.generator(sport, 0, int(match['year']))
+            if 'players_wl' in views:
+                return generator.pro_players()
+            if 'proTeamSchedules_wl' in views:
+                return generator.pro_schedule()
+        return None
+
+    def _league_view(self, generator: PayloadGenerator, views: list, query: dict, filters: dict):
+        scoring_period = int(query.get('scoringPeriodId', [0])[0]) or None
+        if 'kona_league_messageboard' in views:
+            return {'topicsByType': {}}
+        if 'kona_league_communication' in views:
+            topics = filters.get('topics', {})
+            return generator.activity(size=topics.get('limit'), offset=topics.get('offset', 0))
+        if 'kona_player_info' in views:
+            return generator.free_agents(size=filters.get('players', {}).get('limit'))
+        if 'kona_playercard' in views:
+            return generator.player_card(filters.get('players', {}).get('filterIds', {}).get('value'))
+        if 'mPositionalRatings' in views:
+            return generator.positional_ratings()
+        if 'mDraftDetail' in views:
+            return generator.draft()
+        if 'mTeam' in views:
+            return generator.league()
+        if 'mMatchupScore' in views and 'mScoreboard' in views:
+            periods = filters.get('schedule', {}).get('filterMatchupPeriodIds', {}).get('value')
+            # football sends the matchup period as a string
+            return generator.box_scores(int(periods[0]) if periods else None, scoring_period)
+        if 'mMatchup' in views or 'mMatchupScore' in views:
+            return generator.matchups()
+        return generator.league()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.stub_server', description='Serve synthetic ESPN fantasy payloads')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8900)
+    parser.add_argument('--teams', type=int, default=10)
+    parser.add_argument('--roster-size', type=int)
+    parser.add_argument('--season-length', type=int)
+    parser.add_argument('--activity', type=int, default=50)
+    parser.add_argument('--scoring-type', default='H2H_POINTS')
+    parser.add_argument('--latency', type=float, default=0, help='seconds added to every response')
+    args = parser.parse_args(argv)
+
+    def factory(sport, league_id, year):
+        return PayloadGenerator(sport, league_id=league_id, year=year, teams=args.teams, roster_size=args.roster_size,
+                                season_length=args.season_length, activity=args.activity, scoring_type=args.scoring_type, seed=league_id)
+
+    server = StubServer(factory, host=args.host, port=args.port, latency=args.latency)
+    print(f'Serving synthetic ESPN payloads, point clients at it with\n'
+          f'  {FANTASY_BASE_ENDPOINT_ENV}={server.base_endpoint} {NEWS_BASE_ENDPOINT_ENV}={server.news_endpoint}')
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,481 @@
+import copy
+import random
+from datetime import datetime, timezone
+
+FIRST_NAMES = ['James', 'Michael', 'Chris', 'Josh', 'Justin', 'Tyler', 'Jalen', 'Marcus', 'Derrick', 'Aaron', 'Anthony', 'Kevin',
+               'Brandon', 'Jordan', 'Cameron', 'Devin', 'Patrick', 'Travis', 'Zach', 'Ryan', 'Nick', 'Alex', 'Sam', 'Luka']
+LAST_NAMES = ['Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Miller', 'Davis', 'Wilson', 'Anderson', 'Taylor', 'Thomas',
+              'Moore', 'Jackson', 'Martin', 'Lee', 'Harris', 'Clark', 'Lewis', 'Walker', 'Allen', 'Young', 'King', 'Wright', 'Hill']
+TEAM_NAMES = ['Sharks', 'Comets', 'Hawks', 'Bandits', 'Wolves', 'Titans', 'Rockets', 'Vipers', 'Knights', 'Storm', 'Pirates',
+              'Falcons', 'Giants', 'Rebels', 'Raptors', 'Lions', 'Bulldogs', 'Spartans', 'Mustangs', 'Outlaws']
+# message type ids of kona_league_communication activity
+FA_ADDED = 178
+DROPPED = 179
+WAIVER_ADDED = 180
+TRADED = 244
+
+# defaultPositionId: eligibleSlots of each position, starting lineup slot counts and season shape per sport
+SPORT_PROFILES = {
+    'nfl': {
+        'game': 'ffl', 'package': 'football', 'pool_size': 1500, 'roster_size': 16, 'season_length': 14, 'period_length': 1, 'bench': 20, 'ir': 21,
+        'positions': {1: [0, 7, 20, 21], 2: [2, 3, 23, 7, 20, 21], 3: [4, 3, 5, 23, 7, 20, 21], 4: [6, 5, 23, 7, 20, 21],
+                      5: [17, 20, 21], 16: [16, 20, 21]},
+        'lineup': {0: 1, 2: 2, 4: 2, 6: 1, 23: 1, 16: 1, 17: 1},
+        'score': (100, 25),
+    },
+    'nba': {
+        'game': 'fba', 'package': 'basketball', 'pool_size': 1000, 'roster_size': 13, 'season_length': 20, 'period_length': 7, 'bench': 12, 'ir': 13,
+        'positions': {1: [0, 5, 11, 12, 13], 2: [1, 5, 7, 8, 11, 12, 13], 3: [2, 6, 7, 8, 11, 12, 13], 4: [3, 6, 9, 10, 11, 12, 13],
+                      5: [4, 9, 10, 11, 12, 13]},
+        'lineup': {0: 1, 1: 1, 2: 1, 3: 1, 4: 1, 5: 1, 6: 1, 11: 3},
+        'score': (700, 80),
+    },
+    'nhl': {
+        'game': 'fhl', 'package': 'hockey', 'pool_size': 1000, 'roster_size': 16, 'season_length': 22, 'period_length': 7, 'bench': 7, 'ir': 8,
+        'positions': {1: [0, 3, 6, 7, 8], 2: [1, 3, 6, 7, 8], 3: [2, 3, 6, 7, 8], 4: [4, 6, 7, 8], 5: [5, 7, 8]},
+        'lineup': {0: 2, 1: 2, 2: 2, 4: 4, 5: 2, 6: 1},
+        'score': (300, 40),
+    },
+    'mlb': {
+        'game': 'flb', 'package': 'baseball', 'pool_size': 1500, 'roster_size': 25, 'season_length': 22, 'period_length': 7, 'bench': 16, 'ir': 17,
+        'positions': {1: [0, 12, 16, 17], 2: [1, 7, 19, 12, 16, 17], 3: [2, 6, 19, 12, 16, 17], 4: [3, 7, 19, 12, 16, 17],
+                      5: [4, 6, 19, 12, 16, 17], 6: [5, 8, 9, 10, 12, 16, 17], 15: [14, 13, 16, 17], 16: [15, 13, 16, 17]},
+        'lineup': {0: 1, 1: 1, 2: 1, 3: 1, 4: 1, 5: 3, 12: 1, 14: 5, 15: 3},
+        'score': (250, 40),
+    },
+    'wnba': {
+        'game': 'wfba', 'package': 'wbasketball', 'pool_size': 200, 'roster_size': 10, 'season_length': 15, 'period_length': 7, 'bench': 6, 'ir': 7,
+        'positions': {1: [1, 5, 6, 7], 2: [2, 4, 5, 6, 7], 3: [3, 4, 5, 6, 7]},
+        'lineup': {1: 2, 2: 2, 3: 1, 5: 1},
+        'score': (400, 60),
+    },
+}
+SPORT_BY_GAME = {profile['game']: sport for (sport, profile) in SPORT_PROFILES.items()}
+
+
+def _sport_constants(sport: str):
+    from importlib import import_module
+    return import_module(f"espn_api.{SPORT_PROFILES[sport]['package']}.constant")
+
+
+class PayloadGenerator(object):
+    '''Builds a consistent fake league and renders it as the json ESPN returns for each view.
+    The player pool only depends on sport and year so every league of a season shares it like the real one,
+    rosters, results and activity come from seed so the same arguments always give the same payloads'''
+    def __init__(self, sport: str = 'nfl', league_id: int = 1, year: int = 2024, teams: int = 10, roster_size: int = None,
+                 season_length: int = None, current_period: int = None, activity: int = 50, free_agents: int = 50,
+                 scoring_type: str = 'H2H_POINTS', seed: int = 0):
+        if sport not in SPORT_PROFILES:
+            raise Exception(f'Unknown sport: {sport}, available options are {list(SPORT_PROFILES.keys())}')
+        if teams < 2 or teams % 2:
+            raise Exception('teams must be an even number of at least 2')
+        self.sport = sport
+        self.profile = SPORT_PROFILES[sport]
+        self.league_id = league_id
+        self.year = year
+        self.team_count = teams
+        self.roster_size = roster_size or self.profile['roster_size']
+        self.season_length = season_length or self.profile['season_length']
+        self.period_length = self.profile['period_length']
+        self.current_period = current_period or self.season_length // 2 + 1
+        self.current_scoring_period = (self.current_period - 1) * self.period_length + 1
+        self.activity_count = activity
+        self.free_agent_count = free_agents
+        self.scoring_type = scoring_type
+        self.random = random.Random(seed)
+
+        constants = _sport_constants(sport)
+        stats_map = getattr(constants, 'STATS_MAP', None) or getattr(constants, 'PLAYER_STATS_MAP')
+        self.stat_ids = [str(key) for (key, value) in stats_map.items() if str(key).isdigit() and value][:10]
+        self.pro_team_ids = [key for key in constants.PRO_TEAM_MAP if isinstance(key, int) and key != 0]
+        # start of the season in ms, one scoring period per day or per week for football
+        self.season_start = int(datetime(year, 9, 5, tzinfo=timezone.utc).timestamp() * 1000)
+        self.period_ms = 86400000 * (7 if self.period_length == 1 else 1)
+
+        self._build_players()
+        self._build_teams()
+        self._build_schedule()
+        self._build_activity()
+
+    def __repr__(self):
+        return f'PayloadGenerator({self.sport}, {self.league_id}, {self.year}, teams={self.team_count})'
+
+    @property
+    def final_scoring_period(self) -> int:
+        return self.season_length * self.period_length
+
+    def _build_players(self) -> None:
+        # every player takes the same number of draws so a bigger pool starts with the same players
+        rng = random.Random(f'{self.sport}-{self.year}')
+        pool_size = max(self.profile['pool_size'], self.team_count * self.roster_size + self.free_agent_count)
+        positions = list(self.profile['positions'])
+        self.players = []
+        for i in range(pool_size):
+            (first, last) = (rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES))
+            position = positions[i % len(positions)]
+            self.players.append({
+                'id': 1000 + i,
+                'fullName': f'{first} {last}',
+                'firstName': first,
+                'lastName': last,
+                'defaultPositionId': position,
+                'eligibleSlots': self.profile['positions'][position],
+                'proTeamId': rng.choice(self.pro_team_ids),
+                'injured': False,
+                'injuryStatus': 'ACTIVE',
+                'active': True,
+                'droppable': True,
+                'universeId': 1,
+                # rough talent level used to draw every stat line
+                'quality': rng.uniform(0.5, 1.5),
+            })
+
+    def _build_teams(self) -> None:
+        self.teams = []
+        self.members = []
+        pool = list(self.players)
+        self.random.shuffle(pool)
+        rostered = pool[:self.team_count * self.roster_size]
+        for i in range(self.team_count):
+            owner = '{%08X-0000-4000-8000-%012X}' % (self.league_id, i + 1)
+            name = TEAM_NAMES[i % len(TEAM_NAMES)]
+            self.members.append({'id': owner, 'displayName': f'owner{i + 1}', 'firstName': 'Owner', 'lastName': str(i + 1)})
+            self.teams.append({
+                'id': i + 1,
+                'abbrev': name[:3].upper() + (str(i // len(TEAM_NAMES)) if i >= len(TEAM_NAMES) else ''),
+                'location': 'Team',
+                'nickname': name,
+                'name': f'Team {name}',
+                'divisionId': i % 2,
+                'owners': [owner],
+                'primaryOwner': owner,
+                'logo': f'https://example.com/logos/{i + 1}.png',
+                'players': rostered[i::self.team_count],
+                'wins': 0, 'losses': 0, 'ties': 0, 'points_for': 0, 'points_against': 0,
+            })
+        self.free_agent_pool = sorted(pool[self.team_count * self.roster_size:], key=lambda player: player['quality'], reverse=True)
+
+    def _build_schedule(self) -> None:
+        '''Round robin regular season, periods before the current one are decided'''
+        (mean, deviation) = self.profile['score']
+        team_ids = [team['id'] for team in self.teams]
+        teams = {team['id']: team for team in self.teams}
+        self.schedule = []
+        for period in range(1, self.season_length + 1):
+            # circle method, the first team stays put and the rest rotate each period
+            rotation = (period - 1) % (self.team_count - 1)
+            rotated = [team_ids[0]] + team_ids[1:][rotation:] + team_ids[1:][:rotation]
+            for i in range(self.team_count // 2):
+                (home, away) = (rotated[i], rotated[self.team_count - 1 - i])
+                matchup = {'id': len(self.schedule) + 1, 'matchupPeriodId': period, 'playoffTierType': 'NONE', 'winner': 'UNDECIDED'}
+                for (side, team_id) in (('home', home), ('away', away)):
+                    matchup[side] = {'teamId': team_id, 'totalPoints': 0.0, 'pointsByScoringPeriod': {}}
+                if period <= self.current_period:
+                    scoring_periods = self._scoring_periods(period)
+                    if period == self.current_period:
+                        scoring_periods = [sp for sp in scoring_periods if sp <= self.current_scoring_period]
+                    for side in ('home', 'away'):
+                        for scoring_period in scoring_periods:
+                            points = round(max(self.random.gauss(mean, deviation), 0) / self.period_length, 2)
+                            matchup[side]['pointsByScoringPeriod'][str(scoring_period)] = points
+                        matchup[side]['totalPoints'] = round(sum(matchup[side]['pointsByScoringPeriod'].values()), 2)
+                if period < self.current_period:
+                    (home_points, away_points) = (matchup['home']['totalPoints'], matchup['away']['totalPoints'])
+                    matchup['winner'] = 'HOME' if home_points > away_points else 'AWAY' if away_points > home_points else 'TIE'
+                    self._record_result(teams[home], home_points, away_points)
+                    self._record_result(teams[away], away_points, home_points)
+                self._add_cumulative_score(matchup)
+                self.schedule.append(matchup)
+
+        ranked = sorted(self.teams, key=lambda team: (team['wins'], team['points_for']), reverse=True)
+        for (seed, team) in enumerate(ranked):
+            team['seed'] = seed + 1
+
+    def _scoring_periods(self, period: int) -> list:
+        return list(range((period - 1) * self.period_length + 1, period * self.period_length + 1))
+
+    def _record_result(self, team: dict, points_for: float, points_against: float) -> None:
+        team['points_for'] += points_for
+        team['points_against'] += points_against
+        if points_for > points_against:
+            team['wins'] += 1
+        elif points_for < points_against:
+            team['losses'] += 1
+        else:
+            team['ties'] += 1
+
+    def _add_cumulative_score(self, matchup: dict) -> None:
+        '''Category leagues compare every stat, points leagues leave scoreByStat empty'''
+        score_by_stat = ({}, {})
+        (wins, losses) = (0, 0)
+        if self.scoring_type != 'H2H_POINTS' and matchup['matchupPeriodId'] <= self.current_period:
+            for stat_id in self.stat_ids:
+                (home, away) = (round(self.random.uniform(0, 50), 1), round(self.random.uniform(0, 50), 1))
+                (home_result, away_result) = ('WIN', 'LOSS') if home > away else ('LOSS', 'WIN') if away > home else ('TIE', 'TIE')
+                score_by_stat[0][stat_id] = {'score': home, 'result': home_result, 'rank': 0.0, 'ineligible': False}
+                score_by_stat[1][stat_id] = {'score': away, 'result': away_result, 'rank': 0.0, 'ineligible': False}
+                wins += home_result == 'WIN'
+                losses += home_result == 'LOSS'
+        ties = len(score_by_stat[0]) - wins - losses
+        matchup['home']['cumulativeScore'] = {'wins': wins, 'losses': losses, 'ties': ties, 'scoreByStat': score_by_stat[0]}
+        matchup['away']['cumulativeScore'] = {'wins': losses, 'losses': wins, 'ties': ties, 'scoreByStat': score_by_stat[1]}
+
+    def _build_activity(self) -> None:
+        '''Adds, drops and trades, newest first, every added player ends up on the team that added them'''
+        self.topics = []
+        date = self.season_start + (self.current_scoring_period - 1) * self.period_ms
+        for i in range(self.activity_count):
+            team = self.teams[i % self.team_count]
+            player = self.random.choice(team['players'])
+            if i % 10 == 9:
+                other = self.teams[(i + 1) % self.team_count]
+                messages = [{'messageTypeId': TRADED, 'from': team['id'], 'to': other['id'], 'targetId': player['id']},
+                            {'messageTypeId': TRADED, 'from': other['id'], 'to': team['id'], 'targetId': self.random.choice(other['players'])['id']}]
+            else:
+                added = (FA_ADDED, 0) if i % 3 else (WAIVER_ADDED, self.random.randint(1, 20))
+                dropped = self.random.choice(self.free_agent_pool)
+                messages = [{'messageTypeId': added[0], 'from': added[1], 'to': team['id'], 'targetId': player['id']},
+                            {'messageTypeId': DROPPED, 'from': team['id'], 'to': team['id'], 'targetId': dropped['id']}]
+            date -= self.random.randint(60000, 6 * 3600000)
+            self.topics.append({
+                'id': f'topic-{i}',
+                'date': date,
+                'type': 'ACTIVITY_TRANSACTIONS',
+                'messages': [dict(message, id=f'message-{i}-{j}', date=date) for (j, message) in enumerate(messages)],
+                'totalMessageCount': len(messages),
+            })
+
+    def _stats(self, player: dict, scoring_periods: list, season: bool = True) -> list:
+        '''Projected and actual line for each scoring period plus the season total and projection'''
+        (mean, _) = self.profile['score']
+        per_game = mean / max(len(self.profile['lineup']), 1) / self.period_length * player['quality']
+        splits = []
+        for scoring_period in scoring_periods:
+            # actual last, some sports keep the last line they see as the players points
+            for source in (1, 0):
+                points = round(max(self.random.gauss(per_game, per_game / 3), 0), 2)
+                breakdown = {stat_id: round(self.random.uniform(0, 5), 1) for stat_id in self.stat_ids}
+                splits.append({'id': f'05{self.year}', 'seasonId': self.year, 'scoringPeriodId': scoring_period, 'statSourceId': source,
+                               'statSplitTypeId': 5, 'appliedTotal': points, 'appliedStats': breakdown, 'stats': breakdown})
+        games = max(self.current_scoring_period - 1, 1)
+        for (split_id, source) in ((('00', 0), ('10', 1)) if season else ()):
+            total = round(per_game * games * (1 if source == 0 else 1.1), 2)
+            splits.append({'id': f'{split_id}{self.year}', 'seasonId': self.year, 'scoringPeriodId': 0, 'statSourceId': source,
+                           'statSplitTypeId': 0, 'appliedTotal': total, 'appliedAverage': round(total / games, 2),
+                           'stats': {stat_id: round(self.random.uniform(0, 5) * games, 1) for stat_id in self.stat_ids},
+                           'averageStats': {stat_id: round(self.random.uniform(0, 5), 2) for stat_id in self.stat_ids}})
+        return splits
+
+    def _player(self, player: dict, scoring_periods: list = (), season: bool = True) -> dict:
+        # scalar fields come before stats so json_parsing finds the players own values first
+        data = {key: value for (key, value) in player.items() if key != 'quality'}
+        data['ownership'] = {'percentOwned': round(min(player['quality'] * 60, 100), 2), 'percentStarted': round(min(player['quality'] * 45, 100), 2),
+                             'averageDraftPosition': round(200 / player['quality'], 1), 'auctionValueAverage': round(player['quality'] * 10, 1)}
+        data['stats'] = self._stats(player, scoring_periods, season)
+        return data
+
+    def _pool_entry(self, player: dict, on_team_id: int, scoring_periods: list = (), season: bool = True) -> dict:
+        return {
+            'id': player['id'],
+            'onTeamId': on_team_id,
+            'status': 'ONTEAM' if on_team_id else 'FREEAGENT',
+            'keeperValue': 1,
+            'lineupLocked': False,
+            'rosterLocked': False,
+            'tradeLocked': False,
+            'player': self._player(player, scoring_periods, season),
+            'ratings': {'0': {'positionalRanking': player['id'] % 50 + 1, 'totalRanking': player['id'] % 300 + 1, 'totalRating': round(player['quality'] * 5, 2)}},
+        }
+
+    def _roster(self, team: dict, scoring_periods: list = (), season: bool = True) -> dict:
+        '''Fills the starting lineup slots in roster order, everyone else is on the bench'''
+        open_slots = dict(self.profile['lineup'])
+        entries = []
+        for player in team['players']:
+            slot = next((slot for slot in player['eligibleSlots'] if open_slots.get(slot)), self.profile['bench'])
+            if slot in open_slots:
+                open_slots[slot] -= 1
+            entries.append({
+                'playerId': player['id'],
+                'lineupSlotId': slot,
+                'acquisitionType': 'DRAFT',
+                'acquisitionDate': self.season_start,
+                'injuryStatus': 'NORMAL',
+                'status': 'NORMAL',
+                'pendingTransactionIds': None,
+                'playerPoolEntry': self._pool_entry(player, team['id'], scoring_periods, season),
+            })
+        applied = sum(split['appliedTotal'] for entry in entries for split in entry['playerPoolEntry']['player']['stats']
+                      if split['statSplitTypeId'] == 5 and split['statSourceId'] == 0)
+        return {'entries': entries, 'appliedStatTotal': round(applied, 2)}
+
+    def _team(self, team: dict) -> dict:
+        record = {'wins': team['wins'], 'losses': team['losses'], 'ties': team['ties'], 'pointsFor': round(team['points_for'], 2),
+                  'pointsAgainst': round(team['points_against'], 2), 'streakLength': 1, 'streakType': 'WIN', 'gamesBack': 0.0,
+                  'percentage': round(team['wins'] / max(team['wins'] + team['losses'] + team['ties'], 1), 4)}
+        return {
+            'id': team['id'],
+            'abbrev': team['abbrev'],
+            'location': team['location'],
+            'nickname': team['nickname'],
+            'name': team['name'],
+            'divisionId': team['divisionId'],
+            'owners': team['owners'],
+            'primaryOwner': team['primaryOwner'],
+            'logo': team['logo'],
+            'playoffSeed': team['seed'],
+            'rankCalculatedFinal': 0,
+            'draftDayProjectedRank': team['id'],
+            'waiverRank': self.team_count - team['seed'] + 1,
+            'record': {'overall': record, 'home': dict(record), 'away': dict(record), 'division': dict(record)},
+            'transactionCounter': {'acquisitions': 3, 'drops': 3, 'trades': 1, 'moveToIR': 0, 'acquisitionBudgetSpent': 0},
+            'valuesByStat': {stat_id: round(self.random.uniform(0, 500), 1) for stat_id in self.stat_ids},
+            'currentSimulationResults': {'playoffPct': round(1 - team['seed'] / (self.team_count + 1), 3)},
+            'roster': self._roster(team),
+        }
+
+    def _settings(self) -> dict:
+        matchup_periods = {str(period): self._scoring_periods(period) for period in range(1, self.season_length + 1)}
+        return {
+            'name': f'Synthetic {self.sport.upper()} League {self.league_id}',
+            'size': self.team_count,
+            'isPublic': False,
+            'acquisitionSettings': {'acquisitionBudget': 100, 'isUsingAcquisitionBudget': False, 'acquisitionType': 'WAIVERS_TRADITIONAL'},
+            'draftSettings': {'keeperCount': 0, 'type': 'SNAKE', 'pickOrder': [team['id'] for team in self.teams]},
+            'tradeSettings': {'vetoVotesRequired': self.team_count // 2, 'deadlineDate': self.season_start + self.final_scoring_period * self.period_ms},
+            'rosterSettings': {'lineupSlotCounts': {str(slot): count for (slot, count) in self.profile['lineup'].items()}},
+            'scheduleSettings': {
+                'matchupPeriodCount': self.season_length,
+                'matchupPeriodLength': 1,
+                'matchupPeriods': matchup_periods,
+                'playoffTeamCount': min(4, self.team_count),
+                'playoffMatchupPeriodLength': 1,
+                'playoffSeedingRule': 'TOTAL_POINTS_SCORED',
+                'divisions': [{'id': 0, 'name': 'East', 'size': self.team_count // 2}, {'id': 1, 'name': 'West', 'size': self.team_count // 2}],
+            },
+            'scoringSettings': {
+                'scoringType': self.scoring_type,
+                'matchupTieRule': 'NONE',
+                'playoffMatchupTieRule': 'NONE',
+                'scoringItems': [{'statId': int(stat_id), 'points': 1.0, 'isReverseItem': False} for stat_id in self.stat_ids],
+            },
+        }
+
+    def _status(self) -> dict:
+        return {
+            'currentMatchupPeriod': self.current_period,
+            'firstScoringPeriod': 1,
+            'finalScoringPeriod': self.final_scoring_period,
+            'latestScoringPeriod': self.current_scoring_period,
+            'previousSeasons': [],
+            'isActive': True,
+            'teamsJoined': self.team_count,
+        }
+
+    def _base(self) -> dict:
+        return {'id': self.league_id, 'gameId': 1, 'seasonId': self.year, 'segmentId': 0,
+                'scoringPeriodId': self.current_scoring_period, 'status': self._status()}
+
+    def league(self) -> dict:
+        '''mTeam, mRoster, mMatchup, mSettings and mStandings views'''
+        return dict(self._base(), settings=self._settings(), members=self.members,
+                    teams=[self._team(team) for team in self.teams], schedule=copy.deepcopy(self.schedule))
+
+    def matchups(self) -> dict:
+        '''mMatchup and mMatchupScore views'''
+        return dict(self._base(), schedule=copy.deepcopy(self.schedule))
+
+    def box_scores(self, matchup_period: int = None, scoring_period: int = None) -> dict:
+        '''mMatchupScore and mScoreboard views filtered to one matchup period with rosters for the scoring period'''
+        matchup_period = matchup_period or self.current_period
+        scoring_period = scoring_period or self.current_scoring_period
+        teams = {team['id']: team for team in self.teams}
+        schedule = []
+        for matchup in self.schedule:
+            if matchup['matchupPeriodId'] != matchup_period:
+                continue
+            matchup = copy.deepcopy(matchup)
+            for side in ('home', 'away'):
+                roster = self._roster(teams[matchup[side]['teamId']], [scoring_period], season=False)
+                matchup[side]['rosterForCurrentScoringPeriod'] = roster
+                matchup[side]['rosterForMatchupPeriod'] = roster
+                matchup[side]['totalPointsLive'] = matchup[side]['totalPoints']
+                matchup[side]['totalProjectedPointsLive'] = round(matchup[side]['totalPoints'] * 1.1, 2)
+            schedule.append(matchup)
+        return dict(self._base(), schedule=schedule)
+
+    def draft(self) -> dict:
+        '''mDraftDetail view, a snake draft of every rostered player'''
+        picks = []
+        rounds = max(len(team['players']) for team in self.teams)
+        for round_id in range(1, rounds + 1):
+            order = self.teams if round_id % 2 else list(reversed(self.teams))
+            for (round_pick, team) in enumerate(order):
+                if round_id <= len(team['players']):
+                    picks.append({'id': len(picks) + 1, 'overallPickNumber': len(picks) + 1, 'roundId': round_id,
+                                  'roundPickNumber': round_pick + 1, 'teamId': team['id'], 'playerId': team['players'][round_id - 1]['id'],
+                                  'bidAmount': 0, 'keeper': False, 'nominatingTeamId': 0})
+        return dict(self._base(), draftDetail={'drafted': True, 'inProgress': False, 'picks': picks})
+
+    def pro_players(self) -> list:
+        '''players_wl view'''
+        return [{key: value for (key, value) in player.items() if key != 'quality'} for player in self.players]
+
+    def free_agents(self, size: int = None) -> dict:
+        '''kona_player_info view'''
+        players = self.free_agent_pool[:size or self.free_agent_count]
+        return {'players': [self._pool_entry(player, 0, [self.current_scoring_period]) for player in players]}
+
+    def player_card(self, player_ids: list = None) -> dict:
+        '''kona_playercard view'''
+        on_team = {player['id']: team['id'] for team in self.teams for player in team['players']}
+        players = [player for player in self.players if player_ids is None or player['id'] in player_ids]
+        return {'players': [self._pool_entry(player, on_team.get(player['id'], 0), self._scoring_periods(self.current_period))
+                            for player in players]}
+
+    def activity(self, size: int = None, offset: int = 0) -> dict:
+        '''kona_league_communication view'''
+        return {'topics': self.topics[offset:offset + (size or len(self.topics))]}
+
+    def pro_schedule(self) -> dict:
+        '''proTeamSchedules_wl view, pro teams are paired at random every scoring period'''
+        rng = random.Random(self.year)
+        games = {team_id: {} for team_id in self.pro_team_ids}
+        for scoring_period in range(1, self.final_scoring_period + 1):
+            team_ids = list(self.pro_team_ids)
+            rng.shuffle(team_ids)
+            date = self.season_start + (scoring_period - 1) * self.period_ms + 17 * 3600000
+            for i in range(0, len(team_ids) - 1, 2):
+                game = {'id': scoring_period * 1000 + i, 'date': date, 'scoringPeriodId': scoring_period, 'homeProTeamId': team_ids[i],
+                        'awayProTeamId': team_ids[i + 1], 'statsOfficial': False, 'validForLocking': True}
+                games[team_ids[i]][str(scoring_period)] = [game]
+                games[team_ids[i + 1]][str(scoring_period)] = [game]
+        constants = _sport_constants(self.sport)
+        pro_teams = [{'id': team_id, 'abbrev': str(constants.PRO_TEAM_MAP[team_id]), 'byeWeek': 0, 'proGamesByScoringPeriod': games[team_id]}
+                     for team_id in self.pro_team_ids]
+        return {'settings': {'proTeams': pro_teams}}
+
+    def positional_ratings(self) -> dict:
+        '''mPositionalRatings view, football only'''
+        ratings = {}
+        for position in self.profile['positions']:
+            opponents = list(self.pro_team_ids)
+            self.random.shuffle(opponents)
+            ratings[str(position)] = {'ratingsByOpponent': {str(team_id): {'rank': rank + 1, 'average': 10.0} for (rank, team_id) in enumerate(opponents)}}
+        return {'positionAgainstOpponent': {'positionalRatings': ratings}}
+
+    def payloads(self) -> dict:
+        '''Every view rendered with default arguments, keyed by view name'''
+        return {
+            'mTeam': self.league(),
+            'mDraftDetail': self.draft(),
+            'players_wl': self.pro_players(),
+            'proTeamSchedules_wl': self.pro_schedule(),
+            'kona_player_info': self.free_agents(),
+            'kona_league_communication': self.activity(),
+            'kona_playercard': self.player_card([self.players[0]['id']]),
+            'kona_league_messageboard': {'topicsByType': {}},
+            'mMatchupScore': self.box_scores(),
+            'mMatchup': self.matchups(),
+            'mPositionalRatings': self.positional_ratings(),
+        }
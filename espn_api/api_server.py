@@ -1,11 +1,26 @@
 import os
+import json
+import asyncio
 from fastapi import FastAPI, Query, HTTPException, Path, Header, Depends, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Optional
+from fastapi.responses import StreamingResponse
+from typing import Callable, Optional
 from espn_api.football import League
+from espn_api.football.live_scores import LiveScoreWatcher, PlayerDelta, team_id
+from espn_api.draft_tracker import DraftTracker
+from espn_api.base_league import BaseLeague
+from espn_api.player_pool import PlayerPoolCache
+from espn_api.requests import EspnFantasyRequests, PeriodCache
 from dotenv import load_dotenv
 load_dotenv()
 
+# every request builds a League, share the season's pro players between them
+BaseLeague.player_pools = PlayerPoolCache()
+# finished matchup periods barely change, keep them on disk when a directory is configured
+if os.environ.get("ESPN_PERIOD_CACHE_DIR"):
+    EspnFantasyRequests.period_cache = PeriodCache(os.environ["ESPN_PERIOD_CACHE_DIR"])
+
 app = FastAPI()
 
 # Allow only localhost for CORS (customize for production)
@@ -137,6 +152,19 @@ def get_free_agents(league_id: int, year: int, week: Optional[int] = None, size:
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+# declared before /players/{player_id} so "search" isn't read as a player id
+@app.get("/league/{league_id}/{year}/players/search")
+def search_players(league_id: int, year: int, q: str = Query(..., min_length=1), limit: int = Query(10, ge=1, le=50), api_key: str = Depends(get_api_key), cookies: tuple = Depends(get_espn_cookies)):
+    espn_s2, swid = cookies
+    try:
+        league = League(league_id, year, espn_s2=espn_s2, swid=swid)
+        return [
+            {"playerId": player_id, "name": name, "score": score}
+            for (player_id, name, score) in league.search_players(q, limit=limit)
+        ]
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @app.get("/league/{league_id}/{year}/players/{player_id}")
 def get_player_info_by_id(league_id: int, year: int, player_id: int = Path(...), api_key: str = Depends(get_api_key), cookies: tuple = Depends(get_espn_cookies)):
     espn_s2, swid = cookies
@@ -150,11 +178,11 @@ def get_player_info_by_id(league_id: int, year: int, player_id: int = Path(...),
         raise HTTPException(status_code=400, detail=str(e))
 
 @app.get("/league/{league_id}/{year}/players/by_name/{player_name}")
-def get_player_info_by_name(league_id: int, year: int, player_name: str, api_key: str = Depends(get_api_key), cookies: tuple = Depends(get_espn_cookies)):
+def get_player_info_by_name(league_id: int, year: int, player_name: str, fuzzy: bool = False, api_key: str = Depends(get_api_key), cookies: tuple = Depends(get_espn_cookies)):
     espn_s2, swid = cookies
     try:
         league = League(league_id, year, espn_s2=espn_s2, swid=swid)
-        player = league.player_info(name=player_name)
+        player = league.player_info(name=player_name, fuzzy=fuzzy)
         if not player:
             raise HTTPException(status_code=404, detail="Player not found")
         if isinstance(player, list):
@@ -183,6 +211,97 @@ def get_box_scores(league_id: int, year: int, week: int, api_key: str = Depends(
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@app.get("/league/{league_id}/{year}/positional_ratings/{week}")
+def get_positional_ratings(league_id: int, year: int, week: int, api_key: str = Depends(get_api_key), cookies: tuple = Depends(get_espn_cookies)):
+    espn_s2, swid = cookies
+    try:
+        league = League(league_id, year, espn_s2=espn_s2, swid=swid)
+        return league.positional_ratings(week).heat_map()
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+# --- Live scores and drafts ---
+class LiveHub:
+    """One watcher per key, e.g. a league week and credentials, its events are fanned out to every subscriber.
+    The watcher starts with the first subscriber and is stopped when the last one leaves"""
+    def __init__(self, serialize: Callable):
+        self.serialize = serialize
+        # key -> (task, subscriber queues)
+        self._channels = {}
+
+    def subscribe(self, key: tuple, make_watcher: Callable) -> asyncio.Queue:
+        if key not in self._channels:
+            subscribers = set()
+            task = asyncio.get_running_loop().create_task(self._run(key, make_watcher, subscribers))
+            self._channels[key] = (task, subscribers)
+        queue = asyncio.Queue()
+        self._channels[key][1].add(queue)
+        return queue
+
+    def unsubscribe(self, key: tuple, queue: asyncio.Queue) -> None:
+        channel = self._channels.get(key)
+        if channel is None:
+            return
+        (task, subscribers) = channel
+        subscribers.discard(queue)
+        if not subscribers:
+            task.cancel()
+            del self._channels[key]
+
+    async def _run(self, key: tuple, make_watcher: Callable, subscribers: set) -> None:
+        def publish(event):
+            for queue in subscribers:
+                queue.put_nowait(event)
+        try:
+            watcher = await run_in_threadpool(make_watcher)
+            async for event in watcher:
+                publish(self.serialize(event))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            publish({"type": "error", "detail": str(e)})
+        # None tells the subscribers the watcher is done
+        publish(None)
+        if self._channels.get(key, (None, None))[1] is subscribers:
+            del self._channels[key]
+
+    def stream(self, key: tuple, make_watcher: Callable) -> StreamingResponse:
+        """Server-Sent Events response subscribed to the watcher of key"""
+        queue = self.subscribe(key, make_watcher)
+
+        async def events():
+            try:
+                while True:
+                    try:
+                        event = await asyncio.wait_for(queue.get(), timeout=15)
+                    except asyncio.TimeoutError:
+                        # comment line, keeps proxies from closing an idle stream
+                        yield ": keep-alive\n\n"
+                        continue
+                    if event is None:
+                        yield "event: end\ndata: {}\n\n"
+                        return
+                    yield f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+            finally:
+                self.unsubscribe(key, queue)
+
+        return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+live_scores = LiveHub(lambda event: live_event_to_dict(event))
+live_drafts = LiveHub(lambda pick: pick_to_dict(pick))
+
+@app.get("/league/{league_id}/{year}/live/{week}")
+async def stream_live_scores(league_id: int, year: int, week: int, api_key: str = Depends(get_api_key), cookies: tuple = Depends(get_espn_cookies)):
+    espn_s2, swid = cookies
+    return live_scores.stream((league_id, year, week, espn_s2, swid),
+                              lambda: LiveScoreWatcher(League(league_id, year, espn_s2=espn_s2, swid=swid), week=week))
+
+@app.get("/league/{league_id}/{year}/draft/live")
+async def stream_live_draft(league_id: int, year: int, api_key: str = Depends(get_api_key), cookies: tuple = Depends(get_espn_cookies)):
+    espn_s2, swid = cookies
+    return live_drafts.stream((league_id, year, espn_s2, swid),
+                              lambda: DraftTracker(League(league_id, year, espn_s2=espn_s2, swid=swid)))
+
 @app.get("/league/{league_id}/{year}/activity")
 def get_activity(league_id: int, year: int, size: int = 25, api_key: str = Depends(get_api_key), cookies: tuple = Depends(get_espn_cookies)):
     espn_s2, swid = cookies
@@ -286,6 +405,39 @@ def boxscore_to_dict(b):
         "matchup_type": getattr(b, "matchup_type", None),
     }
 
+def live_event_to_dict(e):
+    if isinstance(e, PlayerDelta):
+        return {
+            "type": "player",
+            "team_id": team_id(e.team),
+            "playerId": e.player.playerId,
+            "name": e.player.name,
+            "points": e.player.points,
+            "delta": e.delta,
+        }
+    return {
+        "type": "matchup",
+        "home_team_id": team_id(e.box_score.home_team),
+        "away_team_id": team_id(e.box_score.away_team),
+        "home_score": e.box_score.home_score,
+        "away_score": e.box_score.away_score,
+        "home_delta": e.home_delta,
+        "away_delta": e.away_delta,
+    }
+
+def pick_to_dict(pick):
+    return {
+        "type": "pick",
+        "overall_pick": pick.overall_pick,
+        "round_num": pick.round_num,
+        "round_pick": pick.round_pick,
+        "team_id": getattr(pick.team, "team_id", None),
+        "playerId": pick.playerId,
+        "playerName": pick.playerName,
+        "bid_amount": pick.bid_amount,
+        "keeper_status": pick.keeper_status,
+    }
+
 def activity_to_dict(a):
     return {
         "date": getattr(a, "date", None),
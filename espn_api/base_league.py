@@ -1,21 +1,30 @@
+import pickle
 from abc import ABC
 from typing import List, Tuple
 
 from .base_settings import BaseSettings
 from .base_pick import BasePick
+from .player_pool import PlayerPool, PlayerPoolCache
+from .pro_schedule import ProSchedule
 from .utils.logger import Logger
 from .requests.espn_requests import EspnFantasyRequests
 
 class BaseLeague(ABC):
     '''Creates a League instance for Public/Private ESPN league'''
+    # set to a PlayerPoolCache to share the pro player pool between leagues of a season, off by default
+    player_pools: PlayerPoolCache = None
+    # the season's pro schedule, fetched once by _get_all_pro_schedule
+    _pro_schedule: ProSchedule = None
+
     def __init__(self, league_id: int, year: int, sport: str, espn_s2=None, swid=None, debug=False):
         self.logger = Logger(name=f'{sport} league', debug=debug)
+        self.sport = sport
         self.league_id = league_id
         self.year = year
         self.teams = []
         self.members = []
         self.draft = []
-        self.player_map = {}
+        self.player_map = PlayerPool()
 
         cookies = None
         if espn_s2 and swid:
@@ -28,9 +37,44 @@ class BaseLeague(ABC):
     def __repr__(self):
         return 'League(%s, %s)' % (self.league_id, self.year, )
 
+    def to_snapshot(self) -> bytes:
+        '''Serializes the loaded league, teams and players so it can be restored without network access.
+        ESPN cookies are not included in the snapshot'''
+        state = {key: value for key, value in self.__dict__.items() if key not in ('logger', 'espn_request')}
+        return pickle.dumps({'class': type(self).__qualname__, 'state': state}, protocol=5)
+
+    @classmethod
+    def from_snapshot(cls, snapshot: bytes, espn_s2=None, swid=None, debug=False):
+        '''Restores a league created with to_snapshot'''
+        data = pickle.loads(snapshot)
+        if data.get('class') != cls.__qualname__:
+            raise Exception(f"Snapshot of {data.get('class')} can't be restored as {cls.__qualname__}")
+
+        league = cls.__new__(cls)
+        league.__dict__.update(data['state'])
+        league.logger = Logger(name=f'{league.sport} league', debug=debug)
+
+        cookies = None
+        if espn_s2 and swid:
+            cookies = {
+                'espn_s2': espn_s2,
+                'SWID': swid
+            }
+        league.espn_request = EspnFantasyRequests(sport=league.sport, year=league.year, league_id=league.league_id, cookies=cookies, logger=league.logger)
+        league._set_live_period()
+        return league
+
+    def _set_live_period(self) -> None:
+        '''Lets the request layer cache responses for scoring periods of finished matchup periods'''
+        self.espn_request.live_scoring_period = getattr(self, 'scoringPeriodId', None)
+        self.espn_request.matchup_periods = getattr(getattr(self, 'settings', None), 'matchup_periods', None)
+
     def _fetch_league(self, SettingsClass = BaseSettings):
         data = self.espn_request.get_league()
         self.currentMatchupPeriod = data['status']['currentMatchupPeriod']
+        if data['scoringPeriodId'] != getattr(self, 'scoringPeriodId', None):
+            # games get rescheduled during the season, fetch the pro schedule again once a new scoring period starts
+            self._pro_schedule = None
         self.scoringPeriodId = data['scoringPeriodId']
         self.firstScoringPeriod = data['status']['firstScoringPeriod']
         self.finalScoringPeriod = data['status']['finalScoringPeriod']
@@ -42,6 +86,7 @@ class BaseLeague(ABC):
         else:
             self.current_week = self.scoringPeriodId if self.scoringPeriodId <= data['status']['finalScoringPeriod'] else data['status']['finalScoringPeriod']
         self.settings = SettingsClass(data['settings'])
+        self._set_live_period()
         self.members = data.get('members', [])
         return data
 
@@ -53,18 +98,23 @@ class BaseLeague(ABC):
             return
 
         picks = data.get('draftDetail', {}).get('picks', [])
+        teams = {team.team_id: team for team in self.teams}
         for pick in picks:
-            team = self.get_team_data(pick.get('teamId'))
-            playerId = pick.get('playerId')
-            playerName = ''
-            if playerId in self.player_map:
-                playerName = self.player_map[playerId]
-            round_num = pick.get('roundId')
-            round_pick = pick.get('roundPickNumber')
-            bid_amount = pick.get('bidAmount')
-            keeper_status = pick.get('keeper')
-            nominatingTeam = self.get_team_data(pick.get('nominatingTeamId'))
-            self.draft.append(BasePick(team, playerId, playerName, round_num, round_pick, bid_amount, keeper_status, nominatingTeam))
+            self.draft.append(self._get_pick(pick, teams))
+
+    def _get_pick(self, pick: dict, teams: dict) -> BasePick:
+        '''Pick from an mDraftDetail pick, teams is {team_id: team}'''
+        team = teams.get(pick.get('teamId'))
+        playerId = pick.get('playerId')
+        playerName = ''
+        if playerId in self.player_map:
+            playerName = self.player_map[playerId]
+        round_num = pick.get('roundId')
+        round_pick = pick.get('roundPickNumber')
+        bid_amount = pick.get('bidAmount')
+        keeper_status = pick.get('keeper')
+        nominatingTeam = teams.get(pick.get('nominatingTeamId'))
+        return BasePick(team, playerId, playerName, round_num, round_pick, bid_amount, keeper_status, nominatingTeam, pick.get('overallPickNumber'))
 
     def _fetch_teams(self, data, TeamClass, pro_schedule = None):
         '''Fetch teams in league'''
@@ -87,38 +137,26 @@ class BaseLeague(ABC):
         self.teams = sorted(self.teams, key=lambda x: x.team_id, reverse=False)
 
     def _fetch_players(self):
-        data = self.espn_request.get_pro_players()
-        # Map all player id's to player name
-        for player in data:
-            # two way map to find playerId's by name
-            self.player_map[player['id']] = player['fullName']
-            # if two players have the same fullname use first one for now TODO update for multiple player names
-            if player['fullName'] not in self.player_map:
-                self.player_map[player['fullName']] = player['id']
-
-    def _get_pro_schedule(self, scoringPeriodId: int = None):
-        data = self.espn_request.get_pro_schedule()
+        if self.player_pools is not None:
+            self.player_map = self.player_pools.get((self.sport, self.year),
+                                                    lambda previous: PlayerPool(self.espn_request.get_pro_players(), previous=previous))
+        else:
+            self.player_map = PlayerPool(self.espn_request.get_pro_players(), previous=self.player_map)
 
-        pro_teams = data['settings']['proTeams']
-        pro_team_schedule = {}
+    def search_players(self, query: str, limit: int = 10) -> List[Tuple[int, str, float]]:
+        '''Players matching a full, partial or misspelled name as (player_id, name, score), best match first'''
+        return self.player_map.search(query, limit=limit)
 
-        for team in pro_teams:
-            pro_game = team.get('proGamesByScoringPeriod', {})
-            if team['id'] != 0 and (str(scoringPeriodId) in pro_game.keys() and pro_game[str(scoringPeriodId)]):
-                game_data = pro_game[str(scoringPeriodId)][0]
-                pro_team_schedule[team['id']] = (game_data['homeProTeamId'], game_data['date'])  if team['id'] == game_data['awayProTeamId'] else (game_data['awayProTeamId'], game_data['date'])
-        return pro_team_schedule
+    def _get_pro_schedule(self, scoringPeriodId: int = None):
+        '''{pro_team_id: (opponent_id, date)} for the pro teams playing in the scoring period'''
+        return self._get_all_pro_schedule().period_games(scoringPeriodId)
     
-    def _get_all_pro_schedule(self):
-        data = self.espn_request.get_pro_schedule()
-
-        pro_teams = data.get('settings', {}).get('proTeams', {})
-        pro_team_schedule = {}
-
-        for team in pro_teams:
-            pro_game = team.get('proGamesByScoringPeriod', {})
-            pro_team_schedule[team['id']] = pro_game
-        return pro_team_schedule
+    def _get_all_pro_schedule(self, reload: bool = False) -> ProSchedule:
+        '''The season's pro schedule, fetched once per scoring period or again with reload'''
+        if self._pro_schedule is None or reload:
+            data = self.espn_request.get_pro_schedule()
+            self._pro_schedule = ProSchedule(data.get('settings', {}).get('proTeams', []))
+        return self._pro_schedule
 
     def standings(self) -> List:
         standings = sorted(self.teams, key=lambda x: x.final_standing if x.final_standing != 0 else x.standing, reverse=False)
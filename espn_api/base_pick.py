@@ -1,7 +1,7 @@
 
 class BasePick(object):
     ''' Pick represents a pick in draft '''
-    def __init__(self, team, playerId, playerName, round_num, round_pick, bid_amount, keeper_status, nominatingTeam):
+    def __init__(self, team, playerId, playerName, round_num, round_pick, bid_amount, keeper_status, nominatingTeam, overall_pick=None):
         self.team = team
         self.playerId = playerId
         self.playerName = playerName
@@ -10,6 +10,7 @@ class BasePick(object):
         self.bid_amount = bid_amount
         self.keeper_status = keeper_status
         self.nominatingTeam = nominatingTeam
+        self.overall_pick = overall_pick
 
     def __repr__(self):
         return 'Pick(R:%s P:%s, %s, %s)' % (self.round_num, self.round_pick, self.playerName, self.team)
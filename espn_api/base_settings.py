@@ -1,12 +1,24 @@
+def scoring_period_matchups(matchup_periods: dict) -> dict:
+    '''{scoring period: the first matchup period containing it} from {matchup period: [scoring periods]}'''
+    matchups = {}
+    for (matchup_period, scoring_periods) in matchup_periods.items():
+        for scoring_period in scoring_periods:
+            matchups.setdefault(scoring_period, matchup_period)
+    return matchups
+
+
 class BaseSettings(object):
     '''Creates Settings object'''
     def __init__(self, data):
         self.reg_season_count = data['scheduleSettings']['matchupPeriodCount']
         self.matchup_periods = data['scheduleSettings']['matchupPeriods']
+        self.scoring_period_matchups = scoring_period_matchups(self.matchup_periods)
         self.veto_votes_required = data['tradeSettings']['vetoVotesRequired']
         self.team_count = data['size']
         self.playoff_team_count = data['scheduleSettings']['playoffTeamCount']
         self.keeper_count = data['draftSettings']['keeperCount']
+        # ms timestamp, 0 when no draft is scheduled
+        self.draft_date = data['draftSettings'].get('date', 0)
         self.trade_deadline = 0
         self.division_map = {}
         if 'deadlineDate' in data['tradeSettings']:
@@ -21,8 +21,6 @@ class League(BaseLeague):
     def __init__(self, league_id: int, year: int, espn_s2=None, swid=None, fetch_league=True, debug=False):
         super().__init__(league_id=league_id, year=year, sport='mlb', espn_s2=espn_s2, swid=swid, debug=debug)
 
-        self._set_scoring_class = lambda scoring_type: League.ScoreTypes.get(scoring_type, BoxScore)
-
         self.scoring_type = None
         self._box_score_class = None
 
@@ -31,6 +29,9 @@ class League(BaseLeague):
         if self._box_score_class is None:
             self._box_score_class = self._set_scoring_class(self.scoring_type)
 
+    def _set_scoring_class(self, scoring_type):
+        return League.ScoreTypes.get(scoring_type, BoxScore)
+
     def fetch_league(self):
         data = self._fetch_league()
         self.scoring_type = data['settings']['scoringSettings']['scoringType']
@@ -46,8 +47,10 @@ class League(BaseLeague):
     def _fetch_teams(self, data):
         '''Fetch teams in league'''
         super()._fetch_teams(data, TeamClass=Team)
+        self._resolve_opponents()
 
-        # replace opponentIds in schedule with team instances
+    def _resolve_opponents(self):
+        '''Replace opponentIds in schedule with team instances'''
         for team in self.teams:
             team.division_name = self.settings.division_map.get(team.division_id, '')
             for week, matchup in enumerate(team.schedule):
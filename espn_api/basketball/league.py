@@ -2,6 +2,7 @@ import json
 from typing import List, Set, Union
 
 from ..base_league import BaseLeague
+from ..base_settings import scoring_period_matchups
 from .team import Team
 from .player import Player
 from .matchup import Matchup
@@ -43,14 +44,17 @@ class League(BaseLeague):
                     self.matchup_ids[matchup_period] = sorted(scoring_periods)
                 else:
                     self.matchup_ids[matchup_period] = sorted(set(self.matchup_ids[matchup_period] + list(scoring_periods)))
+        self.matchup_id_by_scoring_id = scoring_period_matchups(self.matchup_ids)
 
 
     def _fetch_teams(self, data):
         '''Fetch teams in league'''
         self.pro_schedule = self._get_all_pro_schedule()
         super()._fetch_teams(data, TeamClass=Team, pro_schedule=self.pro_schedule)
+        self._resolve_opponents()
 
-        # replace opponentIds in schedule with team instances
+    def _resolve_opponents(self):
+        '''Replace opponentIds in schedule with team instances'''
         for team in self.teams:
             team.division_name = self.settings.division_map.get(team.division_id, '')
             for week, matchup in enumerate(team.schedule):
@@ -169,10 +173,7 @@ class League(BaseLeague):
             scoring_id = self.matchup_ids[matchup_period][-1] if matchup_period in self.matchup_ids else 1
         elif scoring_period and scoring_period <= scoring_id:
             scoring_id = scoring_period
-            for matchup in self.matchup_ids.keys():
-                if str(scoring_id) in self.matchup_ids[matchup]:
-                    matchup_id = matchup
-                    break
+            matchup_id = self.matchup_id_by_scoring_id.get(str(scoring_id), matchup_id)
 
         params = {
             'view': ['mMatchupScore', 'mScoreboard'],
@@ -194,11 +195,17 @@ class League(BaseLeague):
                     matchup.away_team = team
         return box_data
 
-    def player_info(self, name: str = None, playerId: Union[int, list] = None, include_news = False) -> Union[Player, List[Player]]:
-        ''' Returns Player class if name found '''
+    def player_info(self, name: str = None, playerId: Union[int, list] = None, include_news = False, fuzzy: bool = False) -> Union[Player, List[Player]]:
+        ''' Returns Player class if name found, or a list of every player sharing the name.
+        With fuzzy the closest name is used when there is no exact match '''
 
         if name:
-            playerId = self.player_map.get(name)
+            playerId = self.player_map.ids_by_name(name)
+            if not playerId and fuzzy:
+                # fall back to the closest name for suffixes and misspellings
+                playerId = self.player_map.search_index.match(name)
+            if not playerId:
+                return None
         if playerId is None or isinstance(playerId, str):
             return None
         if not isinstance(playerId, list):
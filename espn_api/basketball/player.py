@@ -1,5 +1,6 @@
 from .constant import NINE_CAT_STATS, POSITION_MAP, PRO_TEAM_MAP, STATS_MAP, STAT_ID_MAP
 from espn_api.utils.utils import json_parsing
+from espn_api.pro_schedule import team_schedule
 from datetime import datetime
 from functools import cached_property
 
@@ -23,12 +24,8 @@ class Player(object):
         self.expected_return_date = datetime(*expected_return_date).date() if expected_return_date else None
 
         if pro_team_schedule:
-            pro_team_id = json_parsing(data, 'proTeamId')
-            pro_team = pro_team_schedule.get(pro_team_id, {})
-            for key in pro_team:
-                game = pro_team[key][0]
-                team = game['awayProTeamId'] if game['awayProTeamId'] != pro_team_id else game['homeProTeamId']
-                self.schedule[key] = { 'team': PRO_TEAM_MAP[team], 'date': datetime.fromtimestamp(game['date']/1000.0) }
+            # shared with every player on the same pro team
+            self.schedule = team_schedule(pro_team_schedule, json_parsing(data, 'proTeamId'), PRO_TEAM_MAP)
 
         if news:
             news_feed = news.get("news", {}).get("feed", [])
@@ -0,0 +1,105 @@
+import asyncio
+import threading
+import time
+from typing import Callable, List, Optional
+
+from .base_league import BaseLeague
+from .base_pick import BasePick
+
+
+def pick_number(pick: dict) -> int:
+    return pick.get('overallPickNumber') or pick.get('id') or 0
+
+
+class DraftTracker(object):
+    '''Follows a league's draft live, polling mDraftDetail only while the draft is in progress.
+
+    Each poll only builds picks numbered after the last one ingested, teams and player names are looked up
+    in indexes instead of scanning. Before the draft no request is made until the draft date of the league
+    settings, or one every idle_interval when there is none. Once the draft date has passed it is polled every interval
+    until the draft starts, drafts often start late. Iterating, with for or async for, yields every
+    new BasePick in pick order and ends once the draft is done'''
+    def __init__(self, league: BaseLeague, interval: float = 5, idle_interval: float = 300,
+                 on_pick: Callable[[BasePick], None] = None):
+        self.league = league
+        self.interval = interval
+        self.idle_interval = idle_interval
+        self.on_pick = on_pick
+        self.picks: List[BasePick] = []
+        self.last_pick = 0
+        self.in_progress = False
+        self.drafted = False
+        self.requests = 0
+        self.last_poll: Optional[float] = None
+        self._teams = {team.team_id: team for team in league.teams}
+        self._stopped = threading.Event()
+
+    def __repr__(self):
+        return f'DraftTracker({self.league.league_id}, {len(self.picks)} picks)'
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def next_poll(self, now: float = None) -> Optional[float]:
+        '''Seconds to wait before the next poll, None once the draft is done'''
+        now = now or time.time()
+        if self.last_poll is None:
+            return 0
+        if self.drafted:
+            return None
+        if self.in_progress:
+            return self.interval
+        draft_date = getattr(self.league.settings, 'draft_date', 0) / 1000.0
+        if draft_date > now:
+            return draft_date - now
+        return self.interval if draft_date else self.idle_interval
+
+    def poll(self) -> List[BasePick]:
+        '''Fetches the draft and returns the picks made since the previous poll, calling on_pick with each'''
+        data = self.league.espn_request.get_league_draft().get('draftDetail', {})
+        self.requests += 1
+        self.last_poll = time.time()
+        self.in_progress = data.get('inProgress', False)
+        self.drafted = data.get('drafted', False)
+
+        new_picks = sorted((pick for pick in data.get('picks', []) if pick_number(pick) > self.last_pick), key=pick_number)
+        picks = []
+        for pick in new_picks:
+            # picks on the clock have no player yet, sent as -1 or null
+            if (pick.get('playerId') or -1) <= 0:
+                break
+            picks.append(self.league._get_pick(pick, self._teams))
+            self.last_pick = pick_number(pick)
+        self.picks.extend(picks)
+
+        if self.on_pick:
+            for pick in picks:
+                self.on_pick(pick)
+        return picks
+
+    def __iter__(self):
+        while not self._stopped.is_set():
+            wait = self.next_poll()
+            if wait is None or self._stopped.wait(wait):
+                return
+            yield from self.poll()
+
+    def run(self) -> None:
+        '''Polls until the draft is done or stop is called, for use with on_pick'''
+        for _ in self:
+            pass
+
+    async def _aiter(self):
+        loop = asyncio.get_running_loop()
+        while not self._stopped.is_set():
+            wait = self.next_poll()
+            if wait is None:
+                return
+            await asyncio.sleep(wait)
+            if self._stopped.is_set():
+                return
+            for pick in await loop.run_in_executor(None, self.poll):
+                yield pick
+
+    def __aiter__(self):
+        return self._aiter()
@@ -1,38 +1,61 @@
-from .constant import POSITION_MAP, PRO_TEAM_MAP, PLAYER_STATS_MAP
+from .constant import POSITION_MAP, PRO_TEAM_MAP
 from .player import Player
 from datetime import datetime, timedelta
 
 
 class BoxPlayer(Player):
-    '''player with extra data from a matchup'''
-    def __init__(self, data, pro_schedule, positional_rankings, week, year):
-        super(BoxPlayer, self).__init__(data, year)
+    '''player with extra data from a matchup.
+    Holds the fields that come with each payload, stats and slots included, the name, position, pro team
+    and schedule are read from the Player it overlays, which is taken from players by id or parsed
+    from data and added to players'''
+    def __init__(self, data, pro_schedule, positional_rankings, week, year, players: dict = None):
+        player = data['playerPoolEntry']['player'] if 'playerPoolEntry' in data else data['player']
+        self.player = players.get(player['id']) if players is not None else None
+        if self.player is None:
+            self.player = Player(data, year)
+            if players is not None:
+                players[player['id']] = self.player
+
         self.slot_position = 'FA'
+        self.lineupSlot = POSITION_MAP.get(data.get('lineupSlotId'), '')
+        entry = data.get('playerPoolEntry', {})
+        self.acquisitionType = data.get('acquisitionType', entry.get('acquisitionType', []))
+        self.onTeamId = entry.get('onTeamId', data.get('onTeamId', []))
         self.pro_opponent = "None" # professional team playing against
         self.pro_pos_rank = 0 # rank of professional team against player position
         self.game_played = 100 # 0-100 for percent of game played
         self.on_bye_week = False
+        self.injuryStatus = player.get('injuryStatus', data.get('injuryStatus'))
+        self.injured = player.get('injured', False)
+        self.percent_owned = round(player.get('ownership', {}).get('percentOwned', -1), 2)
+        self.percent_started = round(player.get('ownership', {}).get('percentStarted', -1), 2)
 
         if 'lineupSlotId' in data:
             self.slot_position = POSITION_MAP[data['lineupSlotId']]
 
-        player = data['playerPoolEntry']['player'] if 'playerPoolEntry' in data else data['player']
         if player['proTeamId'] in pro_schedule:
             (opp_id, date) = pro_schedule[player['proTeamId']]
             self.game_date = datetime.fromtimestamp(date/1000.0)
             self.game_played = 100 if datetime.now() > self.game_date + timedelta(hours=3) else 0
-            posId = str(player['defaultPositionId'])
-            if posId in positional_rankings:
+            if player['defaultPositionId'] in positional_rankings:
                 self.pro_opponent = PRO_TEAM_MAP[opp_id]
-                self.pro_pos_rank = positional_rankings[posId][str(opp_id)] if str(opp_id) in positional_rankings[posId] else 0
+                self.pro_pos_rank = positional_rankings.rank(player['defaultPositionId'], opp_id)
         else: # bye week
             self.on_bye_week = True
 
+        # the shared Player may have been parsed from another scoring period's payload
+        self._parse_stats(player, year)
         stats = self.stats.get(week, {})
         self.points = stats.get('points', 0)
         self.points_breakdown = stats.get('breakdown', 0)
         self.projected_points = stats.get('projected_points', 0)
         self.projected_breakdown = stats.get('projected_breakdown', 0)
 
+    def __getattr__(self, name):
+        # only reached for attributes the overlay doesn't hold
+        if name == 'player':
+            raise AttributeError(name)
+        return getattr(self.player, name)
+
     def __repr__(self):
         return f'Player({self.name}, points:{self.points}, projected:{self.projected_points})'
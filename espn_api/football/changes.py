@@ -0,0 +1,52 @@
+class ScoreChange(object):
+    '''A team's score for a matchup period changed, old is None for a matchup that is new'''
+    def __init__(self, team, matchup_period: int, old: float, new: float):
+        self.team = team
+        self.matchup_period = matchup_period
+        self.old = old
+        self.new = new
+
+    def __repr__(self):
+        return f'ScoreChange({self.team.team_name} {self.matchup_period} {self.old} -> {self.new})'
+
+
+class RosterMove(object):
+    '''A player was ADDED to, DROPPED from or MOVED between lineup slots of a team'''
+    def __init__(self, team, player, type: str, old_slot: str = None, new_slot: str = None):
+        self.team = team
+        self.player = player
+        self.type = type
+        self.old_slot = old_slot
+        self.new_slot = new_slot
+
+    def __repr__(self):
+        return f'RosterMove({self.team.team_name} {self.type} {self.player.name} {self.old_slot} -> {self.new_slot})'
+
+
+class StandingChange(object):
+    '''A team's standing or (wins, losses, ties) record changed'''
+    def __init__(self, team, old_standing: int, old_record: tuple):
+        self.team = team
+        self.old_standing = old_standing
+        self.standing = team.standing
+        self.old_record = old_record
+        self.record = (team.wins, team.losses, team.ties)
+
+    def __repr__(self):
+        return f'StandingChange({self.team.team_name} {self.old_standing} -> {self.standing})'
+
+
+class LeagueChanges(object):
+    '''What an incremental League.refresh changed, teams are the ones that were re-parsed'''
+    def __init__(self, teams: list = ()):
+        self.teams = list(teams)
+        self.scores = []
+        self.roster_moves = []
+        self.standings = []
+
+    def __repr__(self):
+        return (f'LeagueChanges({len(self.teams)} teams, {len(self.scores)} scores, '
+                f'{len(self.roster_moves)} roster moves, {len(self.standings)} standings)')
+
+    def __bool__(self):
+        return bool(self.teams)
@@ -43,6 +43,23 @@ POSITION_MAP = {
     'HC': 19
 }
 
+# player defaultPositionId
+DEFAULT_POSITION_MAP = {
+    1: 'QB',
+    2: 'RB',
+    3: 'WR',
+    4: 'TE',
+    5: 'K',
+    7: 'P',
+    9: 'DT',
+    10: 'DE',
+    11: 'LB',
+    12: 'CB',
+    13: 'S',
+    14: 'HC',
+    16: 'D/ST',
+}
+
 PRO_TEAM_MAP = {
     0 : 'None',
     1 : 'ATL',
@@ -101,10 +101,10 @@ def sort_by_points_against(team_data_list: List[Dict]) -> List[Dict]:
     return sorted(team_data_list, key=lambda x: x["points_against"], reverse=True)
 
 
-def sort_by_coin_flip(team_data_list: List[Dict]) -> List[Dict]:
+def sort_by_coin_flip(team_data_list: List[Dict], rng: random.Random = random) -> List[Dict]:
     """Take a list of team standings data and sort it using the 5th level tiebreaker"""
     for team_data in team_data_list:
-        team_data["coin_flip"] = random.random()
+        team_data["coin_flip"] = rng.random()
     return sorted(team_data_list, key=lambda x: x["coin_flip"], reverse=True)
 
 
@@ -121,9 +121,6 @@ def sort_by_head_to_head(
 
     # If there are only two teams, sort descending by H2H wins
     elif len(h2h_dict) == 2:
-        # Filter the H2H DataFrame to only include the teams in question
-        h2h_dict = build_h2h_dict(team_data_list)
-
         # Sum the H2H wins against all tied opponents
         for team_data in team_data_list:
             team_data["h2h_wins"] = sum(
@@ -134,9 +131,6 @@ def sort_by_head_to_head(
 
     # If there are more than two teams...
     else:
-        # Filter the H2H DataFrame to only include the teams in question
-        h2h_dict = build_h2h_dict(team_data_list)
-
         # Check if the teams have all played each other an equal number of times
         matchup_counts = [
             h2h_dict[team_id][opp_id]["h2h_games"]
@@ -209,3 +203,77 @@ def sort_team_data_list(
         )
 
     return sorted_team_data_list
+
+
+def get_tiebreaker_hierarchy(playoff_seed_tie_rule: str) -> List[Tuple[Callable, str]]:
+    """Return the tiebreaker hierarchy used for a league's playoff seeding rule.
+
+    Args:
+        playoff_seed_tie_rule (str): Either 'TOTAL_POINTS_SCORED' or 'H2H_RECORD'
+
+    Returns:
+        List[Tuple[Callable, str]]: List of tiebreaker functions and columns to sort by
+    """
+    if playoff_seed_tie_rule == "TOTAL_POINTS_SCORED":
+        return [
+            (sort_by_win_pct, "win_pct"),
+            (sort_by_points_for, "points_for"),
+            (sort_by_head_to_head, "h2h_wins"),
+            (sort_by_division_record, "division_record"),
+            (sort_by_points_against, "points_against"),
+            (sort_by_coin_flip, "coin_flip"),
+        ]
+    elif playoff_seed_tie_rule == "H2H_RECORD":
+        return [
+            (sort_by_win_pct, "win_pct"),
+            (sort_by_head_to_head, "h2h_wins"),
+            (sort_by_points_for, "points_for"),
+            (sort_by_division_record, "division_record"),
+            (sort_by_points_against, "points_against"),
+            (sort_by_coin_flip, "coin_flip"),
+        ]
+    else:
+        raise ValueError(
+            "Unkown tiebreaker_method: Must be either 'TOTAL_POINTS_SCORED' or 'H2H_RECORD'"
+        )
+
+
+def sort_by_division_winners(
+    team_data_list: List[Dict],
+    division_ids: List[int],
+    tiebreaker_hierarchy: List[Tuple[Callable, str]],
+) -> List[Dict]:
+    """Seed the division winners first, then sort the rest of the teams.
+
+    Args:
+        team_data_list (List[Dict]): List of team data dictionaries
+        division_ids (List[int]): Division ids in the league
+        tiebreaker_hierarchy (List[Tuple[Callable, str]]): List of tiebreaker functions and columns to sort by
+
+    Returns:
+        List[Dict]: Sorted list of team data dictionaries
+    """
+    team_data_list = list(team_data_list)
+
+    # First assign the division winners
+    division_winners = []
+    for division_id in division_ids:
+        division_teams = [
+            team_data
+            for team_data in team_data_list
+            if team_data["division_id"] == division_id
+        ]
+        if not division_teams:
+            continue
+        division_winner = sort_team_data_list(division_teams, tiebreaker_hierarchy)[0]
+        division_winners.append(division_winner)
+        team_data_list.remove(division_winner)
+
+    # Sort the division winners
+    sorted_division_winners = sort_team_data_list(division_winners, tiebreaker_hierarchy)
+
+    # Then sort the rest of the teams
+    sorted_rest_of_field = sort_team_data_list(team_data_list, tiebreaker_hierarchy)
+
+    # Combine all teams
+    return sorted_division_winners + sorted_rest_of_field
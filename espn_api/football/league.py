@@ -11,23 +11,25 @@ from .player import Player
 from .activity import Activity
 from .settings import Settings
 from .utils import power_points, two_step_dominance
+from .simulation import simulate_season
 from .constant import POSITION_MAP, ACTIVITY_MAP, TRANSACTION_TYPES
 from .transaction import Transaction
-from .helper import (
-    sort_by_coin_flip,
-    sort_by_division_record,
-    sort_by_head_to_head,
-    sort_by_points_against,
-    sort_by_points_for,
-    sort_by_win_pct,
-    sort_team_data_list,
-)
+from .positional_ratings import PositionalRatings
+from .roster_history import RosterHistory
+from .changes import LeagueChanges, ScoreChange, StandingChange
+from .helper import get_tiebreaker_hierarchy, sort_by_division_winners
 
 
 class League(BaseLeague):
     '''Creates a League instance for Public/Private ESPN league'''
     def __init__(self, league_id: int, year: int, espn_s2=None, swid=None, fetch_league=True, debug=False):
         super().__init__(league_id=league_id, year=year, sport='nfl', espn_s2=espn_s2, swid=swid, debug=debug)
+        self._positional_ratings = {}
+        # previous payload of each team, incremental refreshes diff against it
+        self._team_payloads = {}
+        # one Player per player id, box scores and free agents overlay them.
+        # Rebuilt from the rosters on every fetch so players no longer rostered don't keep stale data
+        self._players: Dict[int, Player] = {}
 
         if fetch_league:
             self.fetch_league()
@@ -47,43 +49,109 @@ class League(BaseLeague):
         '''Fetch teams in league'''
         pro_schedule = self._get_all_pro_schedule()
         super()._fetch_teams(data, TeamClass=Team, pro_schedule=pro_schedule)
+        self._team_payloads = self._get_team_payloads(data)
+        self._index_players()
+        self._resolve_opponents()
+        self._calculate_mov()
+
+    def _get_team_payloads(self, data) -> Dict[int, tuple]:
+        '''{team_id: (team without roster, owners, roster, matchups of the team)}'''
+        members = data.get('members', [])
+        payloads = {}
+        for team in data['teams']:
+            info = {key: value for (key, value) in team.items() if key != 'roster'}
+            owners = [member for member in members if member.get('id') in team.get('owners', [])]
+            matchups = [matchup for matchup in data['schedule']
+                        if team['id'] in (matchup.get('home', {}).get('teamId'), matchup.get('away', {}).get('teamId'))]
+            payloads[team['id']] = (info, owners, team.get('roster', {}), matchups)
+        return payloads
+
+    def _update_teams(self, data) -> LeagueChanges:
+        '''Re-parse in place only the parts of each team whose payload changed since the last fetch'''
+        payloads = self._get_team_payloads(data)
+        changes = LeagueChanges()
 
-        # replace opponentIds in schedule with team instances
         for team in self.teams:
+            (info, owners, roster, matchups) = payloads[team.team_id]
+            (old_info, old_owners, old_roster, old_matchups) = self._team_payloads[team.team_id]
+            changed = False
+            if info != old_info or owners != old_owners:
+                (old_standing, old_record) = (team.standing, (team.wins, team.losses, team.ties))
+                team._fetch_info(info, owners)
+                if (team.standing, (team.wins, team.losses, team.ties)) != (old_standing, old_record):
+                    changes.standings.append(StandingChange(team, old_standing, old_record))
+                changed = True
+            if matchups != old_matchups:
+                old_scores = list(team.scores)
+                team._fetch_schedule(matchups)
+                for (week, score) in enumerate(team.scores):
+                    old_score = old_scores[week] if week < len(old_scores) else None
+                    if score != old_score:
+                        changes.scores.append(ScoreChange(team, week + 1, old_score, score))
+                changed = True
+            if roster != old_roster:
+                # only needed to parse players again, most refreshes don't touch a roster
+                pro_schedule = self._get_all_pro_schedule()
+                changes.roster_moves.extend(team._update_roster(roster, old_roster, data['seasonId'], pro_schedule))
+                changed = True
+            if changed:
+                changes.teams.append(team)
+
+        self._team_payloads = payloads
+        self._index_players()
+        self._resolve_opponents(changes.teams)
+        self._calculate_mov()
+        return changes
+
+    def _index_players(self):
+        '''Resets the player identity map to the rostered players, dropping free agents and box score only players'''
+        self._players = {player.playerId: player for team in self.teams for player in team.roster}
+
+    def _calculate_mov(self):
+        '''Margin of victory of every matchup'''
+        for team in self.teams:
+            team.mov = [team.scores[week] - opponent.scores[week] for (week, opponent) in enumerate(team.schedule)]
+
+    def _resolve_opponents(self, teams: List[Team] = None):
+        '''Replace opponentIds in schedule with team instances'''
+        for team in (self.teams if teams is None else teams):
             team.division_name = self.settings.division_map.get(team.division_id, '')
             for week, matchup in enumerate(team.schedule):
                 for opponent in self.teams:
                     if matchup == opponent.team_id:
                         team.schedule[week] = opponent
 
-        # calculate margin of victory
-        for team in self.teams:
-            for week, opponent in enumerate(team.schedule):
-                mov = team.scores[week] - opponent.scores[week]
-                team.mov.append(mov)
+    def _get_positional_ratings(self, week: int) -> PositionalRatings:
+        '''Fetched once per week and shared by every box score and free agent list of that week'''
+        if week not in self._positional_ratings:
+            params = {
+                'view': 'mPositionalRatings',
+                'scoringPeriodId': week,
+            }
+            data = self.espn_request.league_get(params=params)
+            self._positional_ratings[week] = PositionalRatings(data)
+        return self._positional_ratings[week]
 
-    def _get_positional_ratings(self, week: int):
-        params = {
-            'view': 'mPositionalRatings',
-            'scoringPeriodId': week,
-        }
-        data = self.espn_request.league_get(params=params)
-        ratings = data.get('positionAgainstOpponent', {}).get('positionalRatings', {})
-
-        positional_ratings = {}
-        for pos, rating in ratings.items():
-            teams_rating = {}
-            for team, data in rating['ratingsByOpponent'].items():
-                teams_rating[team] = data['rank']
-            positional_ratings[pos] = teams_rating
-        return positional_ratings
-
-    def refresh(self):
-        '''Gets latest league data. This can be used instead of creating a new League class each week'''
+    def positional_ratings(self, week: int = None) -> PositionalRatings:
+        '''Rank of every pro team against every position for a week, defaults to the current week'''
+        return self._get_positional_ratings(week or self.current_week)
+
+    def refresh(self, incremental: bool = False) -> LeagueChanges:
+        '''Gets latest league data. This can be used instead of creating a new League class each week.
+
+        With incremental only the teams whose roster, record or scores changed are re-parsed and the existing
+        Team and Player instances are updated in place. Returns the LeagueChanges of an incremental refresh'''
         data = super()._fetch_league()
 
         self.nfl_week = data['status']['latestScoringPeriod']
+        # ratings keep changing until a week's games are over, only earlier weeks are kept
+        self._positional_ratings = {week: ratings for (week, ratings) in self._positional_ratings.items() if week < self.current_week}
+        if incremental and {team['id'] for team in data['teams']} == set(self._team_payloads):
+            return self._update_teams(data)
         self._fetch_teams(data)
+        if incremental:
+            # teams were added or removed so every team was parsed again
+            return LeagueChanges(teams=self.teams)
 
     def refresh_draft(self, refresh_players=False, refresh__teams=False):
         super()._fetch_draft()
@@ -108,6 +176,10 @@ class League(BaseLeague):
             roster = team_roster[team.team_id]
             team._fetch_roster(roster, self.year)
 
+    def roster_history(self, weeks: List[int] = None, max_workers: int = 8) -> RosterHistory:
+        '''Every team's roster for several weeks at once, 1 through the current week by default'''
+        return RosterHistory(self, weeks=weeks, max_workers=max_workers)
+
     def standings(self) -> List[Team]:
         standings = sorted(self.teams, key=lambda x: x.final_standing if x.final_standing != 0 else x.standing, reverse=False)
         return standings
@@ -160,56 +232,13 @@ class League(BaseLeague):
             list_of_team_data.append(team_data)
 
         # Identify the proper tiebreaker hierarchy
-        if self.settings.playoff_seed_tie_rule == "TOTAL_POINTS_SCORED":
-            tiebreaker_hierarchy = [
-                (sort_by_win_pct, "win_pct"),
-                (sort_by_points_for, "points_for"),
-                (sort_by_head_to_head, "h2h_wins"),
-                (sort_by_division_record, "division_record"),
-                (sort_by_points_against, "points_against"),
-                (sort_by_coin_flip, "coin_flip"),
-            ]
-        elif self.settings.playoff_seed_tie_rule == "H2H_RECORD":
-            tiebreaker_hierarchy = [
-                (sort_by_win_pct, "win_pct"),
-                (sort_by_head_to_head, "h2h_wins"),
-                (sort_by_points_for, "points_for"),
-                (sort_by_division_record, "division_record"),
-                (sort_by_points_against, "points_against"),
-                (sort_by_coin_flip, "coin_flip"),
-            ]
-        else:
-            raise ValueError(
-                "Unkown tiebreaker_method: Must be either 'TOTAL_POINTS_SCORED' or 'H2H_RECORD'"
-            )
+        tiebreaker_hierarchy = get_tiebreaker_hierarchy(self.settings.playoff_seed_tie_rule)
 
-        # First assign the division winners
-        division_winners = []
-        for division_id in list(self.settings.division_map.keys()):
-            division_teams = [
-                team_data
-                for team_data in list_of_team_data
-                if team_data["division_id"] == division_id
-            ]
-            division_winner = sort_team_data_list(division_teams, tiebreaker_hierarchy)[
-                0
-            ]
-            division_winners.append(division_winner)
-            list_of_team_data.remove(division_winner)
-
-        # Sort the division winners
-        sorted_division_winners = sort_team_data_list(
-            division_winners, tiebreaker_hierarchy
+        # Division winners are seeded first, then the rest of the teams
+        sorted_team_data = sort_by_division_winners(
+            list_of_team_data, list(self.settings.division_map.keys()), tiebreaker_hierarchy
         )
 
-        # Then sort the rest of the teams
-        sorted_rest_of_field = sort_team_data_list(
-            list_of_team_data, tiebreaker_hierarchy
-        )
-
-        # Combine all teams
-        sorted_team_data = sorted_division_winners + sorted_rest_of_field
-
         return [team_data["team"] for team_data in sorted_team_data]
 
     def top_scorer(self) -> Team:
@@ -292,10 +321,7 @@ class League(BaseLeague):
         scoring_period = self.current_week
         if week and week <= self.current_week:
             scoring_period = week
-            for matchup_id in self.settings.matchup_periods:
-              if week in self.settings.matchup_periods[matchup_id]:
-                matchup_period = matchup_id
-                break
+            matchup_period = self.settings.scoring_period_matchups.get(week, matchup_period)
 
         params = {
             'view': ['mMatchupScore', 'mScoreboard'],
@@ -309,7 +335,7 @@ class League(BaseLeague):
         schedule = data['schedule']
         pro_schedule = self._get_pro_schedule(scoring_period)
         positional_rankings = self._get_positional_ratings(scoring_period)
-        box_data = [BoxScore(matchup, pro_schedule, positional_rankings, scoring_period, self.year) for matchup in schedule]
+        box_data = [BoxScore(matchup, pro_schedule, positional_rankings, scoring_period, self.year, self._players) for matchup in schedule]
 
         for team in self.teams:
             for matchup in box_data:
@@ -340,6 +366,22 @@ class League(BaseLeague):
         power_rank = power_points(dominance_matrix, teams_sorted, week)
         return power_rank
 
+    def simulate_season(self, n: int = 10000, processes: int = 1, seed: int = None, live: bool = True) -> Dict[Team, Dict]:
+        '''Returns playoff, bye and seed probabilities for each team by simulating
+        the remaining regular season n times. Set processes to spread the simulations across cores.
+        With live the week in progress keeps its scored points and draws the rest around the box score projections'''
+        projections = None
+        current_week = None
+        if live and self.year >= 2019 and self.current_week <= self.settings.reg_season_count:
+            current_week = self.current_week
+            projections = {}
+            for box_score in self.box_scores(current_week):
+                for (team, projected) in ((box_score.home_team, box_score.home_projected), (box_score.away_team, box_score.away_projected)):
+                    if hasattr(team, 'team_id'):
+                        projections[team.team_id] = projected
+        return simulate_season(self.teams, self.settings, n=n, processes=processes, seed=seed,
+                               current_week=current_week, projections=projections)
+
     def free_agents(self, week: int=None, size: int=50, position: str=None, position_id: int=None) -> List[Player]:
         '''Returns a List of Free Agents for a Given Week\n
         Should only be used with most recent season'''
@@ -369,13 +411,19 @@ class League(BaseLeague):
         pro_schedule = self._get_pro_schedule(week)
         positional_rankings = self._get_positional_ratings(week)
 
-        return [BoxPlayer(player, pro_schedule, positional_rankings, week, self.year) for player in players]
+        return [BoxPlayer(player, pro_schedule, positional_rankings, week, self.year, self._players) for player in players]
 
-    def player_info(self, name: str = None, playerId: Union[int, list] = None) -> Union[Player, List[Player]]:
-        ''' Returns Player class if name found '''
+    def player_info(self, name: str = None, playerId: Union[int, list] = None, fuzzy: bool = False) -> Union[Player, List[Player]]:
+        ''' Returns Player class if name found, or a list of every player sharing the name.
+        With fuzzy the closest name is used when there is no exact match '''
 
         if name:
-            playerId = self.player_map.get(name)
+            playerId = self.player_map.ids_by_name(name)
+            if not playerId and fuzzy:
+                # fall back to the closest name for suffixes and misspellings
+                playerId = self.player_map.search_index.match(name)
+            if not playerId:
+                return None
         if playerId is None or isinstance(playerId, str):
             return None
         if not isinstance(playerId, list):
@@ -0,0 +1,179 @@
+import asyncio
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Set
+
+from espn_api.pro_schedule import GAME_LENGTH
+from .box_score import BoxScore
+from .box_player import BoxPlayer
+
+
+def team_id(team) -> int:
+    # box score teams are Team instances, or 0 for a bye
+    return getattr(team, 'team_id', team)
+
+
+class PlayerDelta(object):
+    '''Points a player scored for a fantasy team since the previous poll'''
+    def __init__(self, box_score: BoxScore, team, player: BoxPlayer, delta: float):
+        self.box_score = box_score
+        self.team = team
+        self.player = player
+        self.delta = delta
+
+    def __repr__(self):
+        return f'PlayerDelta({self.player.name} {self.delta:+})'
+
+
+class MatchupDelta(object):
+    '''Points each side of a matchup scored since the previous poll'''
+    def __init__(self, box_score: BoxScore, home_delta: float, away_delta: float):
+        self.box_score = box_score
+        self.home_delta = home_delta
+        self.away_delta = away_delta
+
+    def __repr__(self):
+        return f'MatchupDelta({self.box_score} {self.home_delta:+} {self.away_delta:+})'
+
+
+class LiveScoreWatcher(object):
+    '''Polls League.box_scores for a week only while pro games of the week are being played.
+
+    The first poll is made at once and sets the baseline, later polls report PlayerDelta and MatchupDelta events.
+    Game start times come from the pro schedule until the first poll, then from the game_date of every
+    rostered player. A game is live from its start for GAME_LENGTH, and after that for up to grace_period
+    seconds more while its players' points keep changing from one poll to the next, for overtime and delays.
+    With live games the interval shrinks from max_interval towards min_interval as more games are live,
+    without live games no request is made until the next game starts.
+    Iterating, with for or async for, ends after a last poll once every game is over'''
+    def __init__(self, league, week: int = None, min_interval: float = 15, max_interval: float = 120,
+                 on_player: Callable[[PlayerDelta], None] = None, on_matchup: Callable[[MatchupDelta], None] = None,
+                 grace_period: float = 5400):
+        self.league = league
+        self.week = week or league.current_week
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.grace_period = timedelta(seconds=grace_period)
+        self.on_player = on_player
+        self.on_matchup = on_matchup
+        self.requests = 0
+        self.last_poll: Optional[datetime] = None
+        self._points: Dict[tuple, float] = {}
+        self._scores: Dict[tuple, tuple] = {}
+        self._game_starts: Dict = None
+        # pro teams whose players' points changed in the last poll
+        self._scoring: Set = set()
+        self._stopped = threading.Event()
+
+    def __repr__(self):
+        return f'LiveScoreWatcher(week {self.week}, {self.requests} requests)'
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def _games(self) -> Dict:
+        '''{pro team: start} of every game of the week'''
+        if self._game_starts is None:
+            games = self.league._get_pro_schedule(self.week)
+            return {pro_team: datetime.fromtimestamp(date / 1000.0) for (pro_team, (_, date)) in games.items()}
+        return self._game_starts
+
+    def game_starts(self) -> List[datetime]:
+        '''Start time of every game of the week'''
+        return list(self._games().values())
+
+    def _is_live(self, pro_team, start: datetime, now: datetime) -> bool:
+        end = start + GAME_LENGTH
+        if now < end:
+            return start <= now
+        if now >= end + self.grace_period:
+            return False
+        # past its usual length a game is still followed until a poll shows its players' points settled
+        return self.last_poll is not None and (self.last_poll < end or pro_team in self._scoring)
+
+    def live_games(self, now: datetime = None) -> int:
+        now = now or datetime.now()
+        return sum(1 for (pro_team, start) in self._games().items() if self._is_live(pro_team, start, now))
+
+    def next_poll(self, now: datetime = None) -> Optional[float]:
+        '''Seconds to wait before the next poll, None when the week is over'''
+        now = now or datetime.now()
+        if self.last_poll is None:
+            return 0
+        games = self._games()
+        live = self.live_games(now)
+        if live:
+            return max(self.min_interval, self.max_interval / live)
+        upcoming = [start for start in games.values() if start > now]
+        if upcoming:
+            return (min(upcoming) - now).total_seconds()
+        # one more poll for the points of games that ended, or were still scoring, at the last one
+        if any(self.last_poll < start + GAME_LENGTH or pro_team in self._scoring for (pro_team, start) in games.items()):
+            return 0
+        return None
+
+    def poll(self) -> list:
+        '''Fetches the box scores and returns the deltas since the previous poll, calling the callbacks with them'''
+        box_scores = self.league.box_scores(self.week)
+        self.requests += 1
+        self.last_poll = datetime.now()
+        events = []
+        game_starts = {}
+        scoring = set()
+
+        for box_score in box_scores:
+            sides = ((box_score.home_team, box_score.home_lineup), (box_score.away_team, box_score.away_lineup))
+            for (team, lineup) in sides:
+                for player in lineup:
+                    if not player.on_bye_week:
+                        game_starts[player.proTeam] = player.game_date
+                    key = (team_id(team), player.playerId)
+                    previous = self._points.get(key)
+                    # points aren't known to have settled until a second poll
+                    if previous is None or player.points != previous:
+                        scoring.add(player.proTeam)
+                    if previous is not None and player.points != previous:
+                        events.append(PlayerDelta(box_score, team, player, round(player.points - previous, 2)))
+                    self._points[key] = player.points
+
+            key = (team_id(box_score.home_team), team_id(box_score.away_team))
+            previous = self._scores.get(key)
+            if previous is not None and (box_score.home_score, box_score.away_score) != previous:
+                events.append(MatchupDelta(box_score, round(box_score.home_score - previous[0], 2),
+                                           round(box_score.away_score - previous[1], 2)))
+            self._scores[key] = (box_score.home_score, box_score.away_score)
+
+        self._game_starts = game_starts
+        self._scoring = scoring
+        for event in events:
+            callback = self.on_player if isinstance(event, PlayerDelta) else self.on_matchup
+            if callback:
+                callback(event)
+        return events
+
+    def __iter__(self):
+        while not self._stopped.is_set():
+            wait = self.next_poll()
+            if wait is None or self._stopped.wait(wait):
+                return
+            yield from self.poll()
+
+    def run(self) -> None:
+        '''Polls until the week is over or stop is called, for use with the callbacks'''
+        for _ in self:
+            pass
+
+    async def _aiter(self):
+        loop = asyncio.get_running_loop()
+        while not self._stopped.is_set():
+            wait = self.next_poll()
+            if wait is None:
+                return
+            await asyncio.sleep(wait)
+            if self._stopped.is_set():
+                return
+            for event in await loop.run_in_executor(None, self.poll):
+                yield event
+
+    def __aiter__(self):
+        return self._aiter()
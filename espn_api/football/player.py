@@ -1,6 +1,6 @@
 from .constant import POSITION_MAP, PRO_TEAM_MAP, PLAYER_STATS_MAP
 from .utils import json_parsing
-from datetime import datetime
+from espn_api.pro_schedule import team_schedule
 
 class Player(object):
     '''Player are part of team'''
@@ -14,7 +14,6 @@ class Player(object):
         self.injuryStatus = json_parsing(data, 'injuryStatus')
         self.onTeamId = json_parsing(data, 'onTeamId')
         self.lineupSlot = POSITION_MAP.get(data.get('lineupSlotId'), '')
-        self.stats = {}
         self.schedule = {}
 
         # Get players main position
@@ -24,12 +23,8 @@ class Player(object):
                 break
 
         if pro_team_schedule:
-            pro_team_id = json_parsing(data, 'proTeamId')
-            pro_team = pro_team_schedule.get(pro_team_id, {})
-            for key in pro_team:
-                game = pro_team[key][0]
-                team = game['awayProTeamId'] if game['awayProTeamId'] != pro_team_id else game['homeProTeamId']
-                self.schedule[key] = { 'team': PRO_TEAM_MAP[team], 'date': datetime.fromtimestamp(game['date']/1000.0) }
+            # shared with every player on the same pro team
+            self.schedule = team_schedule(pro_team_schedule, json_parsing(data, 'proTeamId'), PRO_TEAM_MAP)
 
         # set each scoring period stat
         player = data['playerPoolEntry']['player'] if 'playerPoolEntry' in data else data['player']
@@ -37,7 +32,11 @@ class Player(object):
         self.injured = player.get('injured', False)
         self.percent_owned = round(player.get('ownership', {}).get('percentOwned', -1), 2)
         self.percent_started = round(player.get('ownership', {}).get('percentStarted', -1), 2)
+        self._parse_stats(player, year)
 
+    def _parse_stats(self, player: dict, year: int) -> None:
+        '''Sets stats by scoring period, active_status and the season totals from the player's stats'''
+        self.stats = {}
         self.active_status = 'bye'
         player_stats = player.get('stats', [])
         for stats in player_stats:
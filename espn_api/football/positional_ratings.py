@@ -0,0 +1,43 @@
+from array import array
+from typing import Dict, List
+
+from .constant import DEFAULT_POSITION_MAP, PRO_TEAM_MAP
+
+
+class PositionalRatings(object):
+    '''How each pro team ranks against each position for one week, from the mPositionalRatings view.
+    Stored as a table with a row per defaultPositionId and a column per pro team id, 0 means unranked.
+    One instance is shared by every BoxPlayer of the week'''
+    def __init__(self, data: dict = None):
+        ratings = (data or {}).get('positionAgainstOpponent', {}).get('positionalRatings', {})
+        opponents = {int(pos): rating.get('ratingsByOpponent', {}) for (pos, rating) in ratings.items()}
+        self.pro_team_count = 1 + max((int(team) for teams in opponents.values() for team in teams), default=0)
+        self.rows: List[array] = [None] * (1 + max(opponents, default=0))
+        for (pos, teams) in opponents.items():
+            row = array('h', [0]) * self.pro_team_count
+            for (team, rating) in teams.items():
+                row[int(team)] = rating['rank']
+            self.rows[pos] = row
+
+    def __repr__(self):
+        return f'PositionalRatings({len(self.positions)} positions)'
+
+    def __contains__(self, position_id: int) -> bool:
+        return 0 <= position_id < len(self.rows) and self.rows[position_id] is not None
+
+    @property
+    def positions(self) -> List[int]:
+        return [pos for (pos, row) in enumerate(self.rows) if row is not None]
+
+    def rank(self, position_id: int, pro_team_id: int) -> int:
+        '''Rank of the pro team against the position, 0 if unranked'''
+        if position_id not in self or not 0 <= pro_team_id < self.pro_team_count:
+            return 0
+        return self.rows[position_id][pro_team_id]
+
+    def heat_map(self) -> Dict[str, Dict[str, int]]:
+        '''{position: {pro team: rank}} for every ranked pair, e.g. to render matchup difficulty'''
+        return {
+            DEFAULT_POSITION_MAP.get(pos, pos): {PRO_TEAM_MAP.get(team, team): rank for (team, rank) in enumerate(self.rows[pos]) if rank}
+            for pos in self.positions
+        }
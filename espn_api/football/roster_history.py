@@ -0,0 +1,111 @@
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Tuple
+
+from .constant import POSITION_MAP
+from .player import Player
+
+# lineup slots that don't count towards a team's score
+INACTIVE_SLOTS = {'BE', 'IR'}
+
+
+class RosterHistory(object):
+    '''Every team's roster for a range of scoring periods, fetched concurrently with one mRoster request per week.
+
+    Rosters are kept as flat team x week x slot matrices of player id, lineupSlotId and points, rows of a team week
+    with fewer players than slots are padded with player id 0.
+    Each player is parsed once, from the latest week they were rostered, and shared by every week'''
+    def __init__(self, league, weeks: List[int] = None, max_workers: int = 8, fetch_weeks=True):
+        self.league = league
+        self.year = league.year
+        self.max_workers = max_workers
+        self.team_ids = [team.team_id for team in league.teams]
+        self.weeks: List[int] = []
+        self.slots = 0
+        self.player_ids = array('q')
+        self.slot_ids = array('h')
+        self.player_points = array('d')
+        self.players: Dict[int, Player] = {}
+        self._player_weeks: Dict[int, int] = {}
+
+        if fetch_weeks:
+            self.fetch_weeks(weeks)
+
+    def __repr__(self):
+        return f'RosterHistory({self.league.league_id}, {self.year}, weeks {self.weeks})'
+
+    def _fetch_week(self, week: int) -> Tuple[int, dict]:
+        params = {
+            'view': 'mRoster',
+            'scoringPeriodId': week,
+        }
+        return (week, self.league.espn_request.league_get(params=params))
+
+    def fetch_weeks(self, weeks: List[int] = None) -> None:
+        '''Loads the rosters of scoring periods, 1 through the current week by default'''
+        if weeks is None:
+            weeks = range(1, self.league.current_week + 1)
+        rosters = {week: {team_id: list(self._entries(t, w)) for (t, team_id) in enumerate(self.team_ids)}
+                   for (w, week) in enumerate(self.weeks)}
+        pro_schedule = self.league._get_all_pro_schedule()
+
+        # latest week first so players are parsed from their most recent roster entry
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for (week, data) in executor.map(self._fetch_week, sorted(set(weeks), reverse=True)):
+                rosters[week] = {team['id']: [self._parse_entry(entry, week, pro_schedule) for entry in team.get('roster', {}).get('entries', [])]
+                                 for team in data.get('teams', [])}
+        self._pack(rosters)
+
+    def _parse_entry(self, entry: dict, week: int, pro_schedule) -> Tuple[int, int, float]:
+        player_id = entry['playerId']
+        if self._player_weeks.get(player_id, 0) < week:
+            self.players[player_id] = Player(entry, self.year, pro_schedule)
+            self._player_weeks[player_id] = week
+        player = entry['playerPoolEntry']['player'] if 'playerPoolEntry' in entry else entry['player']
+        points = next((stats.get('appliedTotal', 0) for stats in player.get('stats', [])
+                       if stats.get('scoringPeriodId') == week and stats.get('statSourceId') == 0
+                       and stats.get('seasonId', self.year) == self.year), 0)
+        return (player_id, entry.get('lineupSlotId', -1), round(points, 2))
+
+    def _pack(self, rosters: Dict[int, Dict[int, list]]) -> None:
+        self.weeks = sorted(rosters)
+        self.slots = max((len(entries) for teams in rosters.values() for entries in teams.values()), default=0)
+        size = len(self.team_ids) * len(self.weeks) * self.slots
+        self.player_ids = array('q', [0]) * size
+        self.slot_ids = array('h', [-1]) * size
+        self.player_points = array('d', [0]) * size
+        for (w, week) in enumerate(self.weeks):
+            for (t, team_id) in enumerate(self.team_ids):
+                start = self._index(t, w)
+                for (i, (player_id, slot_id, points)) in enumerate(rosters[week].get(team_id, [])):
+                    self.player_ids[start + i] = player_id
+                    self.slot_ids[start + i] = slot_id
+                    self.player_points[start + i] = points
+
+    def _index(self, team_row: int, week_row: int) -> int:
+        '''Position of the first slot of a team week in the matrices'''
+        return (team_row * len(self.weeks) + week_row) * self.slots
+
+    def _entries(self, team_row: int, week_row: int) -> Iterator[Tuple[int, int, float]]:
+        start = self._index(team_row, week_row)
+        for i in range(start, start + self.slots):
+            if self.player_ids[i]:
+                yield (self.player_ids[i], self.slot_ids[i], self.player_points[i])
+
+    def lineup(self, team_id: int, week: int) -> List[Tuple[Player, str, float]]:
+        '''(player, lineup slot, points) of every player on the team's roster in the week'''
+        entries = self._entries(self.team_ids.index(team_id), self.weeks.index(week))
+        return [(self.players[player_id], POSITION_MAP.get(slot_id, ''), points) for (player_id, slot_id, points) in entries]
+
+    def team_points(self, team_id: int, week: int, starters: bool = True) -> float:
+        '''Points of the team's starters in the week, or of the whole roster'''
+        return round(sum(points for (_, slot, points) in self.lineup(team_id, week) if not starters or slot not in INACTIVE_SLOTS), 2)
+
+    def player_weeks(self, player_id: int) -> Dict[int, Tuple[int, str, float]]:
+        '''{week: (team_id, lineup slot, points)} for every loaded week the player was rostered'''
+        weeks = {}
+        for i in (i for (i, value) in enumerate(self.player_ids) if value == player_id):
+            (team_week, _) = divmod(i, self.slots)
+            (t, w) = divmod(team_week, len(self.weeks))
+            weeks[self.weeks[w]] = (self.team_ids[t], POSITION_MAP.get(self.slot_ids[i], ''), self.player_points[i])
+        return dict(sorted(weeks.items()))
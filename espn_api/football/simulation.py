@@ -0,0 +1,265 @@
+# Monte Carlo simulation of the remaining regular season
+
+import math
+import random
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import groupby
+from typing import Dict, List
+
+from .helper import get_tiebreaker_hierarchy, sort_by_coin_flip, sort_team_data_list
+
+# simulations drawn and tallied together, bounds the memory held by the score draws
+BATCH_SIZE = 4096
+
+
+class SimTeam(object):
+    '''Lightweight stand-in for Team used by the tiebreaker helpers during a simulation'''
+    def __init__(self, team_id: int, division_id: int):
+        self.team_id = team_id
+        self.division_id = division_id
+
+    def __repr__(self):
+        return 'SimTeam(%s)' % (self.team_id, )
+
+
+def _score_distribution(scores: List[float], fallback: tuple) -> tuple:
+    '''Returns (mean, stdev) of a teams completed scores'''
+    if len(scores) < 2:
+        return fallback
+    return (statistics.mean(scores), statistics.stdev(scores))
+
+
+def build_season_state(teams: List, settings, current_week: int = None, projections: Dict[int, float] = None) -> Dict:
+    '''Converts Team objects into a plain dict that can be sent to worker processes'''
+    reg_season_count = settings.reg_season_count
+    projections = projections or {}
+    all_scores = []
+    for team in teams:
+        all_scores += [score for score, outcome in zip(team.scores[:reg_season_count], team.outcomes) if outcome in ('W', 'L', 'T')]
+    league_fallback = (statistics.mean(all_scores), statistics.stdev(all_scores)) if len(all_scores) > 1 else (100.0, 20.0)
+
+    state = {
+        'team_ids': [team.team_id for team in teams],
+        'division_ids': [team.division_id for team in teams],
+        'divisions': list(settings.division_map.keys()),
+        'playoff_team_count': settings.playoff_team_count,
+        'playoff_seed_tie_rule': settings.playoff_seed_tie_rule,
+        'schedules': [],
+        'scores': [],
+        'outcomes': [],
+        'distributions': [],
+        'live': [],
+    }
+    for team in teams:
+        schedule = [opponent.team_id if hasattr(opponent, 'team_id') else opponent for opponent in team.schedule[:reg_season_count]]
+        scores = list(team.scores[:reg_season_count])
+        outcomes = list(team.outcomes[:reg_season_count])
+        completed = [score for score, outcome in zip(scores, outcomes) if outcome in ('W', 'L', 'T')]
+        distribution = _score_distribution(completed, league_fallback)
+        state['schedules'].append(schedule)
+        state['scores'].append(scores)
+        state['outcomes'].append(outcomes)
+        state['distributions'].append(distribution)
+        state['live'].append(_live_distribution(team.team_id, scores, outcomes, distribution, current_week, projections))
+    return state
+
+
+def _live_distribution(team_id: int, scores: List[float], outcomes: List[str], distribution: tuple, current_week: int, projections: Dict[int, float]) -> tuple:
+    '''Returns (week index, points scored, remaining mean, remaining stdev) for a matchup in progress'''
+    if not current_week or current_week > len(outcomes) or outcomes[current_week - 1] != 'U':
+        return None
+    week = current_week - 1
+    scored = scores[week] or 0
+    (mean, stdev) = distribution
+    projected = projections.get(team_id)
+    remaining = max((mean if projected is None else projected) - scored, 0)
+    # the spread shrinks with the share of a normal week still to be played
+    fraction = min(remaining / mean, 1) if mean > 0 else 0
+    return (week, scored, remaining, stdev * math.sqrt(fraction))
+
+
+def _bye_count(playoff_team_count: int) -> int:
+    '''Number of first round byes for a playoff bracket'''
+    if playoff_team_count < 2:
+        return 0
+    bracket = 2 ** math.ceil(math.log2(playoff_team_count))
+    return bracket - playoff_team_count
+
+
+def _draw_params(state: Dict, i: int, week: int) -> tuple:
+    '''Returns (points already scored, mean, stdev) used to draw a teams score for a week'''
+    live = state['live'][i]
+    if live and live[0] == week:
+        return live[1:]
+    return (0,) + tuple(state['distributions'][i])
+
+
+def _simulate_chunk(state: Dict, n: int, seed: int = None) -> Dict:
+    '''Runs n simulations and returns playoff, bye and seed counts per team index'''
+    rng = random.Random(seed)
+    gauss = rng.gauss
+    team_count = len(state['team_ids'])
+    index = {team_id: i for i, team_id in enumerate(state['team_ids'])}
+    sim_teams = [SimTeam(team_id, division_id) for team_id, division_id in zip(state['team_ids'], state['division_ids'])]
+    # coin flips come from the seeded generator too so a seed reproduces the whole run
+    tiebreaker_hierarchy = [(partial(sort_by_coin_flip, rng=rng), column) if function is sort_by_coin_flip else (function, column)
+                            for (function, column) in get_tiebreaker_hierarchy(state['playoff_seed_tie_rule'])]
+    # win_pct is handled below, only ties on it go through the remaining tiebreakers
+    tiebreakers = tiebreaker_hierarchy[1:]
+    points_first = tiebreakers[0][1] == 'points_for'
+    playoff_team_count = min(state['playoff_team_count'], team_count)
+    bye_count = _bye_count(playoff_team_count)
+    division_members = [[i for i in range(team_count) if state['division_ids'][i] == division_id] for division_id in state['divisions']]
+
+    # completed games are tallied once, remaining games as (week, team index, opponent index)
+    remaining = []
+    games = [0] * team_count
+    base_record = [0] * team_count
+    base_points_for = [0] * team_count
+    base_points_against = [0] * team_count
+    played_schedules = [[] for _ in range(team_count)]
+    played_outcomes = [[] for _ in range(team_count)]
+    for i, (schedule, scores, outcomes) in enumerate(zip(state['schedules'], state['scores'], state['outcomes'])):
+        for week, (opponent_id, score, outcome) in enumerate(zip(schedule, scores, outcomes)):
+            j = index.get(opponent_id, i)
+            if outcome in ('W', 'L', 'T'):
+                games[i] += 1
+                # record counts two per win and one per tie
+                base_record[i] += {'W': 2, 'T': 1, 'L': 0}[outcome]
+                base_points_for[i] += score
+                base_points_against[i] += state['scores'][j][week]
+                played_schedules[i].append(sim_teams[j])
+                played_outcomes[i].append(outcome)
+            elif outcome == 'U' and j != i:
+                games[i] += 1
+                if j > i:
+                    remaining.append((week, i, j))
+    team_games = [[] for _ in range(team_count)]
+    for g, (week, i, j) in enumerate(remaining):
+        team_games[i].append((g, j, True))
+        team_games[j].append((g, i, False))
+    draw_params = [(_draw_params(state, i, week), _draw_params(state, j, week)) for (week, i, j) in remaining]
+
+    counts = {
+        'playoff': [0] * team_count,
+        'bye': [0] * team_count,
+        'seed': [[0] * team_count for _ in range(team_count)],
+    }
+
+    def team_data(i: int, r: int, draws: List, points_for: List) -> Dict:
+        schedule = list(played_schedules[i])
+        outcomes = list(played_outcomes[i])
+        points_against = base_points_against[i]
+        for (g, j, first) in team_games[i]:
+            (score, opponent_score) = (draws[g][0][r], draws[g][1][r]) if first else (draws[g][1][r], draws[g][0][r])
+            schedule.append(sim_teams[j])
+            outcomes.append('W' if score > opponent_score else 'L' if score < opponent_score else 'T')
+            points_against += opponent_score
+        (wins, ties) = (outcomes.count('W'), outcomes.count('T'))
+        return {
+            'team': sim_teams[i],
+            'team_id': sim_teams[i].team_id,
+            'division_id': sim_teams[i].division_id,
+            'wins': wins,
+            'ties': ties,
+            'losses': len(outcomes) - wins - ties,
+            'points_for': points_for[i][r],
+            'points_against': points_against,
+            'schedule': schedule,
+            'outcomes': outcomes,
+            'win_pct': (wins + ties / 2) / max(len(outcomes), 1),
+        }
+
+    def break_tie(group: List[int], r: int, draws: List, points_for: List) -> List[int]:
+        if points_first and len(set([points_for[i][r] for i in group])) == len(group):
+            return sorted(group, key=lambda i: points_for[i][r], reverse=True)
+        sorted_data = sort_team_data_list([team_data(i, r, draws, points_for) for i in group], tiebreakers)
+        return [index[data['team_id']] for data in sorted_data]
+
+    def rank(members: List[int], win_pct: List[float], r: int, draws: List, points_for: List) -> List[int]:
+        ranked = []
+        for _, group in groupby(sorted(members, key=lambda i: win_pct[i], reverse=True), key=lambda i: win_pct[i]):
+            group = list(group)
+            ranked += group if len(group) == 1 else break_tie(group, r, draws, points_for)
+        return ranked
+
+    for batch_start in range(0, n, BATCH_SIZE):
+        size = min(BATCH_SIZE, n - batch_start)
+        record = [[base_record[i]] * size for i in range(team_count)]
+        points_for = [[base_points_for[i]] * size for i in range(team_count)]
+        draws = []
+        for (week, i, j), ((offset_i, mean_i, stdev_i), (offset_j, mean_j, stdev_j)) in zip(remaining, draw_params):
+            scores_i = [offset_i + max(gauss(mean_i, stdev_i), 0) for _ in range(size)]
+            scores_j = [offset_j + max(gauss(mean_j, stdev_j), 0) for _ in range(size)]
+            draws.append((scores_i, scores_j))
+            record[i] = [total + (x > y) + (x >= y) for total, x, y in zip(record[i], scores_i, scores_j)]
+            record[j] = [total + (y > x) + (y >= x) for total, x, y in zip(record[j], scores_i, scores_j)]
+            points_for[i] = [total + x for total, x in zip(points_for[i], scores_i)]
+            points_for[j] = [total + y for total, y in zip(points_for[j], scores_j)]
+
+        for r in range(size):
+            win_pct = [record[i][r] / 2 / max(games[i], 1) for i in range(team_count)]
+            division_winners = []
+            for members in division_members:
+                if not members:
+                    continue
+                best = max([win_pct[i] for i in members])
+                leaders = [i for i in members if win_pct[i] == best]
+                division_winners.append(leaders[0] if len(leaders) == 1 else break_tie(leaders, r, draws, points_for)[0])
+            winners = set(division_winners)
+            standings = rank(division_winners, win_pct, r, draws, points_for) + rank([i for i in range(team_count) if i not in winners], win_pct, r, draws, points_for)
+            for seed, i in enumerate(standings):
+                counts['seed'][i][seed] += 1
+                if seed < playoff_team_count:
+                    counts['playoff'][i] += 1
+                if seed < bye_count:
+                    counts['bye'][i] += 1
+    return counts
+
+
+def simulate_season(teams: List, settings, n: int = 10000, processes: int = 1, seed: int = None,
+                    current_week: int = None, projections: Dict[int, float] = None) -> Dict:
+    '''Simulates the remaining regular season n times
+
+    Remaining matchups are drawn from a normal distribution of each teams completed scores
+    and seeded with the leagues playoff tiebreaker rules. A matchup still in progress in
+    current_week keeps the points already scored and only draws the remainder, centred on
+    the teams projected score when projections are given.
+
+    Args:
+        teams (List[Team]): Teams in the league
+        settings (Settings): League settings
+        n (int): Number of simulated seasons
+        processes (int): Number of worker processes to split the simulations across
+        seed (int): Optional random seed for reproducible results
+        current_week (int): Week in progress, its partial scores are kept
+        projections (Dict[int, float]): Projected final score of the current week by team id
+
+    Returns:
+        Dict[Team, Dict]: playoff_pct, bye_pct and seed_pct (list indexed by seed - 1) for each team
+    '''
+    state = build_season_state(teams, settings, current_week, projections)
+    team_count = len(teams)
+    processes = max(1, min(processes, n))
+
+    chunks = [n // processes + (1 if i < n % processes else 0) for i in range(processes)]
+    seeds = [None if seed is None else seed + i for i in range(processes)]
+    if processes == 1:
+        results = [_simulate_chunk(state, chunks[0], seeds[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            results = list(executor.map(_simulate_chunk, [state] * processes, chunks, seeds))
+
+    simulation = {}
+    for i, team in enumerate(teams):
+        playoff = sum([result['playoff'][i] for result in results])
+        bye = sum([result['bye'][i] for result in results])
+        seeds_count = [sum([result['seed'][i][s] for result in results]) for s in range(team_count)]
+        simulation[team] = {
+            'playoff_pct': round(playoff / n * 100, 2),
+            'bye_pct': round(bye / n * 100, 2),
+            'seed_pct': [round(count / n * 100, 2) for count in seeds_count],
+        }
+    return simulation
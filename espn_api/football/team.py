@@ -1,16 +1,33 @@
+from typing import List
+
 from .player import Player
+from .changes import RosterMove
 from .constant import PLAYER_STATS_MAP
 
 class Team(object):
     '''Teams are part of the league'''
     def __init__(self, data, roster, schedule, year, **kwargs):
+        self.division_name = '' # set by caller
+        self._fetch_info(data, kwargs.get('owners', []))
+        self.roster = []
+        self.schedule = []
+        self.scores = []
+        self.outcomes = []
+        self.mov = []
+        self._fetch_schedule(schedule)
+        self._fetch_roster(roster, year, kwargs.get('pro_schedule'))
+
+    def __repr__(self):
+        return 'Team(%s)' % (self.team_name, )
+
+    def _fetch_info(self, data, owners):
+        '''Fetch teams name, record and counters'''
         self.team_id = data['id']
         self.team_abbrev = data['abbrev']
         self.team_name = data.get('name', 'Unknown')
         if self.team_name == 'Unknown':
             self.team_name = "%s %s" % (data.get('location', 'Unknown'), data.get('nickname', 'Unknown'))
         self.division_id = data['divisionId']
-        self.division_name = '' # set by caller
         self.wins = data['record']['overall']['wins']
         self.losses = data['record']['overall']['losses']
         self.ties = data['record']['overall']['ties']
@@ -32,19 +49,9 @@ class Team(object):
             self.logo_url = data['logo']
         else:
             self.logo_url = ''
-        self.roster = []
-        self.schedule = []
-        self.scores = []
-        self.outcomes = []
-        self.mov = []
-        self._fetch_schedule(schedule)
-        self._fetch_roster(roster, year, kwargs.get('pro_schedule'))
-        self.owners = kwargs.get('owners', [])
+        self.owners = owners
         self.stats = {PLAYER_STATS_MAP.get(int(i), i): j for i, j in data.get('valuesByStat', {}).items()}
 
-    def __repr__(self):
-        return 'Team(%s)' % (self.team_name, )
-    
     def _fetch_roster(self, data, year, pro_schedule = None):
         '''Fetch teams roster'''
         self.roster.clear()
@@ -53,8 +60,35 @@ class Team(object):
         for player in roster:
             self.roster.append(Player(player, year, pro_schedule))
 
+    def _update_roster(self, data, previous, year, pro_schedule = None) -> List[RosterMove]:
+        '''Re-parse only roster entries that differ from previous, players staying on the roster keep their instance'''
+        previous_entries = {entry['playerId']: entry for entry in previous.get('entries', [])}
+        players = {player.playerId: player for player in self.roster}
+        roster = []
+        moves = []
+
+        for entry in data.get('entries', []):
+            player = players.pop(entry['playerId'], None)
+            if player is None:
+                player = Player(entry, year, pro_schedule)
+                moves.append(RosterMove(self, player, 'ADDED', new_slot=player.lineupSlot))
+            elif entry != previous_entries.get(entry['playerId']):
+                updated = Player(entry, year, pro_schedule)
+                if updated.lineupSlot != player.lineupSlot:
+                    moves.append(RosterMove(self, player, 'MOVED', player.lineupSlot, updated.lineupSlot))
+                vars(player).update(vars(updated))
+            roster.append(player)
+
+        for player in players.values():
+            moves.append(RosterMove(self, player, 'DROPPED', old_slot=player.lineupSlot))
+        self.roster[:] = roster
+        return moves
+
     def _fetch_schedule(self, data):
         '''Fetch schedule and scores for team'''
+        self.schedule.clear()
+        self.scores.clear()
+        self.outcomes.clear()
 
         for matchup in data:
             home_team = matchup.get('home', {})
@@ -9,6 +9,7 @@ from .matchup import Matchup
 from .player import Player
 from .team import Team
 from ..base_league import BaseLeague
+from ..base_settings import scoring_period_matchups
 
 
 class League(BaseLeague):
@@ -42,12 +43,15 @@ class League(BaseLeague):
                 else:
                     self.matchup_ids[matchup_period] = sorted(
                         set(self.matchup_ids[matchup_period] + list(scoring_periods)))
+        self.matchup_id_by_scoring_id = scoring_period_matchups(self.matchup_ids)
 
     def _fetch_teams(self, data):
         '''Fetch teams in league'''
         super()._fetch_teams(data, TeamClass=Team)
+        self._resolve_opponents()
 
-        # replace opponentIds in schedule with team instances
+    def _resolve_opponents(self):
+        '''Replace opponentIds in schedule with team instances'''
         for team in self.teams:
             team.division_name = self.settings.division_map.get(team.division_id, '')
             for week, matchup in enumerate(team.schedule):
@@ -57,7 +61,6 @@ class League(BaseLeague):
                     if matchup.home_team == opponent.team_id:
                         matchup.home_team = opponent
 
-
     def standings(self) -> List[Team]:
         '''Fetch teams in league sorted by standing'''
         standings = sorted(self.teams, key=lambda x: x.final_standing if x.final_standing != 0 else x.standing,
@@ -157,10 +160,7 @@ class League(BaseLeague):
             scoring_id = self.matchup_ids[matchup_period][-1] if matchup_period in self.matchup_ids else 1
         elif scoring_period and scoring_period <= scoring_id:
             scoring_id = scoring_period
-            for matchup in self.matchup_ids.keys():
-                if str(scoring_id) in self.matchup_ids[matchup]:
-                    matchup_id = matchup
-                    break
+            matchup_id = self.matchup_id_by_scoring_id.get(str(scoring_id), matchup_id)
 
         params = {
             'view': ['mMatchupScore', 'mScoreboard'],
@@ -0,0 +1,95 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+from .base_league import BaseLeague
+
+
+class LeagueHistory(object):
+    '''Loads every previous season of a league concurrently and builds all-time records'''
+    def __init__(self, league: BaseLeague, max_workers: int = 8, fetch_seasons=True):
+        self.league = league
+        self.league_id = league.league_id
+        self.max_workers = max_workers
+        self.seasons: Dict[int, BaseLeague] = {league.year: league}
+        # endpoint style (seasons or leagueHistory) that answered for each year
+        self.endpoint_styles: Dict[int, str] = {league.year: league.espn_request.endpoint_style}
+
+        if fetch_seasons:
+            self.fetch_seasons()
+
+    def __repr__(self):
+        return f'LeagueHistory({self.league_id}, {self.years})'
+
+    @property
+    def years(self) -> List[int]:
+        return sorted(self.seasons.keys())
+
+    def _fetch_season(self, year: int) -> BaseLeague:
+        cookies = self.league.espn_request.cookies or {}
+        league = type(self.league)(self.league_id, year, espn_s2=cookies.get('espn_s2'), swid=cookies.get('SWID'), fetch_league=False)
+        # the shared endpoint cache already points the request at the endpoint that worked last time
+        league.fetch_league()
+        self.endpoint_styles[year] = league.espn_request.endpoint_style
+        return league
+
+    def fetch_seasons(self, years: List[int] = None) -> None:
+        '''Loads previous seasons, all of league.previousSeasons by default'''
+        if years is None:
+            years = self.league.previousSeasons
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for league in executor.map(self._fetch_season, years):
+                self.seasons[league.year] = league
+
+    def records(self) -> Dict[int, Dict]:
+        '''Returns all-time record for every team id across loaded seasons'''
+        records = {}
+        for year in self.years:
+            for team in self.seasons[year].teams:
+                record = records.setdefault(team.team_id, {'team_name': team.team_name, 'seasons': 0, 'wins': 0, 'losses': 0, 'ties': 0, 'championships': 0})
+                # use the most recent team name
+                record['team_name'] = team.team_name
+                record['seasons'] += 1
+                record['wins'] += team.wins
+                record['losses'] += team.losses
+                record['ties'] += team.ties
+                if team.final_standing == 1:
+                    record['championships'] += 1
+        return records
+
+    def head_to_head(self) -> Dict[int, Dict[int, Dict]]:
+        '''Returns all-time wins, losses and ties of each team id against every opponent team id'''
+        h2h = {}
+        for year in self.years:
+            for team in self.seasons[year].teams:
+                for (opponent, outcome) in self._team_results(team):
+                    if opponent is None or opponent.team_id == team.team_id:
+                        continue
+                    record = h2h.setdefault(team.team_id, {}).setdefault(opponent.team_id, {'wins': 0, 'losses': 0, 'ties': 0})
+                    if outcome == 'W':
+                        record['wins'] += 1
+                    elif outcome == 'L':
+                        record['losses'] += 1
+                    elif outcome == 'T':
+                        record['ties'] += 1
+        return h2h
+
+    def _team_results(self, team) -> List:
+        '''Returns (opponent, outcome) for each matchup in a teams schedule'''
+        # football teams store opponents with matching outcomes
+        if hasattr(team, 'outcomes'):
+            return list(zip(team.schedule, team.outcomes))
+
+        results = []
+        for matchup in team.schedule:
+            is_home = matchup.home_team is team
+            opponent = matchup.away_team if is_home else matchup.home_team
+            if not hasattr(opponent, 'team_id'):
+                opponent = None
+            if matchup.winner == 'TIE':
+                outcome = 'T'
+            elif matchup.winner == 'UNDECIDED':
+                outcome = 'U'
+            else:
+                outcome = 'W' if (matchup.winner == 'HOME') == is_home else 'L'
+            results.append((opponent, outcome))
+        return results
@@ -0,0 +1,172 @@
+import mmap
+import struct
+import threading
+import time
+from array import array
+from collections.abc import Mapping
+from typing import Callable, Hashable, List
+
+from .player_search import PlayerSearchIndex, normalize_name
+
+MAGIC = b'ESPNPOOL'
+# magic, player count, names blob length
+HEADER = struct.Struct('<8sII')
+
+
+class PlayerPool(Mapping):
+    '''Every pro player of a season stored column wise: parallel arrays of id, proTeamId and defaultPositionId
+    and one utf-8 blob of names, with hash indexes by id and by normalized name.
+
+    Still reads like the old two way player_map, pool[player_id] is the name and pool[name] the id of the first
+    player with that name, use ids_by_name for every player sharing a name.
+    The pool is immutable so one can be shared by every league of a season.
+    A previous pool of the same season lets the search index be rebuilt only for players that changed'''
+    def __init__(self, players: List[dict] = (), previous: 'PlayerPool' = None):
+        names = [player['fullName'].encode('utf-8') for player in players]
+        offsets = [0]
+        for name in names:
+            offsets.append(offsets[-1] + len(name))
+        self._set_columns(array('q', [player['id'] for player in players]),
+                          array('I', offsets),
+                          array('i', [player.get('proTeamId', 0) for player in players]),
+                          array('h', [player.get('defaultPositionId', 0) for player in players]),
+                          b''.join(names))
+        self._previous_index = previous._search_index if previous is not None else None
+
+    def _set_columns(self, ids, offsets, pro_teams, positions, names) -> None:
+        self.ids = ids
+        self.pro_teams = pro_teams
+        self.positions = positions
+        self._offsets = offsets
+        self._names = names
+        self._rows = {player_id: row for (row, player_id) in enumerate(ids)}
+        self._rows_by_name = {}
+        for row in range(len(ids)):
+            self._rows_by_name.setdefault(normalize_name(self._name(row)), []).append(row)
+        self._keys = None
+        self._search_index = None
+        self._previous_index = None
+
+    def __repr__(self):
+        return f'PlayerPool({len(self.ids)} players)'
+
+    def _name(self, row: int) -> str:
+        return str(self._names[self._offsets[row]:self._offsets[row + 1]], 'utf-8')
+
+    def name(self, player_id: int) -> str:
+        return self._name(self._rows[player_id])
+
+    def pro_team(self, player_id: int) -> int:
+        return self.pro_teams[self._rows[player_id]]
+
+    def position(self, player_id: int) -> int:
+        return self.positions[self._rows[player_id]]
+
+    def ids_by_name(self, name: str) -> List[int]:
+        '''Ids of every player whose name normalizes to the same as name'''
+        return [self.ids[row] for row in self._rows_by_name.get(normalize_name(name), [])]
+
+    @property
+    def names(self) -> List[str]:
+        return [self._name(row) for row in range(len(self.ids))]
+
+    @property
+    def search_index(self) -> PlayerSearchIndex:
+        '''Name search index, built on first use'''
+        if self._search_index is None:
+            self._search_index = PlayerSearchIndex(zip(self.ids, self.names), previous=self._previous_index)
+            self._previous_index = None
+        return self._search_index
+
+    def search(self, query: str, limit: int = 10, min_score: float = 0.3) -> List[tuple]:
+        return self.search_index.search(query, limit=limit, min_score=min_score)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            rows = self._rows_by_name.get(normalize_name(key))
+            if rows:
+                return self.ids[rows[0]]
+        elif key in self._rows:
+            return self._name(self._rows[key])
+        raise KeyError(key)
+
+    def __contains__(self, key) -> bool:
+        if isinstance(key, str):
+            return normalize_name(key) in self._rows_by_name
+        return key in self._rows
+
+    def _mapping_keys(self) -> list:
+        # the keys of the old two way map, every id then the first spelling of each name
+        if self._keys is None:
+            names = [self._name(rows[0]) for rows in self._rows_by_name.values()]
+            self._keys = list(self.ids) + names
+        return self._keys
+
+    def __iter__(self):
+        return iter(self._mapping_keys())
+
+    def __len__(self) -> int:
+        return len(self._mapping_keys())
+
+    def to_bytes(self) -> bytes:
+        return b''.join([HEADER.pack(MAGIC, len(self.ids), len(self._names)), self.ids.tobytes(), self._offsets.tobytes(),
+                         self.pro_teams.tobytes(), self.positions.tobytes(), bytes(self._names)])
+
+    @classmethod
+    def from_bytes(cls, data) -> 'PlayerPool':
+        '''Pool reading its columns straight from data, a bytes or mmap buffer, without copying them'''
+        view = memoryview(data)
+        (magic, count, names_length) = HEADER.unpack_from(view)
+        if magic != MAGIC:
+            raise Exception('Not a serialized PlayerPool')
+        columns = []
+        offset = HEADER.size
+        for (code, length) in (('q', count), ('I', count + 1), ('i', count), ('h', count)):
+            size = struct.calcsize(code) * length
+            columns.append(view[offset:offset + size].cast(code))
+            offset += size
+        pool = cls.__new__(cls)
+        pool._set_columns(*columns, view[offset:offset + names_length])
+        return pool
+
+    def save(self, path: str) -> None:
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> 'PlayerPool':
+        '''Memory maps a pool written by save, processes loading the same file share its pages'''
+        with open(path, 'rb') as f:
+            return cls.from_bytes(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def __reduce__(self):
+        return (PlayerPool.from_bytes, (self.to_bytes(),))
+
+
+class PlayerPoolCache(object):
+    '''Shares one PlayerPool per key, usually (sport, year), between leagues for max_age seconds'''
+    def __init__(self, max_age: int = 3600):
+        self.max_age = max_age
+        self._pools = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f'PlayerPoolCache({len(self._pools)} pools)'
+
+    def __len__(self):
+        return len(self._pools)
+
+    def get(self, key: Hashable, load: Callable[[PlayerPool], PlayerPool]) -> PlayerPool:
+        '''Returns the cached pool for key or the one returned by load, which is passed the expired pool if any'''
+        with self._lock:
+            (pool, created) = self._pools.get(key, (None, 0))
+        if pool is not None and time.time() - created < self.max_age:
+            return pool
+        pool = load(pool)
+        with self._lock:
+            self._pools[key] = (pool, time.time())
+        return pool
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pools.clear()
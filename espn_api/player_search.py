@@ -0,0 +1,111 @@
+import re
+import unicodedata
+from bisect import bisect_left
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Tuple
+
+PUNCTUATION = re.compile(r"[.'`’]")
+NON_WORD = re.compile(r'[^a-z0-9]+')
+# generational suffixes ignored when matching, Patrick Mahomes II is found as patrick mahomes
+SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv', 'v'}
+
+
+def normalize_name(name: str) -> str:
+    '''Lowercase ascii name with punctuation and repeated whitespace removed, D.J.  Moore -> dj moore'''
+    name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode('ascii').lower()
+    return NON_WORD.sub(' ', PUNCTUATION.sub('', name)).strip()
+
+
+def name_tokens(name: str) -> List[str]:
+    '''Words of the normalized name without generational suffixes'''
+    tokens = normalize_name(name).split()
+    return [token for token in tokens if token not in SUFFIXES] or tokens
+
+
+def trigrams(key: str) -> frozenset:
+    padded = f'  {key} '
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+class PlayerSearchIndex(object):
+    '''Autocomplete and fuzzy name search over (player_id, name) pairs.
+
+    Scores are between 0 and 1: 1 for the same name ignoring case, punctuation and suffixes,
+    0.5 to 0.9 when every query word starts a word of the name, and up to 0.8 for misspellings.
+    Misspelling candidates are found by shared trigrams and the best of them scored by edit similarity.
+    Building from a previous index only tokenizes players that are new or renamed'''
+    def __init__(self, players: Iterable[Tuple[int, str]], previous: 'PlayerSearchIndex' = None):
+        known = previous._entries if previous else {}
+        # player_id -> (name, key, tokens, trigrams)
+        self._entries = {}
+        for (player_id, name) in players:
+            entry = known.get(player_id)
+            if entry is None or entry[0] != name:
+                tokens = name_tokens(name)
+                key = ' '.join(tokens)
+                entry = (name, key, tokens, trigrams(key))
+            self._entries[player_id] = entry
+
+        self._exact = {}
+        self._trigrams = {}
+        words = []
+        for (player_id, (name, key, tokens, grams)) in self._entries.items():
+            self._exact.setdefault(key, []).append(player_id)
+            words.extend((token, player_id) for token in tokens)
+            for gram in grams:
+                self._trigrams.setdefault(gram, []).append(player_id)
+        words.sort()
+        self._words = [word for (word, _) in words]
+        self._word_ids = [player_id for (_, player_id) in words]
+
+    def __repr__(self):
+        return f'PlayerSearchIndex({len(self._entries)} players)'
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _prefixed(self, prefix: str) -> set:
+        '''Ids of players with a word starting with prefix'''
+        start = bisect_left(self._words, prefix)
+        end = bisect_left(self._words, prefix + '\x7f', lo=start)
+        return set(self._word_ids[start:end])
+
+    def search(self, query: str, limit: int = 10, min_score: float = 0.3) -> List[Tuple[int, str, float]]:
+        '''Best matching (player_id, name, score) for a full or partial name, highest score first'''
+        tokens = name_tokens(query)
+        if not tokens:
+            return []
+        key = ' '.join(tokens)
+        scores: Dict[int, float] = {}
+
+        for player_id in self._exact.get(key, []):
+            scores[player_id] = 1.0
+
+        candidates = self._prefixed(tokens[0])
+        for token in tokens[1:]:
+            candidates &= self._prefixed(token)
+        for player_id in candidates:
+            if player_id not in scores:
+                scores[player_id] = 0.5 + 0.4 * min(len(key) / len(self._entries[player_id][1]), 1)
+
+        grams = trigrams(key)
+        shared = {}
+        for gram in grams:
+            for player_id in self._trigrams.get(gram, ()):
+                shared[player_id] = shared.get(player_id, 0) + 1
+        # only the closest by trigrams are worth the slower edit similarity
+        closest = sorted(shared, key=lambda player_id: -2 * shared[player_id] / (len(grams) + len(self._entries[player_id][3])))
+        matcher = SequenceMatcher(b=key, autojunk=False)
+        for player_id in closest[:max(limit * 2, 10)]:
+            matcher.set_seq1(self._entries[player_id][1])
+            score = 0.8 * matcher.ratio()
+            if score >= min_score and score > scores.get(player_id, 0):
+                scores[player_id] = score
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], self._entries[item[0]][1]))[:limit]
+        return [(player_id, self._entries[player_id][0], round(score, 3)) for (player_id, score) in ranked if score >= min_score]
+
+    def match(self, name: str, min_score: float = 0.6):
+        '''Id of the closest player to name, None if nothing scores min_score'''
+        results = self.search(name, limit=1, min_score=min_score)
+        return results[0][0] if results else None
@@ -0,0 +1,78 @@
+from collections.abc import Mapping
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+
+# games have no end time in the payload, assume one lasts this long
+GAME_LENGTH = timedelta(hours=3)
+
+
+class TeamSchedule(Mapping):
+    '''One pro team's season as scoring period -> {'team': opponent, 'date': datetime}.
+    The same instance is shared by every player on the pro team so it can't be changed'''
+    __slots__ = ('_games',)
+
+    def __init__(self, games: dict):
+        self._games = games
+
+    def __getitem__(self, scoring_period):
+        return self._games[scoring_period]
+
+    def __iter__(self):
+        return iter(self._games)
+
+    def __len__(self):
+        return len(self._games)
+
+    def __repr__(self):
+        return f'TeamSchedule({self._games})'
+
+
+class ProSchedule(dict):
+    '''proTeamSchedules_wl games by pro team id, {pro_team_id: {scoring_period: [games]}}.
+    Each pro team's TeamSchedule and each scoring period's games are indexed once and reused'''
+    def __init__(self, pro_teams: list = ()):
+        super().__init__((team['id'], team.get('proGamesByScoringPeriod', {})) for team in pro_teams)
+        self._team_schedules = {}
+        self._period_games = {}
+
+    def game(self, pro_team_id: int, scoring_period: int) -> Optional[dict]:
+        '''The pro team's first game of the scoring period, None on a bye'''
+        games = self.get(pro_team_id, {}).get(str(scoring_period))
+        return games[0] if games else None
+
+    def period_games(self, scoring_period: int) -> Dict[int, Tuple[int, int]]:
+        '''{pro_team_id: (opponent_id, date in ms)} for every pro team playing in the scoring period'''
+        key = str(scoring_period)
+        if key not in self._period_games:
+            games = {}
+            for (pro_team_id, team_games) in self.items():
+                if pro_team_id != 0 and team_games.get(key):
+                    game = team_games[key][0]
+                    opponent = game['homeProTeamId'] if pro_team_id == game['awayProTeamId'] else game['awayProTeamId']
+                    games[pro_team_id] = (opponent, game['date'])
+            self._period_games[key] = games
+        return self._period_games[key]
+
+    def game_times(self, scoring_period: int) -> Optional[Tuple[datetime, datetime]]:
+        '''When the first game of the scoring period starts and the last one should end, None without games'''
+        dates = [date for (_, date) in self.period_games(scoring_period).values()]
+        if not dates:
+            return None
+        return (datetime.fromtimestamp(min(dates) / 1000.0), datetime.fromtimestamp(max(dates) / 1000.0) + GAME_LENGTH)
+
+
+def team_schedule(pro_schedule: dict, pro_team_id: int, team_names: dict) -> TeamSchedule:
+    '''TeamSchedule of pro_team_id with opponents named by team_names, cached when pro_schedule is a ProSchedule'''
+    cache = getattr(pro_schedule, '_team_schedules', None)
+    if cache is not None and pro_team_id in cache:
+        return cache[pro_team_id]
+
+    games = {}
+    for (scoring_period, period_games) in pro_schedule.get(pro_team_id, {}).items():
+        game = period_games[0]
+        opponent = game['awayProTeamId'] if game['awayProTeamId'] != pro_team_id else game['homeProTeamId']
+        games[scoring_period] = {'team': team_names[opponent], 'date': datetime.fromtimestamp(game['date'] / 1000.0)}
+    schedule = TeamSchedule(games)
+    if cache is not None:
+        cache[pro_team_id] = schedule
+    return schedule
@@ -1,3 +1,9 @@
-__all__ = ['EspnFantasyRequests']
+__all__ = ['EspnFantasyRequests', 'ResponseStore', 'EndpointCache', 'RetryPolicy', 'CircuitBreaker', 'RateLimiter', 'MetricsCollector', 'PrometheusExporter', 'PeriodCache']
 
-from .espn_requests import EspnFantasyRequests
\ No newline at end of file
+from .espn_requests import EspnFantasyRequests
+from .response_store import ResponseStore
+from .endpoint_cache import EndpointCache
+from .retry import RetryPolicy, CircuitBreaker
+from .rate_limit import RateLimiter
+from .metrics import MetricsCollector, PrometheusExporter
+from .period_cache import PeriodCache
@@ -1,5 +1,10 @@
 FANTASY_BASE_ENDPOINT = 'https://lm-api-reads.fantasy.espn.com/apis/v3/games/'
 NEWS_BASE_ENDPOINT = 'https://site.api.espn.com/apis/fantasy/v3/games/'
+# environment variables overriding the base endpoints, e.g. to route through a caching proxy
+FANTASY_BASE_ENDPOINT_ENV = 'ESPN_FANTASY_BASE_ENDPOINT'
+NEWS_BASE_ENDPOINT_ENV = 'ESPN_NEWS_BASE_ENDPOINT'
+# (connect, read) timeout in seconds
+DEFAULT_TIMEOUT = (5, 30)
 FANTASY_SPORTS = {
     'nfl' : 'ffl',
     'nba' : 'fba',
@@ -0,0 +1,96 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+ACCESS_DENIED = 'denied'
+INVALID_LEAGUE = 'invalid'
+
+
+def cookies_hash(cookies: dict = None) -> str:
+    '''Short fingerprint of the cookies so a denied entry only applies to the same credentials'''
+    return hashlib.sha256(json.dumps(cookies or {}, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
+
+class EndpointCache(object):
+    '''Remembers which league endpoint style (seasons or leagueHistory) works for a (sport, league_id, year)
+
+    Leagues that were denied or don't exist are negatively cached for negative_ttl seconds.
+    If a path is given the cache is persisted as json and shared with other processes.
+    '''
+    def __init__(self, path: str = None, negative_ttl: int = 300):
+        self.path = path
+        self.negative_ttl = negative_ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+        if self.path:
+            self._entries = self._load()
+
+    def __repr__(self):
+        return f'EndpointCache({self.path})'
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _key(sport: str, league_id: int, year: int) -> str:
+        return f'{sport}:{league_id}:{year}'
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _save(self, merge: bool = True) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        entries = self._entries
+        if merge:
+            # keep entries written by other processes
+            entries = self._load()
+            entries.update(self._entries)
+            self._entries = entries
+        (fd, tmp) = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(entries, f)
+        os.replace(tmp, self.path)
+
+    def _set(self, key: str, entry: dict) -> None:
+        with self._lock:
+            if self._entries.get(key) == entry:
+                return
+            self._entries[key] = entry
+            if self.path:
+                self._save()
+
+    def get_style(self, sport: str, league_id: int, year: int) -> str:
+        '''Returns the endpoint style known to work or None'''
+        return self._entries.get(self._key(sport, league_id, year), {}).get('style')
+
+    def set_style(self, sport: str, league_id: int, year: int, style: str) -> None:
+        self._set(self._key(sport, league_id, year), {'style': style})
+
+    def get_error(self, sport: str, league_id: int, year: int, cookies: dict = None) -> str:
+        '''Returns ACCESS_DENIED or INVALID_LEAGUE if the league recently failed'''
+        entry = self._entries.get(self._key(sport, league_id, year), {})
+        if 'error' not in entry or entry['expires'] < time.time():
+            return None
+        if entry['error'] == ACCESS_DENIED and entry.get('auth') != cookies_hash(cookies):
+            return None
+        return entry['error']
+
+    def set_error(self, sport: str, league_id: int, year: int, error: str, cookies: dict = None) -> None:
+        entry = {'error': error, 'expires': time.time() + self.negative_ttl}
+        if error == ACCESS_DENIED:
+            entry['auth'] = cookies_hash(cookies)
+        self._set(self._key(sport, league_id, year), entry)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = {}
+            if self.path:
+                self._save(merge=False)
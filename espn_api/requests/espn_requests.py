@@ -1,8 +1,25 @@
 import requests
 import json
-from .constant import FANTASY_BASE_ENDPOINT, NEWS_BASE_ENDPOINT, FANTASY_SPORTS
+import os
+import threading
+import time
+from http.cookiejar import DefaultCookiePolicy
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlparse
+from .constant import FANTASY_BASE_ENDPOINT, NEWS_BASE_ENDPOINT, FANTASY_BASE_ENDPOINT_ENV, NEWS_BASE_ENDPOINT_ENV, FANTASY_SPORTS, DEFAULT_TIMEOUT
+from .retry import RetryPolicy, CircuitBreaker, RETRY_STATUSES
+from .rate_limit import RateLimiter
+from .response_store import ResponseStore, REPLAY, request_key
+from .period_cache import PeriodCache
+from .endpoint_cache import EndpointCache, ACCESS_DENIED, INVALID_LEAGUE, cookies_hash
+from .single_flight import SingleFlight
+from .metrics import MetricsCollector, RequestMetrics, request_view, HIT, MISS, COALESCED
 from ..utils.logger import Logger
-from typing import List
+from typing import Any, List, Tuple
+
+
+SEASONS = 'seasons'
+LEAGUE_HISTORY = 'leagueHistory'
 
 
 class ESPNAccessDenied(Exception):
@@ -17,47 +34,125 @@ class ESPNUnknownError(Exception):
     pass
 
 
+class ESPNReplayMiss(Exception):
+    pass
+
+
+class ESPNCircuitOpen(Exception):
+    pass
+
+
+def resolve_endpoint(endpoint: str, env: str, default: str) -> str:
+    '''Returns the endpoint if given, else the environment variable env, else default, always ending in a /'''
+    endpoint = endpoint or os.environ.get(env) or default
+    return endpoint if endpoint.endswith('/') else endpoint + '/'
+
+
+def new_session(pool_size: int = 20) -> requests.Session:
+    '''Session keeping up to pool_size connections per host alive so parallel requests reuse them.
+    Cookies set by responses are not kept, credentials are only ever sent per request'''
+    session = requests.Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
 class EspnFantasyRequests(object):
-    def __init__(self, sport: str, year: int, league_id: int, cookies: dict = None, logger: Logger = None):
+    # shared by every instance unless one is passed in
+    endpoint_cache = EndpointCache()
+    # one circuit breaker per host shared by every instance
+    circuit_breakers = {}
+    _circuit_breakers_lock = threading.Lock()
+    # set to a RateLimiter to throttle every instance, no limit by default
+    rate_limiter = None
+    # identical requests in flight at the same time share one response
+    single_flight = SingleFlight()
+    # set to a MetricsCollector to record every request, off by default
+    metrics = None
+    # pooled keep-alive connections shared by every instance unless one is passed in
+    session = new_session()
+    # set to a PeriodCache to keep responses for finished scoring periods forever, off by default
+    period_cache = None
+
+    def __init__(self, sport: str, year: int, league_id: int, cookies: dict = None, logger: Logger = None, store: ResponseStore = None,
+                 endpoint_cache: EndpointCache = None, timeout: tuple = DEFAULT_TIMEOUT, retry: RetryPolicy = None,
+                 rate_limiter: RateLimiter = None, metrics: MetricsCollector = None, base_endpoint: str = None,
+                 news_endpoint: str = None, session: requests.Session = None, period_cache: PeriodCache = None):
         if sport not in FANTASY_SPORTS:
             raise Exception(f'Unknown sport: {sport}, available options are {FANTASY_SPORTS.keys()}')
+        self.sport = sport
         self.year = year
         self.league_id = league_id
-        self.ENDPOINT = FANTASY_BASE_ENDPOINT + FANTASY_SPORTS[sport] + '/seasons/' + str(self.year)
-        self.NEWS_ENDPOINT = NEWS_BASE_ENDPOINT + FANTASY_SPORTS[sport] + '/news/' + 'players'
+        # explicit endpoints win over the environment, which wins over ESPN
+        self.base_endpoint = resolve_endpoint(base_endpoint, FANTASY_BASE_ENDPOINT_ENV, FANTASY_BASE_ENDPOINT)
+        self.news_endpoint = resolve_endpoint(news_endpoint, NEWS_BASE_ENDPOINT_ENV, NEWS_BASE_ENDPOINT)
+        self.ENDPOINT = self.base_endpoint + FANTASY_SPORTS[sport] + '/seasons/' + str(self.year)
+        self.NEWS_ENDPOINT = self.news_endpoint + FANTASY_SPORTS[sport] + '/news/' + 'players'
         self.cookies = cookies
         self.logger = logger
-
-        self.LEAGUE_ENDPOINT = FANTASY_BASE_ENDPOINT + FANTASY_SPORTS[sport]
-        # older season data is stored at a different endpoint
-        if year < 2018:
-            self.LEAGUE_ENDPOINT += "/leagueHistory/" + str(league_id) + "?seasonId=" + str(year)
+        self.store = store
+        self.timeout = timeout
+        self.retry = retry or RetryPolicy()
+        if rate_limiter is not None:
+            self.rate_limiter = rate_limiter
+        if metrics is not None:
+            self.metrics = metrics
+        if endpoint_cache is not None:
+            self.endpoint_cache = endpoint_cache
+        if session is not None:
+            self.session = session
+        if period_cache is not None:
+            self.period_cache = period_cache
+        # scoring periods of matchup periods that ended before this one are final,
+        # set by the league once it knows the current period and its schedule
+        self.live_scoring_period = None
+        self.matchup_periods = None
+
+        self.LEAGUE_BASE_ENDPOINT = self.base_endpoint + FANTASY_SPORTS[sport]
+        # older season data is stored at a different endpoint, use the one that last worked if known
+        style = self.endpoint_cache.get_style(sport, league_id, year)
+        self.set_endpoint_style(style or (LEAGUE_HISTORY if year < 2018 else SEASONS))
+
+    @property
+    def endpoint_style(self) -> str:
+        '''Which endpoint the league is currently requested from, either seasons or leagueHistory'''
+        return LEAGUE_HISTORY if "/leagueHistory/" in self.LEAGUE_ENDPOINT else SEASONS
+
+    def set_endpoint_style(self, style: str) -> None:
+        '''Points LEAGUE_ENDPOINT at the /seasons/ or /leagueHistory/ endpoint'''
+        if style == LEAGUE_HISTORY:
+            self.LEAGUE_ENDPOINT = f"{self.LEAGUE_BASE_ENDPOINT}/leagueHistory/{self.league_id}?seasonId={self.year}"
+        elif style == SEASONS:
+            self.LEAGUE_ENDPOINT = f"{self.LEAGUE_BASE_ENDPOINT}/seasons/{self.year}/segments/0/leagues/{self.league_id}"
         else:
-            self.LEAGUE_ENDPOINT += "/seasons/" + str(year) + "/segments/0/leagues/" + str(league_id)
+            raise Exception(f'Unknown endpoint style: {style}, available options are {[SEASONS, LEAGUE_HISTORY]}')
 
     def checkRequestStatus(self, status: int, extend: str = "", params: dict = None, headers: dict = None) -> dict:
         '''Handles ESPN API response status codes and endpoint format switching'''
         if status == 401:
-            # If the current LEAGUE_ENDPOINT was using the /leagueHistory/ endpoint, switch to "/seasons/" endpoint
-            if "/leagueHistory/" in self.LEAGUE_ENDPOINT:
-                base_endpoint = self.LEAGUE_ENDPOINT.split("/leagueHistory/")[0]
-                self.LEAGUE_ENDPOINT = f"{base_endpoint}/seasons/{self.year}/segments/0/leagues/{self.league_id}"
-            else:
-                # If the current LEAGUE_ENDPOINT was using /seasons, switch to the "/leagueHistory/" endpoint
-                base_endpoint = self.LEAGUE_ENDPOINT.split(f"/seasons/")[0]
-                self.LEAGUE_ENDPOINT = f"{base_endpoint}/leagueHistory/{self.league_id}?seasonId={self.year}"
+            # Switch between the /leagueHistory/ and /seasons/ endpoints
+            self.set_endpoint_style(SEASONS if self.endpoint_style == LEAGUE_HISTORY else LEAGUE_HISTORY)
 
             #try the alternate endpoint
-            r = requests.get(self.LEAGUE_ENDPOINT + extend, params=params, headers=headers, cookies=self.cookies)
+            (status_code, response) = self._get(self.LEAGUE_ENDPOINT + extend, params=params, headers=headers)
             
-            if r.status_code == 200:
+            if status_code == 200:
                 # Return the updated response if alternate works
-                return r.json()
+                self.endpoint_cache.set_style(self.sport, self.league_id, self.year, self.endpoint_style)
+                return response
                 
+            if status_code not in (401, 403):
+                # an outage or throttling of the alternate endpoint says nothing about access, don't cache it
+                raise ESPNUnknownError(f"ESPN returned an HTTP {status_code}")
+
             # If all endpoints failed, raise the corresponding error
-            raise ESPNAccessDenied(f"League {self.league_id} cannot be accessed with espn_s2={self.cookies.get('espn_s2')} and swid={self.cookies.get('SWID')}")
+            self.endpoint_cache.set_error(self.sport, self.league_id, self.year, ACCESS_DENIED, self.cookies)
+            raise self._access_denied()
 
         elif status == 404:
+            self.endpoint_cache.set_error(self.sport, self.league_id, self.year, INVALID_LEAGUE, self.cookies)
             raise ESPNInvalidLeague(f"League {self.league_id} does not exist")
 
         elif status != 200:
@@ -66,13 +161,156 @@ class EspnFantasyRequests(object):
         # If no issues with the status code, return None
         return None
         
+    def _get(self, endpoint: str, params: dict = None, headers: dict = None) -> Tuple[int, Any]:
+        '''Performs a GET request and returns the status code and decoded response.
+        Successful responses are recorded to or replayed from the response store if one is set
+        and concurrent identical requests are collapsed into one'''
+        start = time.perf_counter()
+        metrics = RequestMetrics(endpoint, request_view(params, endpoint), cache=HIT)
+        key = request_key(endpoint, params, headers)
+        # responses can differ by credentials so they are part of every stored key
+        credentials_key = key + cookies_hash(self.cookies)
+        if self.store and self.store.mode == REPLAY:
+            response = self.store.get(credentials_key)
+            if response is None:
+                raise ESPNReplayMiss(f"No recorded response for {endpoint} params: {params} headers: {headers}")
+            (metrics.status, metrics.elapsed) = (200, time.perf_counter() - start)
+            self._record_metrics(metrics)
+            return (200, response)
+
+        final_key = None
+        if self.period_cache and self.period_cache.is_final(params, self.live_scoring_period, self.matchup_periods):
+            final_key = credentials_key
+            response = self.period_cache.get(final_key)
+            if response is not None:
+                (metrics.status, metrics.elapsed) = (200, time.perf_counter() - start)
+                self._record_metrics(metrics)
+                return (200, response)
+
+        def fetch() -> Tuple[int, Any]:
+            metrics.cache = MISS
+            try:
+                (r, metrics.retries, metrics.ttfb) = self._get_with_retry(endpoint, params=params, headers=headers)
+                download_start = time.perf_counter()
+                content = r.content
+                metrics.download = time.perf_counter() - download_start
+            except Exception as e:
+                (metrics.error, metrics.elapsed) = (repr(e), time.perf_counter() - start)
+                self._record_metrics(metrics)
+                raise
+
+            decode_start = time.perf_counter()
+            try:
+                response = r.json()
+            except ValueError as e:
+                # error pages aren't json, their status is handled by the caller
+                if r.status_code == 200:
+                    (metrics.status, metrics.error, metrics.elapsed) = (r.status_code, repr(e), time.perf_counter() - start)
+                    self._record_metrics(metrics)
+                    raise ESPNUnknownError(f"ESPN returned a response that isn't json for {endpoint}") from e
+                response = None
+            metrics.decode = time.perf_counter() - decode_start
+
+            if self.store and r.status_code == 200:
+                self.store.put(credentials_key, response)
+            if final_key and r.status_code == 200 and response is not None:
+                self.period_cache.put(final_key, response)
+            (metrics.status, metrics.bytes, metrics.elapsed) = (r.status_code, len(content), time.perf_counter() - start)
+            self._record_metrics(metrics)
+            return (r.status_code, response)
+
+        # responses can differ by credentials so they are part of the in flight key
+        (status_code, response) = self.single_flight.do(credentials_key, fetch)
+        if metrics.cache == HIT:
+            # another thread made the request
+            (metrics.cache, metrics.status, metrics.elapsed) = (COALESCED, status_code, time.perf_counter() - start)
+            self._record_metrics(metrics)
+        return (status_code, response)
+
+    def _record_metrics(self, metrics: RequestMetrics) -> None:
+        if self.metrics:
+            self.metrics.record(metrics)
+
+    @classmethod
+    def get_circuit_breaker(cls, host: str) -> CircuitBreaker:
+        with cls._circuit_breakers_lock:
+            if host not in cls.circuit_breakers:
+                cls.circuit_breakers[host] = CircuitBreaker()
+            return cls.circuit_breakers[host]
+
+    def _get_with_retry(self, endpoint: str, params: dict = None, headers: dict = None) -> Tuple[requests.Response, int, float]:
+        '''Sends the request with timeouts, retrying connection errors, 429 and 5xx responses.
+        Returns the response, number of retries and seconds until the response headers arrived'''
+        host = urlparse(endpoint).netloc
+        breaker = self.get_circuit_breaker(host)
+
+        attempt = 0
+        while True:
+            if not breaker.allow_request():
+                raise ESPNCircuitOpen(f"Requests to {host} are paused after repeated failures")
+            if self.rate_limiter:
+                self.rate_limiter.acquire(host, news=endpoint.startswith(self.news_endpoint))
+            try:
+                start = time.perf_counter()
+                # stream so the body download can be timed separately
+                r = self.session.get(endpoint, params=params, headers=headers, cookies=self.cookies, timeout=self.timeout, stream=True)
+                ttfb = time.perf_counter() - start
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                breaker.record_failure()
+                if attempt >= self.retry.max_retries:
+                    raise
+                time.sleep(self.retry.backoff(attempt))
+                attempt += 1
+                continue
+            except Exception:
+                # anything else fails the request too, a half open trial must not leave the breaker half open
+                breaker.record_failure()
+                raise
+
+            # throttling isn't a sign ESPN is down so only server errors trip the breaker
+            if r.status_code >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+
+            if r.status_code not in RETRY_STATUSES or attempt >= self.retry.max_retries:
+                return (r, attempt, ttfb)
+            r.close()
+            time.sleep(self.retry.backoff(attempt, r.headers.get('Retry-After')))
+            attempt += 1
+
+    def _access_denied(self) -> ESPNAccessDenied:
+        cookies = self.cookies or {}
+        return ESPNAccessDenied(f"League {self.league_id} cannot be accessed with espn_s2={cookies.get('espn_s2')} and swid={cookies.get('SWID')}")
+
     def league_get(self, params: dict = None, headers: dict = None, extend: str = ''):
+        # fail fast if the league was recently denied or doesn't exist
+        error = self.endpoint_cache.get_error(self.sport, self.league_id, self.year, self.cookies)
+        if error == ACCESS_DENIED:
+            raise self._access_denied()
+        elif error == INVALID_LEAGUE:
+            raise ESPNInvalidLeague(f"League {self.league_id} does not exist")
+
         endpoint = self.LEAGUE_ENDPOINT + extend
-        r = requests.get(endpoint, params=params, headers=headers, cookies=self.cookies)
-        alternate_response = self.checkRequestStatus(r.status_code, extend=extend, params=params, headers=headers)
+        try:
+            (status_code, response) = self._get(endpoint, params=params, headers=headers)
+        except ESPNReplayMiss:
+            # the league may have been recorded after falling back to the other endpoint
+            style = self.endpoint_style
+            self.set_endpoint_style(SEASONS if style == LEAGUE_HISTORY else LEAGUE_HISTORY)
+            endpoint = self.LEAGUE_ENDPOINT + extend
+            try:
+                (status_code, response) = self._get(endpoint, params=params, headers=headers)
+            except ESPNReplayMiss:
+                # only keep the other style once it has served a response
+                self.set_endpoint_style(style)
+                raise
+        alternate_response = self.checkRequestStatus(status_code, extend=extend, params=params, headers=headers)
+        if status_code == 200:
+            self.endpoint_cache.set_style(self.sport, self.league_id, self.year, self.endpoint_style)
 
         
-        response = alternate_response if alternate_response else r.json()
+        response = alternate_response if alternate_response else response
 
         if self.logger:
             self.logger.log_request(endpoint=self.LEAGUE_ENDPOINT + extend, params=params, headers=headers, response=response)
@@ -81,20 +319,20 @@ class EspnFantasyRequests(object):
 
     def get(self, params: dict = None, headers: dict = None, extend: str = ''):
         endpoint = self.ENDPOINT + extend
-        r = requests.get(endpoint, params=params, headers=headers, cookies=self.cookies)
-        self.checkRequestStatus(r.status_code)
+        (status_code, response) = self._get(endpoint, params=params, headers=headers)
+        self.checkRequestStatus(status_code)
 
         if self.logger:
-            self.logger.log_request(endpoint=endpoint, params=params, headers=headers, response=r.json())
-        return r.json()
+            self.logger.log_request(endpoint=endpoint, params=params, headers=headers, response=response)
+        return response
         
     def news_get(self, params: dict = None, headers: dict = None, extend: str = ''):
         endpoint = self.NEWS_ENDPOINT + extend
-        r = requests.get(endpoint, params=params, headers=headers, cookies=self.cookies)
+        (status_code, response) = self._get(endpoint, params=params, headers=headers)
 
         if self.logger:
-            self.logger.log_request(endpoint=endpoint, params=params, headers=headers, response=r.json())
-        return r.json()
+            self.logger.log_request(endpoint=endpoint, params=params, headers=headers, response=response)
+        return response
 
     def get_league(self):
         '''Gets all of the leagues initial data (teams, roster, matchups, settings)'''
@@ -0,0 +1,96 @@
+import threading
+from typing import Callable, Dict, List
+from urllib.parse import urlparse
+
+HIT = 'hit'
+MISS = 'miss'
+COALESCED = 'coalesced'
+
+
+class RequestMetrics(object):
+    '''Timings and outcome of one ESPN request, times are in seconds'''
+    def __init__(self, endpoint: str, view: str, status: int = None, bytes: int = 0, elapsed: float = 0,
+                 ttfb: float = 0, download: float = 0, decode: float = 0, cache: str = MISS, retries: int = 0, error: str = None):
+        self.endpoint = endpoint
+        self.view = view
+        self.status = status
+        self.bytes = bytes
+        self.elapsed = elapsed
+        self.ttfb = ttfb
+        self.download = download
+        self.decode = decode
+        self.cache = cache
+        self.retries = retries
+        self.error = error
+
+    def __repr__(self):
+        return f'RequestMetrics({self.view}, status:{self.status}, elapsed:{round(self.elapsed, 3)}, cache:{self.cache})'
+
+    def to_dict(self) -> Dict:
+        return dict(self.__dict__)
+
+
+def request_view(params: dict = None, endpoint: str = '') -> str:
+    '''Name of the ESPN view(s) requested, falls back to the last part of the endpoint path'''
+    view = (params or {}).get('view')
+    if isinstance(view, list):
+        return ','.join(view)
+    return view or urlparse(endpoint).path.rstrip('/').rsplit('/', 1)[-1]
+
+
+class MetricsCollector(object):
+    '''Calls every registered callback with the RequestMetrics of each request and keeps per view totals'''
+    def __init__(self, callbacks: List[Callable[[RequestMetrics], None]] = None):
+        self.callbacks = list(callbacks or [])
+        self.views = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f'MetricsCollector({len(self.callbacks)} callbacks)'
+
+    def add_callback(self, callback: Callable[[RequestMetrics], None]) -> None:
+        self.callbacks.append(callback)
+
+    def record(self, metrics: RequestMetrics) -> None:
+        with self._lock:
+            view = self.views.setdefault(metrics.view, {'count': 0, 'errors': 0, 'bytes': 0, 'elapsed': 0, 'decode': 0, 'hits': 0, 'retries': 0})
+            view['count'] += 1
+            view['bytes'] += metrics.bytes
+            view['elapsed'] += metrics.elapsed
+            view['decode'] += metrics.decode
+            view['retries'] += metrics.retries
+            if metrics.cache != MISS:
+                view['hits'] += 1
+            if metrics.error or (metrics.status and metrics.status != 200):
+                view['errors'] += 1
+        for callback in self.callbacks:
+            callback(metrics)
+
+    def summary(self) -> Dict[str, Dict]:
+        '''Totals and average latency per view, slowest views first'''
+        with self._lock:
+            summary = {view: dict(totals, avg_elapsed=totals['elapsed'] / totals['count']) for view, totals in self.views.items()}
+        return dict(sorted(summary.items(), key=lambda item: item[1]['elapsed'], reverse=True))
+
+
+class PrometheusExporter(object):
+    '''MetricsCollector callback exporting request metrics with prometheus_client'''
+    def __init__(self, registry=None, namespace: str = 'espn_api'):
+        try:
+            from prometheus_client import Counter, Histogram, REGISTRY
+        except ImportError:
+            raise ImportError('PrometheusExporter requires prometheus_client, install it with pip install prometheus_client')
+        registry = registry or REGISTRY
+        labels = ['view', 'status', 'cache']
+        self.requests = Counter('requests', 'ESPN requests', labels, namespace=namespace, registry=registry)
+        self.bytes = Counter('response_bytes', 'ESPN response bytes', labels, namespace=namespace, registry=registry)
+        self.retries = Counter('retries', 'ESPN request retries', labels, namespace=namespace, registry=registry)
+        self.latency = Histogram('request_seconds', 'ESPN request latency', labels + ['phase'], namespace=namespace, registry=registry)
+
+    def __call__(self, metrics: RequestMetrics) -> None:
+        labels = (metrics.view, str(metrics.status), metrics.cache)
+        self.requests.labels(*labels).inc()
+        self.bytes.labels(*labels).inc(metrics.bytes)
+        self.retries.labels(*labels).inc(metrics.retries)
+        for phase in ('elapsed', 'ttfb', 'download', 'decode'):
+            self.latency.labels(*labels, phase).observe(getattr(metrics, phase))
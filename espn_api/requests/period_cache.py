@@ -0,0 +1,83 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from .response_store import ResponseStore
+
+# views whose response for a finished scoring period never changes
+FINAL_VIEWS = {'mMatchupScore', 'mScoreboard', 'mPositionalRatings', 'mTransactions2', 'mRoster', 'mMatchup'}
+
+
+def scoring_period(params: dict = None):
+    '''scoringPeriodId of the request as an int, None if it has none'''
+    value = (params or {}).get('scoringPeriodId')
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class PeriodCache(object):
+    '''Long lived cache of responses for scoring periods that are final.
+
+    A request is final when every view it asks for is in FINAL_VIEWS and every scoring period of the matchup
+    periods containing its scoringPeriodId is before the league's live scoring period, a daily sport's scoring
+    period isn't final while the rest of its matchup week is still being played.
+    Final responses are kept on disk in a ResponseStore, the most recently used ones are also kept in memory
+    as encoded json. ESPN still applies stat corrections for a few days after games end so responses are
+    fetched again once they are older than max_age seconds, None keeps them for good.
+    '''
+    def __init__(self, path: str, memory_size: int = 256, max_age: float = 7 * 24 * 3600):
+        self.store = ResponseStore(path)
+        self.memory_size = memory_size
+        self.max_age = max_age
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f'PeriodCache({self.store.path})'
+
+    @staticmethod
+    def is_final(params: dict, live_scoring_period: int, matchup_periods: dict = None) -> bool:
+        '''matchup_periods is {matchup period: [scoring periods]} from the league settings'''
+        if live_scoring_period is None:
+            return False
+        views = (params or {}).get('view')
+        views = views if isinstance(views, list) else [views]
+        period = scoring_period(params)
+        if period is None or period >= live_scoring_period or not all(view in FINAL_VIEWS for view in views):
+            return False
+        return all(max(periods) < live_scoring_period for periods in (matchup_periods or {}).values() if period in periods)
+
+    def _expired(self, stored: float) -> bool:
+        return self.max_age is not None and time.time() - stored > self.max_age
+
+    def get(self, key: str):
+        '''Returns the cached payload or None when it isn't cached or has expired'''
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+        if entry is not None:
+            (stored, encoded) = entry
+            # decoded per hit so callers never share a payload
+            return None if self._expired(stored) else json.loads(encoded)
+        entry = self.store.get(key)
+        if entry is None or self._expired(entry['stored']):
+            return None
+        self._remember(key, entry['stored'], entry['payload'])
+        return entry['payload']
+
+    def put(self, key: str, payload) -> None:
+        stored = time.time()
+        self.store.put(key, {'stored': stored, 'payload': payload})
+        self._remember(key, stored, payload)
+
+    def _remember(self, key: str, stored: float, payload) -> None:
+        encoded = json.dumps(payload, separators=(',', ':'))
+        with self._lock:
+            self._memory[key] = (stored, encoded)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
@@ -0,0 +1,112 @@
+import json
+import os
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - windows
+    fcntl = None
+
+
+class TokenBucket(object):
+    '''Thread safe token bucket refilled at rate tokens per second up to capacity'''
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f'TokenBucket(rate={self.rate}, capacity={self.capacity})'
+
+    def _take(self, tokens: float, state: dict, now: float) -> float:
+        '''Refills the state and takes tokens if available, returns seconds to wait otherwise'''
+        state['tokens'] = min(self.capacity, state['tokens'] + (now - state['updated']) * self.rate)
+        state['updated'] = now
+        if state['tokens'] >= tokens:
+            state['tokens'] -= tokens
+            return 0
+        return (tokens - state['tokens']) / self.rate
+
+    def _try_acquire(self, tokens: float) -> float:
+        with self._lock:
+            state = {'tokens': self.tokens, 'updated': self.updated}
+            wait = self._take(tokens, state, time.monotonic())
+            (self.tokens, self.updated) = (state['tokens'], state['updated'])
+            return wait
+
+    def acquire(self, tokens: float = 1, blocking: bool = True) -> bool:
+        '''Takes tokens from the bucket, waiting for them to refill if blocking'''
+        while True:
+            wait = self._try_acquire(tokens)
+            if wait == 0:
+                return True
+            if not blocking:
+                return False
+            time.sleep(wait)
+
+
+class FileTokenBucket(TokenBucket):
+    '''Token bucket stored in a locked file so worker processes on one machine share the budget'''
+    def __init__(self, rate: float, capacity: float, path: str):
+        if fcntl is None:
+            raise Exception('FileTokenBucket requires fcntl file locks which are not available on this platform')
+        super().__init__(rate, capacity)
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    def __repr__(self):
+        return f'FileTokenBucket(rate={self.rate}, capacity={self.capacity}, path={self.path})'
+
+    def _try_acquire(self, tokens: float) -> float:
+        with self._lock, open(self.path, 'a+') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    state = json.loads(f.read())
+                except ValueError:
+                    state = {'tokens': self.capacity, 'updated': time.time()}
+                # wall clock time since the state is shared between processes
+                wait = self._take(tokens, state, time.time())
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(state))
+                f.flush()
+                return wait
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class RateLimiter(object):
+    '''Token bucket per host. ESPN news has its own budget of news_limits separate from the fantasy api,
+    whichever host it is served from. Pass lock_dir to share the buckets between processes on the same machine'''
+    def __init__(self, rate: float = 5, capacity: float = 10, host_limits: dict = None, lock_dir: str = None,
+                 news_limits: tuple = (2, 5)):
+        self.rate = rate
+        self.capacity = capacity
+        self.host_limits = host_limits or {}
+        self.news_limits = news_limits
+        self.lock_dir = lock_dir
+        self.buckets = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f'RateLimiter(rate={self.rate}, capacity={self.capacity})'
+
+    def get_bucket(self, host: str, news: bool = False) -> TokenBucket:
+        # news and the fantasy api may be proxied through one host, they still get separate buckets
+        key = host + '-news' if news else host
+        with self._lock:
+            if key not in self.buckets:
+                (rate, capacity) = self.host_limits.get(key, self.news_limits if news else (self.rate, self.capacity))
+                if self.lock_dir:
+                    self.buckets[key] = FileTokenBucket(rate, capacity, os.path.join(self.lock_dir, key + '.bucket'))
+                else:
+                    self.buckets[key] = TokenBucket(rate, capacity)
+            return self.buckets[key]
+
+    def acquire(self, host: str, blocking: bool = True, news: bool = False) -> bool:
+        return self.get_bucket(host, news).acquire(blocking=blocking)
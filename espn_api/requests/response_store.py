@@ -0,0 +1,63 @@
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+
+RECORD = 'record'
+REPLAY = 'replay'
+
+
+def request_key(endpoint: str, params: dict = None, headers: dict = None) -> str:
+    '''Returns a content address for a request. Cookies aren't part of it, callers add a cookies_hash where responses differ by credentials'''
+    normalized = {
+        'endpoint': endpoint,
+        'params': {k: v if isinstance(v, list) else [v] for k, v in (params or {}).items()},
+        'filter': json.loads((headers or {}).get('x-fantasy-filter', 'null')),
+    }
+    return hashlib.sha256(json.dumps(normalized, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+class ResponseStore(object):
+    '''On disk store of ESPN responses saved as gzipped json and addressed by request
+
+    In record mode every successful response is written to the store, in replay mode
+    requests are only served from the store and never reach the network.
+    Files are written atomically so a store can be shared by multiple processes.
+    '''
+    def __init__(self, path: str, mode: str = RECORD):
+        if mode not in (RECORD, REPLAY):
+            raise Exception(f'Unknown store mode: {mode}, available options are {[RECORD, REPLAY]}')
+        self.path = path
+        self.mode = mode
+        os.makedirs(self.path, exist_ok=True)
+
+    def __repr__(self):
+        return f'ResponseStore({self.path}, {self.mode})'
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.path, key[:2], key + '.json.gz')
+
+    def __contains__(self, key: str) -> bool:
+        return os.path.exists(self._file(key))
+
+    def get(self, key: str):
+        '''Returns the stored payload or None if the request has not been recorded'''
+        try:
+            with gzip.open(self._file(key), 'rb') as f:
+                return json.loads(f.read())
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, payload) -> None:
+        '''Writes the payload to the store'''
+        file = self._file(key)
+        os.makedirs(os.path.dirname(file), exist_ok=True)
+        (fd, tmp) = tempfile.mkstemp(dir=os.path.dirname(file), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(gzip.compress(json.dumps(payload, separators=(',', ':')).encode('utf-8')))
+            os.replace(tmp, file)
+        except BaseException:
+            os.remove(tmp)
+            raise
@@ -0,0 +1,83 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class RetryPolicy(object):
+    '''Retries timed out, throttled (429) and server error (5xx) requests with jittered exponential backoff'''
+    def __init__(self, max_retries: int = 3, backoff_factor: float = 0.5, max_backoff: float = 30):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+
+    def __repr__(self):
+        return f'RetryPolicy(max_retries={self.max_retries}, backoff_factor={self.backoff_factor})'
+
+    def backoff(self, attempt: int, retry_after: str = None) -> float:
+        '''Seconds to wait before the next attempt, Retry-After takes precedence when sent'''
+        wait = parse_retry_after(retry_after)
+        if wait is None:
+            # full jitter
+            wait = random.uniform(0, self.backoff_factor * (2 ** attempt))
+        return min(wait, self.max_backoff)
+
+
+def parse_retry_after(retry_after: str = None) -> float:
+    '''Parses a Retry-After header given in seconds or as an HTTP date'''
+    if not retry_after:
+        return None
+    try:
+        return max(float(retry_after), 0)
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max((date - datetime.now(timezone.utc)).total_seconds(), 0)
+
+
+class CircuitBreaker(object):
+    '''Fails fast after failure_threshold consecutive failures to a host.
+    After reset_timeout seconds a single trial request is let through'''
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = 0
+        self.state = CircuitBreaker.CLOSED
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f'CircuitBreaker({self.state}, failures={self.failures})'
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self.state == CircuitBreaker.CLOSED:
+                return True
+            if self.state == CircuitBreaker.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = CircuitBreaker.HALF_OPEN
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.state = CircuitBreaker.CLOSED
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == CircuitBreaker.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = CircuitBreaker.OPEN
+                self.opened_at = time.monotonic()
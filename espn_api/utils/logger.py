@@ -21,6 +21,9 @@ class Logger(object):
         self.logging.setLevel(level)
 
     def log_request(self, endpoint: str, response: dict, params: dict = None, headers: dict = None):
+        # dumping large responses is expensive so skip it unless debug logging is on
+        if not self.logging.isEnabledFor(logging.DEBUG):
+            return
         log = f'ESPN API Request: url: {endpoint} params: {params} headers: {headers} \nESPN API Response: {json.dumps(response)}'
         self.logging.debug(log)
 
@@ -0,0 +1,148 @@
+import functools
+import importlib
+import threading
+import time
+from typing import Dict
+
+SPORTS = ['football', 'basketball', 'hockey', 'baseball', 'wbasketball']
+# methods timed on each sports League and on BaseLeague
+LEAGUE_PHASES = ['fetch_league', '_fetch_league', '_fetch_players', '_fetch_teams', '_resolve_opponents', '_fetch_draft',
+                 '_get_pro_schedule', '_get_all_pro_schedule', 'box_scores', 'free_agents', 'recent_activity']
+# model classes whose constructors are timed and counted
+MODEL_CLASSES = {
+    'team': ['Team'],
+    'player': ['Player'],
+    'box_player': ['BoxPlayer'],
+    'box_score': ['BoxScore', 'H2HPointsBoxScore', 'H2HCategoryBoxScore'],
+    'matchup': ['Matchup'],
+    'activity': ['Activity'],
+    'transaction': ['Transaction'],
+}
+MODEL_METHODS = {'Team': ['_fetch_roster', '_fetch_schedule']}
+# modules that call json_parsing through a module level import
+JSON_PARSING_MODULES = ['player', 'box_player', 'activity', 'team']
+
+
+class ConstructionProfiler(object):
+    '''Times each phase of turning ESPN json into League, Team and Player objects
+
+    Use as a context manager around League construction or any League method:
+
+        with ConstructionProfiler() as profiler:
+            league = League(league_id, year)
+        profiler.report()
+
+    Functions are only wrapped while the context is active. The wrappers are global,
+    so profile one league at a time.
+    '''
+    def __init__(self):
+        self.phases = {}
+        self.objects = {}
+        self._patches = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._started = 0
+        self.elapsed = 0
+
+    def __repr__(self):
+        return f'ConstructionProfiler({len(self.phases)} phases)'
+
+    def __enter__(self):
+        self._patch()
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.elapsed += time.perf_counter() - self._started
+        self._unpatch()
+        return False
+
+    def _record(self, name: str, elapsed: float, own: float) -> None:
+        with self._lock:
+            phase = self.phases.setdefault(name, {'calls': 0, 'total': 0, 'self': 0})
+            phase['calls'] += 1
+            phase['total'] += elapsed
+            phase['self'] += own
+
+    def _count_object(self, name: str) -> None:
+        with self._lock:
+            self.objects[name] = self.objects.get(name, 0) + 1
+
+    def _wrap(self, name: str, fn, cls: type = None):
+        profiler = self
+        object_name = name[:-len('.__init__')] if cls else None
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            # subclasses calling super().__init__ are only counted as their own class
+            if cls and type(args[0]) is cls:
+                profiler._count_object(object_name)
+            # time spent in nested profiled calls is subtracted to get the phases own time
+            stack = profiler._local.__dict__.setdefault('stack', [])
+            stack.append(0)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                child = stack.pop()
+                if stack:
+                    stack[-1] += elapsed
+                profiler._record(name, elapsed, elapsed - child)
+        return wrapper
+
+    def _patch_attribute(self, owner, attribute: str, name: str) -> None:
+        # only patch attributes defined on the owner itself so inherited methods are timed once
+        if attribute not in owner.__dict__:
+            return
+        original = owner.__dict__[attribute]
+        self._patches.append((owner, attribute, original))
+        setattr(owner, attribute, self._wrap(name, original, cls=owner if attribute == '__init__' else None))
+
+    def _patch(self) -> None:
+        from ..base_league import BaseLeague
+        for phase in LEAGUE_PHASES:
+            self._patch_attribute(BaseLeague, phase, f'BaseLeague.{phase}')
+
+        for sport in SPORTS:
+            league_module = importlib.import_module(f'espn_api.{sport}.league')
+            for phase in LEAGUE_PHASES:
+                self._patch_attribute(league_module.League, phase, f'{sport}.League.{phase}')
+
+            for module_name, classes in MODEL_CLASSES.items():
+                try:
+                    module = importlib.import_module(f'espn_api.{sport}.{module_name}')
+                except ImportError:
+                    continue
+                for class_name in classes:
+                    cls = getattr(module, class_name, None)
+                    if cls is None or cls.__module__ != module.__name__:
+                        continue
+                    self._patch_attribute(cls, '__init__', f'{sport}.{class_name}.__init__')
+                    for method in MODEL_METHODS.get(class_name, []):
+                        self._patch_attribute(cls, method, f'{sport}.{class_name}.{method}')
+
+            for module_name in JSON_PARSING_MODULES:
+                try:
+                    module = importlib.import_module(f'espn_api.{sport}.{module_name}')
+                except ImportError:
+                    continue
+                if 'json_parsing' in module.__dict__:
+                    self._patch_attribute(module, 'json_parsing', f'{sport}.{module_name}.json_parsing')
+
+    def _unpatch(self) -> None:
+        for (owner, attribute, original) in reversed(self._patches):
+            setattr(owner, attribute, original)
+        self._patches = []
+
+    def report(self) -> Dict:
+        '''Returns total time, objects created per model class and per phase calls, total and own time in seconds,
+        phases sorted by own time'''
+        with self._lock:
+            phases = {name: dict(phase) for name, phase in self.phases.items()}
+            objects = dict(self.objects)
+        return {
+            'elapsed': self.elapsed,
+            'objects': objects,
+            'phases': dict(sorted(phases.items(), key=lambda item: item[1]['self'], reverse=True)),
+        }
@@ -1,9 +1,24 @@
 from unittest import mock, TestCase
+import requests
 import requests_mock
 import io
-from espn_api.requests.espn_requests import EspnFantasyRequests
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+from espn_api.requests.espn_requests import EspnFantasyRequests, ESPNReplayMiss, ESPNInvalidLeague, ESPNCircuitOpen, ESPNUnknownError
+from espn_api.requests.retry import RetryPolicy, CircuitBreaker, parse_retry_after
+from espn_api.requests.rate_limit import RateLimiter, TokenBucket
+from espn_api.requests.metrics import MetricsCollector
+from espn_api.requests.endpoint_cache import EndpointCache
+from espn_api.requests.response_store import ResponseStore, REPLAY
+from espn_api.requests.period_cache import PeriodCache
 
 class EspnRequestsTest(TestCase):
+    def setUp(self):
+        # the default endpoint cache is shared by every instance, don't let one test's errors leak into the next
+        EspnFantasyRequests.endpoint_cache = EndpointCache()
+        EspnFantasyRequests.circuit_breakers.clear()
 
     @requests_mock.Mocker()
     @mock.patch('sys.stdout', new_callable=io.StringIO)
@@ -11,6 +26,298 @@ class EspnRequestsTest(TestCase):
         url_api_key = 'https://registerdisney.go.com/jgc/v5/client/ESPN-FANTASYLM-PROD/api-key?langPref=en-US'
         mock_request.post(url_api_key, status_code=400)
 
+    @requests_mock.Mocker()
+    def test_response_store_record_replay(self, mock_request):
+        with tempfile.TemporaryDirectory() as path:
+            request = EspnFantasyRequests(sport='nfl', league_id=1234, year=2019, store=ResponseStore(path))
+            mock_request.get(request.LEAGUE_ENDPOINT + '?view=mDraftDetail', status_code=200, json={'draftDetail': {'drafted': True}})
+            self.assertEqual(request.get_league_draft(), {'draftDetail': {'drafted': True}})
+
+            replay = EspnFantasyRequests(sport='nfl', league_id=1234, year=2019, store=ResponseStore(path, mode=REPLAY))
+            mock_request.reset_mock()
+            self.assertEqual(replay.get_league_draft(), {'draftDetail': {'drafted': True}})
+            self.assertEqual(mock_request.call_count, 0)
+
+            with self.assertRaises(ESPNReplayMiss):
+                replay.get_pro_schedule()
+
+            # responses recorded with credentials aren't served to other callers
+            private = EspnFantasyRequests(sport='nfl', league_id=1234, year=2019, cookies={'espn_s2': 'a', 'SWID': 'b'}, store=ResponseStore(path, mode=REPLAY))
+            with self.assertRaises(ESPNReplayMiss):
+                private.get_league_draft()
+            # a miss on both endpoints leaves the instance on the style it started with
+            self.assertEqual(private.endpoint_style, 'seasons')
+
+    @requests_mock.Mocker()
+    def test_response_store_replay_alternate_endpoint(self, mock_request):
+        with tempfile.TemporaryDirectory() as path:
+            # a pre 2018 league recorded after falling back from /leagueHistory/ to /seasons/
+            request = EspnFantasyRequests(sport='nfl', league_id=1234, year=2016, store=ResponseStore(path), endpoint_cache=EndpointCache())
+            mock_request.get(request.LEAGUE_ENDPOINT, status_code=401)
+            request.set_endpoint_style('seasons')
+            mock_request.get(request.LEAGUE_ENDPOINT + '?view=mDraftDetail', status_code=200, json={'draftDetail': {}})
+            request.set_endpoint_style('leagueHistory')
+            request.get_league_draft()
+
+            mock_request.reset_mock()
+            replay = EspnFantasyRequests(sport='nfl', league_id=1234, year=2016, store=ResponseStore(path, mode=REPLAY), endpoint_cache=EndpointCache())
+            self.assertEqual(replay.get_league_draft(), {'draftDetail': {}})
+            self.assertEqual(replay.endpoint_style, 'seasons')
+            self.assertEqual(mock_request.call_count, 0)
+
+    @requests_mock.Mocker()
+    def test_invalid_json(self, mock_request):
+        request = EspnFantasyRequests(sport='nfl', league_id=1234, year=2019)
+        mock_request.get(request.LEAGUE_ENDPOINT + '?view=mDraftDetail', status_code=200, text='<html>maintenance</html>')
+        with self.assertRaises(ESPNUnknownError):
+            request.get_league_draft()
+
+    @requests_mock.Mocker()
+    def test_endpoint_cache_skips_fallback(self, mock_request):
+        with tempfile.TemporaryDirectory() as path:
+            cache = EndpointCache(path + '/endpoints.json')
+            request = EspnFantasyRequests(sport='nfl', league_id=1234, year=2016, endpoint_cache=cache)
+            history_endpoint = request.LEAGUE_ENDPOINT
+            request.set_endpoint_style('seasons')
+            seasons_endpoint = request.LEAGUE_ENDPOINT
+            request.set_endpoint_style('leagueHistory')
+            mock_request.get(history_endpoint, status_code=401)
+            mock_request.get(seasons_endpoint + '?view=mDraftDetail', status_code=200, json={'draftDetail': {}})
+
+            self.assertEqual(request.get_league_draft(), {'draftDetail': {}})
+            self.assertEqual(mock_request.call_count, 2)
+
+            # a new instance sharing the persisted cache goes straight to the working endpoint
+            mock_request.reset_mock()
+            request = EspnFantasyRequests(sport='nfl', league_id=1234, year=2016, endpoint_cache=EndpointCache(path + '/endpoints.json'))
+            self.assertEqual(request.endpoint_style, 'seasons')
+            self.assertEqual(request.get_league_draft(), {'draftDetail': {}})
+            self.assertEqual(mock_request.call_count, 1)
+
+    @requests_mock.Mocker()
+    def test_endpoint_cache_invalid_league(self, mock_request):
+        cache = EndpointCache()
+        request = EspnFantasyRequests(sport='nfl', league_id=1234, year=2019, endpoint_cache=cache)
+        mock_request.get(request.LEAGUE_ENDPOINT, status_code=404)
+
+        with self.assertRaises(ESPNInvalidLeague):
+            request.get_league_draft()
+        with self.assertRaises(ESPNInvalidLeague):
+            EspnFantasyRequests(sport='nfl', league_id=1234, year=2019, endpoint_cache=cache).get_league_draft()
+        self.assertEqual(mock_request.call_count, 1)
+
+    @requests_mock.Mocker()
+    def test_alternate_endpoint_outage_not_cached(self, mock_request):
+        request = EspnFantasyRequests(sport='nfl', league_id=1234, year=2019, retry=RetryPolicy(max_retries=0))
+        seasons_endpoint = request.LEAGUE_ENDPOINT
+        request.set_endpoint_style('leagueHistory')
+        mock_request.get(request.LEAGUE_ENDPOINT, status_code=503)
+        request.set_endpoint_style('seasons')
+        mock_request.get(seasons_endpoint, status_code=401)
+
+        with self.assertRaises(ESPNUnknownError):
+            request.get_league_draft()
+        self.assertIsNone(request.endpoint_cache.get_error('nfl', 1234, 2019, None))
+
+    @requests_mock.Mocker()
+    def test_retry_server_error(self, mock_request):
+        request = EspnFantasyRequests(sport='nfl', league_id=1234, year=2019, retry=RetryPolicy(max_retries=2, backoff_factor=0))
+        mock_request.get(request.LEAGUE_ENDPOINT + '?view=mDraftDetail', [
+            {'status_code': 503},
+            {'status_code': 429, 'headers': {'Retry-After': '0'}},
+            {'status_code': 200, 'json': {'draftDetail': {}}},
+        ])
+
+        self.assertEqual(request.get_league_draft(), {'draftDetail': {}})
+        self.assertEqual(mock_request.call_count, 3)
+        self.assertEqual(mock_request.last_request.timeout, request.timeout)
+
+    @requests_mock.Mocker()
+    def test_circuit_breaker_opens(self, mock_request):
+        request = EspnFantasyRequests(sport='nfl', league_id=1234, year=2019, retry=RetryPolicy(max_retries=0))
+        mock_request.get(request.LEAGUE_ENDPOINT + '?view=mDraftDetail', status_code=500)
+
+        for _ in range(5):
+            with self.assertRaises(Exception):
+                request.get_league_draft()
+        with self.assertRaises(ESPNCircuitOpen):
+            request.get_league_draft()
+        self.assertEqual(mock_request.call_count, 5)
+
+    def test_circuit_breaker_half_open(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.assertTrue(breaker.allow_request())
+        self.assertFalse(breaker.allow_request())
+        breaker.record_success()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    @requests_mock.Mocker()
+    def test_circuit_breaker_trial_error(self, mock_request):
+        request = EspnFantasyRequests(sport='nfl', league_id=1234, year=2019, retry=RetryPolicy(max_retries=0))
+        breaker = request.get_circuit_breaker(urlparse(request.LEAGUE_ENDPOINT).netloc)
+        (breaker.reset_timeout, breaker.state) = (0, CircuitBreaker.OPEN)
+        mock_request.get(request.LEAGUE_ENDPOINT + '?view=mDraftDetail', exc=requests.exceptions.ChunkedEncodingError)
+
+        with self.assertRaises(requests.exceptions.ChunkedEncodingError):
+            request.get_league_draft()
+        # the failed trial reopens the breaker instead of leaving it half open
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.assertTrue(breaker.allow_request())
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after('120'), 120)
+        self.assertEqual(parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT'), 0)
+        self.assertIsNone(parse_retry_after(None))
+        self.assertEqual(RetryPolicy(max_backoff=10).backoff(0, '120'), 10)
+
+    def test_token_bucket(self):
+        bucket = TokenBucket(rate=0.001, capacity=2)
+        self.assertTrue(bucket.acquire(blocking=False))
+        self.assertTrue(bucket.acquire(blocking=False))
+        self.assertFalse(bucket.acquire(blocking=False))
+
+    def test_rate_limiter_hosts(self):
+        with tempfile.TemporaryDirectory() as path:
+            limiter = RateLimiter(rate=0.001, capacity=1, lock_dir=path)
+            self.assertTrue(limiter.acquire('lm-api-reads.fantasy.espn.com', blocking=False))
+            self.assertFalse(limiter.acquire('lm-api-reads.fantasy.espn.com', blocking=False))
+            # news has a separate budget
+            self.assertTrue(limiter.acquire('site.api.espn.com', blocking=False))
+
+            # another process sharing the lock dir sees the same bucket
+            other = RateLimiter(rate=0.001, capacity=1, lock_dir=path)
+            self.assertFalse(other.acquire('lm-api-reads.fantasy.espn.com', blocking=False))
+
+    @requests_mock.Mocker()
+    def test_rate_limiter_request(self, mock_request):
+        limiter = RateLimiter()
+        request = EspnFantasyRequests(sport='nfl', league_id=1234, year=2019, rate_limiter=limiter)
+        mock_request.get(request.LEAGUE_ENDPOINT + '?view=mDraftDetail', status_code=200, json={})
+        request.get_league_draft()
+        self.assertIn('lm-api-reads.fantasy.espn.com', limiter.buckets)
+        self.assertIsNone(EspnFantasyRequests.rate_limiter)
+
+    @requests_mock.Mocker()
+    def test_rate_limiter_news_endpoint(self, mock_request):
+        limiter = RateLimiter(rate=0.001, capacity=1, news_limits=(0.001, 1))
+        request = EspnFantasyRequests(sport='nfl', league_id=1234, year=2019, rate_limiter=limiter, news_endpoint='http://localhost:8080/news/')
+        mock_request.get(request.NEWS_ENDPOINT, status_code=200, json={})
+        request.news_get()
+        # news from a custom host still draws from the news budget
+        self.assertIn('localhost:8080-news', limiter.buckets)
+        self.assertTrue(limiter.acquire('localhost:8080', blocking=False))
+        self.assertFalse(limiter.acquire('localhost:8080', blocking=False, news=True))
+
+    @requests_mock.Mocker()
+    def test_single_flight(self, mock_request):
+        def slow_response(request, context):
+            time.sleep(0.2)
+            return {'settings': {}}
+
+        request = EspnFantasyRequests(sport='nfl', league_id=1234, year=2019)
+        mock_request.get(request.ENDPOINT + '?view=proTeamSchedules_wl', json=slow_response)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: request.get_pro_schedule(), range(4)))
+
+        self.assertEqual(results, [{'settings': {}}] * 4)
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual(len(EspnFantasyRequests.single_flight), 0)
+
+    @requests_mock.Mocker()
+    def test_request_metrics(self, mock_request):
+        recorded = []
+        metrics = MetricsCollector(callbacks=[recorded.append])
+        with tempfile.TemporaryDirectory() as path:
+            request = EspnFantasyRequests(sport='nfl', league_id=1234, year=2019, metrics=metrics, retry=RetryPolicy(backoff_factor=0))
+            mock_request.get(request.LEAGUE_ENDPOINT + '?view=mDraftDetail', [{'status_code': 503}, {'status_code': 200, 'json': {'draftDetail': {}}}])
+            request.get_league_draft()
+
+            self.assertEqual(len(recorded), 1)
+            self.assertEqual(recorded[0].view, 'mDraftDetail')
+            self.assertEqual(recorded[0].status, 200)
+            self.assertEqual(recorded[0].bytes, len('{"draftDetail": {}}'))
+            self.assertEqual(recorded[0].retries, 1)
+            self.assertEqual(recorded[0].cache, 'miss')
+
+            request.store = ResponseStore(path)
+            request.get_league_draft()
+            request.store.mode = REPLAY
+            request.get_league_draft()
+            self.assertEqual(recorded[-1].cache, 'hit')
+
+        summary = metrics.summary()
+        self.assertEqual(summary['mDraftDetail']['count'], 3)
+        self.assertEqual(summary['mDraftDetail']['hits'], 1)
+
+    @requests_mock.Mocker()
+    def test_period_cache(self, mock_request):
+        with tempfile.TemporaryDirectory() as path:
+            request = EspnFantasyRequests(sport='nfl', league_id=1234, year=2019, period_cache=PeriodCache(path))
+            request.live_scoring_period = 5
+            for week in (3, 5):
+                mock_request.get(f'{request.LEAGUE_ENDPOINT}?view=mPositionalRatings&scoringPeriodId={week}', status_code=200, json={'week': week})
+
+            for _ in range(2):
+                self.assertEqual(request.league_get(params={'view': 'mPositionalRatings', 'scoringPeriodId': 3}), {'week': 3})
+                self.assertEqual(request.league_get(params={'view': 'mPositionalRatings', 'scoringPeriodId': 5}), {'week': 5})
+            # the live week is refetched, the finished one isn't
+            self.assertEqual(mock_request.call_count, 3)
+
+            # finished weeks stay on disk for other processes
+            request = EspnFantasyRequests(sport='nfl', league_id=1234, year=2019, period_cache=PeriodCache(path))
+            request.live_scoring_period = 5
+            self.assertEqual(request.league_get(params={'view': 'mPositionalRatings', 'scoringPeriodId': 3}), {'week': 3})
+            self.assertEqual(mock_request.call_count, 3)
+
+            # other credentials don't share the cached response
+            request.cookies = {'espn_s2': 'other', 'SWID': 'other'}
+            request.league_get(params={'view': 'mPositionalRatings', 'scoringPeriodId': 3})
+            self.assertEqual(mock_request.call_count, 4)
+
+        self.assertFalse(PeriodCache.is_final({'view': ['mTeam', 'mMatchup'], 'scoringPeriodId': 1}, 5))
+
+    def test_period_cache_matchup_periods(self):
+        # hockey plays daily scoring periods inside weekly matchups
+        matchup_periods = {'1': [1, 2, 3, 4, 5, 6, 7], '2': [8, 9, 10, 11, 12, 13, 14]}
+        params = {'view': 'mMatchupScore', 'scoringPeriodId': 3}
+        self.assertFalse(PeriodCache.is_final(params, 5, matchup_periods))
+        self.assertTrue(PeriodCache.is_final(params, 8, matchup_periods))
+        self.assertFalse(PeriodCache.is_final(dict(params, scoringPeriodId=9), 10, matchup_periods))
+
+    def test_period_cache_expiry(self):
+        with tempfile.TemporaryDirectory() as path:
+            cache = PeriodCache(path, max_age=3600)
+            with mock.patch('time.time', return_value=1000):
+                cache.put('key', {'week': 3})
+                self.assertEqual(cache.get('key'), {'week': 3})
+            # stat corrections are picked up once the cached response is old enough
+            with mock.patch('time.time', return_value=1000 + 3601):
+                self.assertIsNone(cache.get('key'))
+                self.assertIsNone(PeriodCache(path, max_age=3600).get('key'))
+                self.assertEqual(PeriodCache(path, max_age=None).get('key'), {'week': 3})
+
+    @requests_mock.Mocker()
+    def test_base_endpoints(self, mock_request):
+        request = EspnFantasyRequests(sport='nhl', league_id=1234, year=2019, base_endpoint='http://mirror.local/games')
+        self.assertEqual(request.LEAGUE_ENDPOINT, 'http://mirror.local/games/fhl/seasons/2019/segments/0/leagues/1234')
+        self.assertTrue(request.NEWS_ENDPOINT.startswith('https://site.api.espn.com/'))
+
+        env = {'ESPN_FANTASY_BASE_ENDPOINT': 'http://proxy.local/v3/', 'ESPN_NEWS_BASE_ENDPOINT': 'http://proxy.local/news/'}
+        with mock.patch.dict('os.environ', env):
+            request = EspnFantasyRequests(sport='nhl', league_id=1234, year=2019)
+            self.assertEqual(request.ENDPOINT, 'http://proxy.local/v3/fhl/seasons/2019')
+            self.assertEqual(request.NEWS_ENDPOINT, 'http://proxy.local/news/fhl/news/players')
+            # an explicit endpoint wins over the environment
+            self.assertEqual(EspnFantasyRequests(sport='nhl', league_id=1234, year=2019, base_endpoint='http://mirror.local/').ENDPOINT,
+                             'http://mirror.local/fhl/seasons/2019')
+
+        mock_request.get(request.LEAGUE_ENDPOINT + '?view=mDraftDetail', status_code=200, json={'draftDetail': {}})
+        self.assertEqual(request.get_league_draft(), {'draftDetail': {}})
+        self.assertEqual(mock_request.last_request.hostname, 'proxy.local')
+
     # @requests_mock.Mocker()
     # @mock.patch('sys.stdout', new_callable=io.StringIO)
     # def test_authentication_api_fail(self, mock_request, mock_stdout):
@@ -0,0 +1,45 @@
+from unittest import TestCase
+
+from espn_api.football import BoxPlayer
+from espn_api.football.positional_ratings import PositionalRatings
+
+
+class BoxPlayerTest(TestCase):
+    def entry(self, week: int, slot: int, points: float) -> dict:
+        return {'lineupSlotId': slot, 'playerPoolEntry': {'player': {
+            'fullName': 'Test Player', 'id': 1, 'proTeamId': 2, 'defaultPositionId': 1, 'eligibleSlots': [0, 7],
+            'stats': [{'seasonId': 2024, 'scoringPeriodId': week, 'statSourceId': 0, 'statSplitTypeId': 1, 'appliedTotal': points, 'stats': {'3': 250}},
+                      {'seasonId': 2024, 'scoringPeriodId': week, 'statSourceId': 1, 'statSplitTypeId': 1, 'appliedTotal': 18, 'stats': {}}],
+        }}}
+
+    def test_overlays_share_player(self):
+        players = {}
+        ratings = PositionalRatings()
+        week1 = BoxPlayer(self.entry(1, 0, 21.456), {2: (12, 1600000000000)}, ratings, 1, 2024, players)
+        week2 = BoxPlayer(self.entry(2, 20, 9), {}, ratings, 2, 2024, players)
+
+        self.assertIs(week1.player, players[1])
+        self.assertIs(week2.player, week1.player)
+        self.assertEqual((week1.name, week1.position, week1.proTeam), ('Test Player', 'QB', 'BUF'))
+        self.assertEqual((week1.slot_position, week1.points, week1.projected_points), ('QB', 21.46, 18))
+        self.assertEqual(week1.points_breakdown, {'passingYards': 250})
+        self.assertEqual((week2.slot_position, week2.points, week2.on_bye_week), ('BE', 9, True))
+        self.assertFalse(week1.on_bye_week)
+        self.assertNotIn('name', vars(week1))
+
+    def test_overlay_stats(self):
+        players = {}
+        ratings = PositionalRatings()
+        week1 = BoxPlayer(self.entry(1, 0, 21), {}, ratings, 1, 2024, players)
+        data = self.entry(2, 0, 9)
+        data['playerPoolEntry']['player']['stats'].append(
+            {'seasonId': 2024, 'scoringPeriodId': 0, 'statSourceId': 0, 'statSplitTypeId': 0, 'appliedTotal': 30, 'appliedAverage': 15, 'stats': {}})
+        data['playerPoolEntry']['onTeamId'] = 4
+        week2 = BoxPlayer(data, {}, ratings, 2, 2024, players)
+
+        # period dependent fields come from each week's own payload
+        self.assertEqual(list(week1.stats), [1])
+        self.assertEqual(list(week2.stats), [2, 0])
+        self.assertEqual((week1.total_points, week2.total_points, week2.avg_points), (0, 30, 15))
+        self.assertEqual((week1.onTeamId, week2.onTeamId), ([], 4))
+        self.assertEqual(week2.player.stats, week1.stats)
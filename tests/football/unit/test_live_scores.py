@@ -0,0 +1,78 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest import TestCase, mock
+
+from espn_api.football.live_scores import LiveScoreWatcher, MatchupDelta, PlayerDelta
+
+
+def box_score(home_points: list, away_points: list, game_date: datetime) -> SimpleNamespace:
+    def lineup(points, first_id):
+        return [SimpleNamespace(name=f'Player {first_id + i}', playerId=first_id + i, proTeam='KC', points=value,
+                                on_bye_week=False, game_date=game_date) for (i, value) in enumerate(points)]
+    return SimpleNamespace(home_team=SimpleNamespace(team_id=1), away_team=SimpleNamespace(team_id=2),
+                           home_score=sum(home_points), away_score=sum(away_points),
+                           home_lineup=lineup(home_points, 10), away_lineup=lineup(away_points, 20))
+
+
+class LiveScoreWatcherTest(TestCase):
+    def test_adaptive_polling(self):
+        now = datetime.now()
+        league = mock.Mock(current_week=5)
+        league._get_pro_schedule.return_value = {12: (33, (now + timedelta(hours=1)).timestamp() * 1000)}
+        watcher = LiveScoreWatcher(league, min_interval=10, max_interval=60)
+
+        # first poll right away, then nothing until kickoff
+        self.assertEqual(watcher.next_poll(now), 0)
+        league.box_scores.return_value = [box_score([0, 0], [0], now + timedelta(hours=1))]
+        self.assertEqual(watcher.poll(), [])
+        self.assertEqual(watcher.next_poll(now), 3600)
+        self.assertEqual(watcher.next_poll(now + timedelta(hours=2)), 60)
+        # past its usual length the game is followed until a poll shows its points settled
+        self.assertEqual(watcher.next_poll(now + timedelta(hours=5)), 60)
+        # the grace period ran out after the last poll, so one more is made for its final points
+        self.assertEqual(watcher.next_poll(now + timedelta(hours=6)), 0)
+
+    def test_overtime(self):
+        now = datetime.now()
+        kickoff = now - timedelta(hours=3, minutes=10)
+        league = mock.Mock(current_week=5)
+        watcher = LiveScoreWatcher(league, min_interval=10, max_interval=60)
+
+        league.box_scores.return_value = [box_score([10], [3], kickoff)]
+        watcher.poll()
+        self.assertEqual(watcher.next_poll(now), 60)
+        # a score in overtime keeps the game live
+        league.box_scores.return_value = [box_score([16], [3], kickoff)]
+        self.assertEqual([type(event) for event in watcher.poll()], [PlayerDelta, MatchupDelta])
+        self.assertEqual(watcher.live_games(now), 1)
+        self.assertEqual(watcher.next_poll(now), 60)
+        # no more points since the previous poll, the game is over
+        watcher.poll()
+        self.assertEqual(watcher.live_games(now), 0)
+        self.assertIsNone(watcher.next_poll(now))
+
+    def test_deltas(self):
+        now = datetime.now()
+        league = mock.Mock(current_week=5)
+        players = []
+        watcher = LiveScoreWatcher(league, on_player=players.append)
+        league.box_scores.return_value = [box_score([1, 2], [3], now)]
+        watcher.poll()
+        league.box_scores.return_value = [box_score([1, 8.5], [3], now)]
+        events = watcher.poll()
+
+        self.assertEqual([type(event) for event in events], [PlayerDelta, MatchupDelta])
+        self.assertEqual((events[0].player.playerId, events[0].delta), (11, 6.5))
+        self.assertEqual((events[1].home_delta, events[1].away_delta), (6.5, 0))
+        self.assertEqual(players, events[:1])
+        self.assertEqual(watcher.requests, 2)
+        self.assertEqual(watcher.live_games(now), 1)
+
+        # once the games are over a last poll is made and iterating stops
+        league.box_scores.return_value = [box_score([1, 9], [3], now - timedelta(hours=6))]
+        with mock.patch.object(watcher, 'next_poll', side_effect=[0, None]):
+            self.assertEqual([event.delta for event in watcher if isinstance(event, PlayerDelta)], [0.5])
+        # the points were still changing, one more poll shows they settled
+        self.assertEqual(watcher.next_poll(), 0)
+        self.assertEqual(watcher.poll(), [])
+        self.assertIsNone(watcher.next_poll())
@@ -0,0 +1,32 @@
+from unittest import TestCase, mock
+
+from espn_api.football import League
+from espn_api.player_pool import PlayerPool
+
+
+class PlayerInfoTest(TestCase):
+    def setUp(self):
+        self.league = League(league_id=1, year=2024, fetch_league=False)
+        self.league.player_map = PlayerPool([{'id': 3139477, 'fullName': 'Patrick Mahomes II'},
+                                             {'id': 3918298, 'fullName': 'Josh Allen'}, {'id': 3052876, 'fullName': 'Josh Allen'}])
+        self.league._pro_schedule = {}
+        self.league.finalScoringPeriod = 18
+
+    def test_player_info_name(self):
+        card = {'players': [{'player': {'fullName': 'Patrick Mahomes II', 'id': 3139477, 'proTeamId': 12, 'defaultPositionId': 1,
+                                        'eligibleSlots': [0, 7], 'stats': []}}]}
+        with mock.patch.object(self.league.espn_request, 'get_player_card', return_value=card) as get_player_card:
+            # names are matched exactly unless asked otherwise
+            self.assertIsNone(self.league.player_info(name='Patrick Mahomes'))
+            get_player_card.assert_not_called()
+
+            self.assertEqual(self.league.player_info(name='Patrick Mahomes II').playerId, 3139477)
+            self.assertEqual(self.league.player_info(name='Patrick Mahomes', fuzzy=True).playerId, 3139477)
+
+    def test_player_info_shared_name(self):
+        def card(playerIds, max_scoring_period):
+            return {'players': [{'player': {'fullName': 'Josh Allen', 'id': player_id, 'proTeamId': 2, 'defaultPositionId': 1,
+                                            'eligibleSlots': [0, 7], 'stats': []}} for player_id in playerIds]}
+        with mock.patch.object(self.league.espn_request, 'get_player_card', side_effect=card):
+            # every player with the name is returned, not just the first one
+            self.assertEqual([player.playerId for player in self.league.player_info(name='Josh Allen')], [3918298, 3052876])
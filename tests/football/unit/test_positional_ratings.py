@@ -0,0 +1,35 @@
+from unittest import TestCase
+
+from espn_api.football import BoxPlayer
+from espn_api.football.positional_ratings import PositionalRatings
+
+
+class PositionalRatingsTest(TestCase):
+    def setUp(self):
+        self.data = {'positionAgainstOpponent': {'positionalRatings': {
+            '1': {'ratingsByOpponent': {'12': {'rank': 3, 'average': 14.2}, '33': {'rank': 30, 'average': 22.8}}},
+            '16': {'ratingsByOpponent': {'12': {'rank': 7, 'average': 8.1}}},
+        }}}
+
+    def test_positional_ratings(self):
+        ratings = PositionalRatings(self.data)
+
+        self.assertEqual(ratings.positions, [1, 16])
+        self.assertEqual(ratings.rank(1, 12), 3)
+        self.assertEqual(ratings.rank(1, 33), 30)
+        self.assertEqual(ratings.rank(16, 33), 0)
+        self.assertEqual(ratings.rank(2, 12), 0)
+        self.assertEqual(ratings.rank(1, 99), 0)
+        self.assertEqual(ratings.heat_map(), {'QB': {'KC': 3, 'BAL': 30}, 'D/ST': {'KC': 7}})
+        self.assertNotIn(2, PositionalRatings())
+
+    def test_box_player_rank(self):
+        ratings = PositionalRatings(self.data)
+        data = {'lineupSlotId': 0, 'playerPoolEntry': {'player': {
+            'fullName': 'Test Player', 'id': 1, 'proTeamId': 2, 'defaultPositionId': 1, 'eligibleSlots': [0, 7], 'stats': [],
+        }}}
+
+        player = BoxPlayer(data, {2: (12, 1600000000000)}, ratings, 1, 2024)
+
+        self.assertEqual(player.pro_opponent, 'KC')
+        self.assertEqual(player.pro_pos_rank, 3)
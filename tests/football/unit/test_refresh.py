@@ -0,0 +1,86 @@
+import copy
+from unittest import TestCase, mock
+
+from espn_api.football import League
+
+
+def team_data(team_id: int, player_ids: list) -> dict:
+    entries = [{'playerId': player_id, 'lineupSlotId': 2, 'playerPoolEntry': {'player': {
+        'fullName': f'Player {player_id}', 'id': player_id, 'proTeamId': 1, 'eligibleSlots': [2, 23], 'stats': [],
+    }}} for player_id in player_ids]
+    return {'id': team_id, 'abbrev': f'T{team_id}', 'name': f'Team {team_id}', 'divisionId': 0, 'playoffSeed': team_id,
+            'rankCalculatedFinal': 0, 'roster': {'entries': entries},
+            'record': {'overall': {'wins': 0, 'losses': 0, 'ties': 0, 'pointsFor': 0, 'pointsAgainst': 0,
+                                   'streakLength': 0, 'streakType': 'NONE'}}}
+
+
+class RefreshTest(TestCase):
+    def setUp(self):
+        self.data = {'seasonId': 2024, 'teams': [team_data(1, [10, 11]), team_data(2, [20]), team_data(3, [30])],
+                     'schedule': [
+                         {'winner': 'UNDECIDED', 'home': {'teamId': 1, 'totalPoints': 80}, 'away': {'teamId': 2, 'totalPoints': 70}},
+                         {'winner': 'UNDECIDED', 'home': {'teamId': 3, 'totalPoints': 60}},
+                     ]}
+        self.league = League(league_id=1, year=2024, fetch_league=False)
+        self.league.settings = mock.Mock(division_map={})
+        self.league._pro_schedule = {}
+        self.league._fetch_teams(self.data)
+
+    def test_incremental_refresh(self):
+        league = self.league
+        (team1, team2, team3) = league.teams
+        kept = team1.roster[0]
+        data = copy.deepcopy(self.data)
+        data['schedule'][0]['away']['totalPoints'] = 90
+        data['teams'][0]['roster']['entries'][0]['lineupSlotId'] = 20
+        data['teams'][1]['roster']['entries'].append(data['teams'][0]['roster']['entries'].pop())
+        data['teams'][1]['record']['overall']['wins'] = 1
+
+        changes = league._update_teams(data)
+
+        self.assertEqual(changes.teams, [team1, team2])
+        self.assertEqual([(change.team, change.old, change.new) for change in changes.scores], [(team2, 70, 90)])
+        self.assertEqual([(move.team, move.player.playerId, move.type, move.old_slot, move.new_slot) for move in changes.roster_moves],
+                         [(team1, 10, 'MOVED', 'RB', 'BE'), (team1, 11, 'DROPPED', 'RB', None), (team2, 11, 'ADDED', None, 'RB')])
+        self.assertEqual([(change.team, change.old_record, change.record) for change in changes.standings], [(team2, (0, 0, 0), (1, 0, 0))])
+        self.assertEqual(league.teams, [team1, team2, team3])
+        self.assertIs(team1.roster[0], kept)
+        self.assertEqual(kept.lineupSlot, 'BE')
+        self.assertEqual(team1.schedule, [team2])
+        self.assertEqual(team1.mov, [-10])
+        self.assertFalse(league._update_teams(data))
+
+    def test_refresh_players(self):
+        league = self.league
+        league._players[99] = 'free agent'
+        data = copy.deepcopy(self.data)
+        data['teams'][0]['roster']['entries'].pop()
+
+        league._update_teams(data)
+        # only players still on a roster are kept
+        self.assertEqual(sorted(league._players), [10, 20, 30])
+        self.assertIs(league._players[10], league.teams[0].roster[0])
+
+    def test_refresh_pro_schedule(self):
+        league = self.league
+        data = copy.deepcopy(self.data)
+        data['schedule'][0]['away']['totalPoints'] = 90
+
+        with mock.patch.object(league, '_get_all_pro_schedule', return_value={}) as get_all_pro_schedule:
+            # scores alone don't need the pro schedule
+            league._update_teams(data)
+            get_all_pro_schedule.assert_not_called()
+            data = copy.deepcopy(data)
+            data['teams'][0]['roster']['entries'][0]['lineupSlotId'] = 20
+            league._update_teams(data)
+            get_all_pro_schedule.assert_called_once()
+
+    def test_refresh_positional_ratings(self):
+        league = self.league
+        league.current_week = 2
+        league._positional_ratings = {1: 'week 1', 2: 'week 2'}
+        data = dict(self.data, status={'latestScoringPeriod': 2})
+
+        with mock.patch('espn_api.base_league.BaseLeague._fetch_league', return_value=data):
+            league.refresh(incremental=True)
+        self.assertEqual(league._positional_ratings, {1: 'week 1'})
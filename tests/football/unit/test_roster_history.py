@@ -0,0 +1,41 @@
+from types import SimpleNamespace
+from unittest import TestCase, mock
+
+from espn_api.football import League
+
+
+def roster_week(week: int, rosters: dict) -> dict:
+    def entry(player_id, slot, points):
+        return {'playerId': player_id, 'lineupSlotId': slot, 'playerPoolEntry': {'player': {
+            'fullName': f'Player {player_id} week {week}', 'id': player_id, 'proTeamId': 1, 'eligibleSlots': [2, 20],
+            'stats': [{'seasonId': 2024, 'scoringPeriodId': week, 'statSourceId': 0, 'statSplitTypeId': 1, 'appliedTotal': points}],
+        }}}
+    return {'teams': [{'id': team_id, 'roster': {'entries': [entry(*player) for player in players]}}
+                      for (team_id, players) in rosters.items()]}
+
+
+class RosterHistoryTest(TestCase):
+    def test_roster_history(self):
+        weeks = {
+            1: roster_week(1, {1: [(10, 2, 12.5), (11, 20, 3)], 2: [(20, 2, 7)]}),
+            2: roster_week(2, {1: [(10, 20, 4)], 2: [(20, 2, 9), (11, 2, 15.25)]}),
+        }
+        league = League(league_id=1, year=2024, fetch_league=False)
+        league.teams = [SimpleNamespace(team_id=1), SimpleNamespace(team_id=2)]
+        league.current_week = 2
+        league._pro_schedule = {}
+
+        with mock.patch.object(league.espn_request, 'league_get', side_effect=lambda params: weeks[params['scoringPeriodId']]) as league_get:
+            history = league.roster_history()
+
+        self.assertEqual(league_get.call_count, 2)
+        self.assertEqual(history.weeks, [1, 2])
+        self.assertEqual(history.slots, 2)
+        self.assertEqual(len(history.player_ids), 2 * 2 * 2)
+        self.assertEqual([(player.playerId, slot, points) for (player, slot, points) in history.lineup(1, 1)], [(10, 'RB', 12.5), (11, 'BE', 3)])
+        self.assertEqual(history.team_points(1, 1), 12.5)
+        self.assertEqual(history.team_points(1, 1, starters=False), 15.5)
+        self.assertEqual(history.player_weeks(11), {1: (1, 'BE', 3), 2: (2, 'RB', 15.25)})
+        # one Player per id, parsed from the latest week
+        self.assertIs(history.lineup(1, 1)[0][0], history.lineup(1, 2)[0][0])
+        self.assertEqual(history.players[10].name, 'Player 10 week 2')
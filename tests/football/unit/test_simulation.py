@@ -0,0 +1,83 @@
+from types import SimpleNamespace
+from unittest import TestCase
+
+from espn_api.football.simulation import simulate_season, _bye_count
+
+
+class MockTeam(object):
+    def __init__(self, team_id, division_id):
+        self.team_id = team_id
+        self.division_id = division_id
+        self.schedule = []
+        self.scores = []
+        self.outcomes = []
+
+
+class SimulationTest(TestCase):
+    def setUp(self):
+        # week 1: 1 v 2, 3 v 4 | week 2: 1 v 3, 2 v 4 | week 3 (remaining): 1 v 4, 2 v 3
+        self.teams = [MockTeam(i, 0) for i in range(1, 5)]
+        weeks = [
+            [(1, 2, 110, 100), (3, 4, 90, 80)],
+            [(1, 3, 120, 95), (2, 4, 105, 85)],
+            [(1, 4, 0, 0), (2, 3, 0, 0)],
+        ]
+        for week, games in enumerate(weeks):
+            for (home, away, home_score, away_score) in games:
+                home_team, away_team = self.teams[home - 1], self.teams[away - 1]
+                home_team.schedule.append(away_team)
+                away_team.schedule.append(home_team)
+                home_team.scores.append(home_score)
+                away_team.scores.append(away_score)
+                if week == 2:
+                    home_team.outcomes.append('U')
+                    away_team.outcomes.append('U')
+                else:
+                    home_team.outcomes.append('W' if home_score > away_score else 'L')
+                    away_team.outcomes.append('W' if away_score > home_score else 'L')
+
+        self.settings = SimpleNamespace(reg_season_count=3, playoff_team_count=2, playoff_seed_tie_rule='TOTAL_POINTS_SCORED', division_map={0: 'Division 1'})
+
+    def test_simulate_season(self):
+        results = simulate_season(self.teams, self.settings, n=500, seed=1)
+
+        # undefeated team 1 can finish no worse than second
+        self.assertEqual(results[self.teams[0]]['playoff_pct'], 100)
+        # winless team 4 can't catch both 2-0 / 2-1 teams
+        self.assertEqual(results[self.teams[3]]['playoff_pct'], 0)
+        self.assertAlmostEqual(sum(result['playoff_pct'] for result in results.values()), 200, places=0)
+        for result in results.values():
+            self.assertAlmostEqual(sum(result['seed_pct']), 100, places=0)
+            self.assertEqual(result['bye_pct'], 0)
+
+    def test_simulate_season_processes(self):
+        results = simulate_season(self.teams, self.settings, n=200, processes=2, seed=1)
+
+        self.assertEqual(results[self.teams[0]]['playoff_pct'], 100)
+        self.assertAlmostEqual(sum(result['playoff_pct'] for result in results.values()), 200, places=0)
+
+    def test_simulate_season_live(self):
+        # week 3 in progress, team 4 is up 150 - 10 on team 1 late in the game
+        self.teams[0].scores[2] = 10
+        self.teams[3].scores[2] = 150
+
+        results = simulate_season(self.teams, self.settings, n=500, seed=1, current_week=3, projections={1: 30, 4: 170})
+        # team 4 holds on, team 1 drops to 2-1 and loses the top seed on points for
+        self.assertEqual(results[self.teams[0]]['seed_pct'][0], 0)
+        self.assertEqual(results[self.teams[3]]['playoff_pct'], 0)
+        self.assertEqual(results[self.teams[0]]['playoff_pct'], 100)
+
+    def test_simulate_season_seed(self):
+        # every game a 100 - 100 tie, so seeding is decided by coin flips alone
+        for team in self.teams:
+            team.scores = [100, 100, 0]
+            team.outcomes = ['T', 'T', 'U']
+
+        results = simulate_season(self.teams, self.settings, n=50, seed=3)
+        self.assertEqual(simulate_season(self.teams, self.settings, n=50, seed=3), results)
+        self.assertNotEqual(simulate_season(self.teams, self.settings, n=50, seed=4), results)
+
+    def test_bye_count(self):
+        self.assertEqual(_bye_count(4), 0)
+        self.assertEqual(_bye_count(6), 2)
+        self.assertEqual(_bye_count(8), 0)
@@ -1,13 +1,27 @@
 import json
+import pickle
+import tempfile
+import time
+from datetime import datetime
 from unittest import TestCase, mock
 
 from espn_api.base_league import BaseLeague
+from espn_api.player_pool import PlayerPool, PlayerPoolCache
+from espn_api.pro_schedule import team_schedule
+from espn_api.hockey.constant import PRO_TEAM_MAP
+from espn_api.league_history import LeagueHistory
+from espn_api.draft_tracker import DraftTracker
 from espn_api.hockey import League as HockeyLeague, Team
 from espn_api.requests.espn_requests import EspnFantasyRequests
+from espn_api.requests.endpoint_cache import EndpointCache
+from espn_api.utils.profiler import ConstructionProfiler
 
 
 class BaseLeagueTest(TestCase):
     def setUp(self) -> None:
+        # the default endpoint cache is shared by every instance, start each test without cached errors or open breakers
+        EspnFantasyRequests.endpoint_cache = EndpointCache()
+        EspnFantasyRequests.circuit_breakers.clear()
         self.league_id = 1
         self.season = 2020
         self.league = BaseLeague(self.league_id, self.season, sport= 'nhl')
@@ -44,6 +58,51 @@ class BaseLeagueTest(TestCase):
         self.assertEqual(self.league.player_map[2555315], 'Charlie  Coyle')
         mock_get_players.assert_called_once()
 
+    def test_player_pool(self):
+        with open('tests/hockey/unit/data/player_data.json') as data:
+            player_data = json.loads(data.read())
+        pool = PlayerPool(player_data)
+
+        self.assertEqual(pool['charlie coyle'], 2555315)
+        self.assertEqual(pool.pro_team(2555315), 1)
+        self.assertEqual(pool.position(2555315), 1)
+        # both Sebastian Aho's can be found
+        self.assertEqual(len(pool.ids_by_name('Sebastian Aho')), 2)
+        self.assertNotIn('Not A Player', pool)
+
+        with tempfile.TemporaryDirectory() as path:
+            pool.save(path + '/players')
+            loaded = PlayerPool.load(path + '/players')
+            self.assertEqual(loaded[2555315], 'Charlie  Coyle')
+            self.assertEqual(loaded.ids_by_name('Sebastian Aho'), pool.ids_by_name('Sebastian Aho'))
+            self.assertEqual(pickle.loads(pickle.dumps(loaded)), pool)
+
+    def test_player_search(self):
+        with open('tests/hockey/unit/data/player_data.json') as data:
+            player_data = json.loads(data.read())
+        pool = PlayerPool(player_data)
+
+        self.assertEqual(pool.search('Charlie Coyle Jr.')[0], (2555315, 'Charlie  Coyle', 1.0))
+        self.assertEqual(pool.search_index.match('Charly Coyl'), 2555315)
+        self.assertEqual(pool.search('c mcdav', limit=1)[0][1], 'Connor  McDavid')
+        self.assertIsNone(pool.search_index.match('Not A Player'))
+
+        # a refreshed pool keeps the work done for unchanged players
+        refreshed = PlayerPool(player_data + [{'id': 1, 'fullName': 'Charlie Coyle II'}], previous=pool)
+        self.assertEqual([player_id for (player_id, _, score) in refreshed.search('charlie coyle') if score == 1], [2555315, 1])
+        self.assertIs(refreshed.search_index._entries[2555315], pool.search_index._entries[2555315])
+
+    @mock.patch.object(EspnFantasyRequests, 'get_pro_players')
+    def test_shared_player_pool(self, mock_get_players):
+        mock_get_players.return_value = [{'id': 1, 'fullName': 'Player One'}]
+        with mock.patch.object(BaseLeague, 'player_pools', PlayerPoolCache()):
+            self.league._fetch_players()
+            other = BaseLeague(2, self.season, sport='nhl')
+            other._fetch_players()
+
+        self.assertIs(other.player_map, self.league.player_map)
+        mock_get_players.assert_called_once()
+
     @mock.patch.object(EspnFantasyRequests, 'get_pro_schedule')
     def test_base_league_fetch_schedule(self, mock_get_pro_schedule):
         with open('tests/hockey/unit/data/pro_schedule.json') as data:
@@ -55,6 +114,49 @@ class BaseLeagueTest(TestCase):
         self.assertEqual(schedule[11], (13, 1613520000000))
         mock_get_pro_schedule.assert_called_once()
 
+    @mock.patch.object(EspnFantasyRequests, 'get_pro_schedule')
+    def test_base_league_pro_calendar(self, mock_get_pro_schedule):
+        with open('tests/hockey/unit/data/pro_schedule.json') as data:
+            mock_get_pro_schedule.return_value = json.loads(data.read())
+
+        self.assertEqual(self.league._get_pro_schedule(35)[11], (13, 1613520000000))
+        self.assertEqual(self.league._get_pro_schedule(35)[13], (11, 1613520000000))
+        pro_schedule = self.league._get_all_pro_schedule()
+        self.assertEqual(pro_schedule.game(11, 35)['homeProTeamId'], 13)
+        (start, end) = pro_schedule.game_times(35)
+        self.assertLessEqual(start, datetime.fromtimestamp(1613520000))
+        self.assertGreater(end, start)
+        self.assertIsNone(pro_schedule.game_times(1000))
+        # the season's schedule is only downloaded once
+        mock_get_pro_schedule.assert_called_once()
+
+        # refetching the league keeps the schedule until the scoring period changes
+        self.league.scoringPeriodId = self.league_data['scoringPeriodId']
+        next_period = dict(self.league_data, scoringPeriodId=self.league_data['scoringPeriodId'] + 1)
+        with mock.patch.object(EspnFantasyRequests, 'get_league', side_effect=[self.league_data, next_period]):
+            self.league._fetch_league()
+            self.assertIs(self.league._get_all_pro_schedule(), pro_schedule)
+            self.league._fetch_league()
+        self.league._get_all_pro_schedule()
+        self.assertEqual(mock_get_pro_schedule.call_count, 2)
+        self.league._get_all_pro_schedule(reload=True)
+        self.assertEqual(mock_get_pro_schedule.call_count, 3)
+
+    @mock.patch.object(EspnFantasyRequests, 'get_pro_schedule')
+    def test_base_league_team_schedule(self, mock_get_pro_schedule):
+        with open('tests/hockey/unit/data/pro_schedule.json') as data:
+            mock_get_pro_schedule.return_value = json.loads(data.read())
+
+        pro_schedule = self.league._get_all_pro_schedule()
+        schedule = team_schedule(pro_schedule, 11, PRO_TEAM_MAP)
+
+        self.assertEqual(schedule['35'], {'team': 'New York Rangers', 'date': datetime.fromtimestamp(1613520000)})
+        # every player on the team shares one schedule
+        self.assertIs(team_schedule(pro_schedule, 11, PRO_TEAM_MAP), schedule)
+        self.assertEqual(pickle.loads(pickle.dumps(schedule)), schedule)
+        with self.assertRaises(TypeError):
+            schedule['35'] = {}
+
     def test_base_league_standings(self):
         expected_standings = ["Team(Barkko Ruutu)",
                               "Team(2 Minutes for.. Rooping?)",
@@ -72,6 +174,36 @@ class BaseLeagueTest(TestCase):
         for i, actual_team in enumerate(actual_standings):
             self.assertEqual(repr(actual_team), expected_standings[i])
 
+    @mock.patch.object(EspnFantasyRequests, 'get_league_draft')
+    def test_draft_tracker(self, mock_league_draft):
+        self.league._fetch_teams(self.league_data, TeamClass= Team)
+        self.league.player_map = PlayerPool([{'id': 10, 'fullName': 'First Pick'}, {'id': 11, 'fullName': 'Second Pick'}])
+        picks = [{'overallPickNumber': 1, 'roundId': 1, 'roundPickNumber': 1, 'teamId': 1, 'playerId': 10},
+                 {'overallPickNumber': 2, 'roundId': 1, 'roundPickNumber': 2, 'teamId': 2, 'playerId': 11},
+                 {'overallPickNumber': 3, 'roundId': 1, 'roundPickNumber': 3, 'teamId': 3, 'playerId': None}]
+        mock_league_draft.side_effect = [
+            {'draftDetail': {'inProgress': True, 'picks': picks[:1]}},
+            {'draftDetail': {'inProgress': True, 'picks': picks}},
+            {'draftDetail': {'drafted': True, 'picks': picks[:2]}},
+        ]
+        on_pick = mock.Mock()
+        tracker = DraftTracker(self.league, interval=0, on_pick=on_pick)
+
+        self.assertEqual([(pick.overall_pick, pick.playerName, pick.team) for pick in tracker],
+                         [(1, 'First Pick', self.league.get_team_data(1)), (2, 'Second Pick', self.league.get_team_data(2))])
+        self.assertEqual(tracker.requests, 3)
+        self.assertEqual(on_pick.call_count, 2)
+        self.assertIsNone(tracker.next_poll())
+
+    def test_draft_tracker_late_start(self):
+        self.league.settings = mock.Mock(draft_date=(time.time() - 600) * 1000)
+        tracker = DraftTracker(self.league, interval=5, idle_interval=300)
+        tracker.last_poll = time.time()
+        # the draft should have started, poll often until it does
+        self.assertEqual(tracker.next_poll(), 5)
+        self.league.settings.draft_date = 0
+        self.assertEqual(tracker.next_poll(), 300)
+
 
 
 class HockeyLeagueTest(BaseLeagueTest):
@@ -135,6 +267,73 @@ class HockeyLeagueTest(BaseLeagueTest):
         mock_get_league_request.assert_called_once()
         mock_league_get_request.assert_called_once()
 
+    @mock.patch.object(EspnFantasyRequests, 'get_pro_players')
+    @mock.patch.object(EspnFantasyRequests, 'get_league_draft')
+    @mock.patch.object(EspnFantasyRequests, 'get_league')
+    def test_league_snapshot(self, mock_get_league_request, mock_league_draft, mock_get_players):
+        with open('tests/hockey/unit/data/player_data.json') as data:
+            mock_get_players.return_value = json.loads(data.read())
+        mock_league_draft.return_value = {}
+        mock_get_league_request.return_value = self.league_data
+        league = HockeyLeague(self.league_id, self.season)
+
+        restored = HockeyLeague.from_snapshot(league.to_snapshot())
+
+        self.assertEqual(repr(restored), repr(league))
+        self.assertEqual(restored.current_week, league.current_week)
+        self.assertEqual([repr(team) for team in restored.standings()], [repr(team) for team in league.standings()])
+        self.assertEqual(restored.teams[0].roster[0].name, league.teams[0].roster[0].name)
+        self.assertEqual(restored.player_map[2555315], 'Charlie  Coyle')
+        self.assertEqual(restored.espn_request.league_id, self.league_id)
+        mock_get_league_request.assert_called_once()
+
+    @mock.patch.object(EspnFantasyRequests, 'get_pro_players')
+    @mock.patch.object(EspnFantasyRequests, 'get_league_draft')
+    @mock.patch.object(EspnFantasyRequests, 'get_league')
+    def test_league_history(self, mock_get_league_request, mock_league_draft, mock_get_players):
+        mock_get_players.return_value = []
+        mock_league_draft.return_value = {}
+        mock_get_league_request.return_value = self.league_data
+        league = HockeyLeague(self.league_id, self.season)
+
+        history = LeagueHistory(league, max_workers=4)
+
+        self.assertEqual(history.years, [2013, 2014, 2015, 2016, 2017, 2018, 2019, 2020])
+        self.assertEqual(history.seasons[2015].year, 2015)
+        self.assertEqual(history.endpoint_styles[2015], 'leagueHistory')
+        self.assertEqual(history.endpoint_styles[2019], 'seasons')
+        self.assertEqual(mock_get_league_request.call_count, 8)
+
+        team = league.teams[0]
+        records = history.records()
+        self.assertEqual(records[team.team_id]['seasons'], 8)
+        self.assertEqual(records[team.team_id]['wins'], team.wins * 8)
+
+        h2h = history.head_to_head()
+        for team_id in h2h:
+            for opponent_id in h2h[team_id]:
+                self.assertEqual(h2h[team_id][opponent_id]['wins'], h2h[opponent_id][team_id]['losses'])
+
+    @mock.patch.object(EspnFantasyRequests, 'get_pro_players')
+    @mock.patch.object(EspnFantasyRequests, 'get_league_draft')
+    @mock.patch.object(EspnFantasyRequests, 'get_league')
+    def test_construction_profiler(self, mock_get_league_request, mock_league_draft, mock_get_players):
+        mock_get_players.return_value = []
+        mock_league_draft.return_value = {}
+        mock_get_league_request.return_value = self.league_data
+
+        with ConstructionProfiler() as profiler:
+            league = HockeyLeague(self.league_id, self.season)
+        report = profiler.report()
+
+        self.assertEqual(report['objects']['hockey.Team'], len(league.teams))
+        self.assertEqual(report['objects']['hockey.Player'], sum(len(team.roster) for team in league.teams))
+        self.assertEqual(report['phases']['hockey.League._resolve_opponents']['calls'], 1)
+        self.assertEqual(report['phases']['BaseLeague._fetch_teams']['calls'], 1)
+        self.assertLessEqual(report['phases']['hockey.Team.__init__']['self'], report['phases']['hockey.Team.__init__']['total'])
+        # wrappers are removed once the context exits
+        self.assertNotIn('__wrapped__', Team.__init__.__dict__)
+
     @mock.patch.object(EspnFantasyRequests, 'get_league_draft')
     @mock.patch.object(EspnFantasyRequests, 'get_league')
     def test_league_get_team_data(self, mock_get_league_request, mock_league_draft):